@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+"""Measure how long importing py_html modules takes, using CPython's -X importtime.
+
+Each import runs in a fresh interpreter so earlier imports cannot hide the cost
+of later ones. Run it from the repository root:
+
+    python benchmarks/import_time.py
+    python benchmarks/import_time.py py_html.macros.ui --runs 20
+"""
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# The imports the app pages actually do, plus the package itself
+DEFAULT_MODULES = [
+    "py_html",
+    "py_html.elements",
+    "py_html.css",
+    "py_html.macros",
+    "py_html.macros.layouts",
+]
+
+
+def import_time(module):
+    """Import module in a fresh interpreter; return (cumulative us, py_html modules imported)."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=ROOT, capture_output=True, text=True, check=True,
+    )
+
+    cumulative = {}
+    for line in result.stderr.splitlines():
+        # import time: self [us] | cumulative | imported package
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, total, name = line[len("import time:"):].split("|")
+        if total.strip().isdigit():
+            cumulative[name.strip()] = int(total)
+
+    imported = sorted(name for name in cumulative if name.split(".")[0] == "py_html")
+    return cumulative[module], imported
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Report import time of py_html modules.")
+    parser.add_argument("modules", nargs="*", default=DEFAULT_MODULES,
+                        help="modules to import (default: the ones the app uses)")
+    parser.add_argument("--runs", type=int, default=10,
+                        help="fresh interpreters per module; the median is reported")
+    parser.add_argument("--verbose", action="store_true",
+                        help="list which py_html modules each import pulled in")
+    return parser.parse_args()
+
+
+def main():
+    args = parse_args()
+
+    print(f"{'module':<28}{'median ms':>10}{'min ms':>10}{'modules':>9}")
+    for module in args.modules:
+        # Warm __pycache__ so the numbers measure imports, not compilation
+        import_time(module)
+        times = []
+        for _ in range(args.runs):
+            total, imported = import_time(module)
+            times.append(total)
+        print(f"{module:<28}{statistics.median(times) / 1000:>10.2f}{min(times) / 1000:>10.2f}{len(imported):>9}")
+        if args.verbose:
+            print("    " + ", ".join(imported))
+
+
+if __name__ == "__main__":
+    main()
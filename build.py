@@ -1,41 +1,173 @@
 #!/usr/bin/env python3
-import os
-from py_html.environment import init_environment, build_page
+import argparse
+import json
+import threading
+import time
+from py_html.environment import (BOOT_PACKAGES, CODEMIRROR_VENDOR, BuildManifest, prepare_output, bundle_modules,
+                                 required_pyodide_files, sync_pyodide, sync_vendor, write_bundle,
+                                 finish_environment, build_page)
+from py_html.compression import compress_output, remove_compressed
+from py_html.pipeline import BuildPipeline
 
-def detect_script_directories(scripts_folder="scripts"):
-    """Detect all directories in the scripts folder for dynamic module creation."""
-    directories = []
+# Pyodide packages to ship even though no module imports them statically:
+# the page loader installs the boot packages, add anything imported by computed name here.
+EXTRA_PYODIDE_PACKAGES = [*BOOT_PACKAGES]
+
+# Modules to bundle even though scripts/main.py does not import them statically
+# (the page's own imports are kept by bundle_modules): add modules imported by computed name here.
+BUNDLE_KEEP_MODULES = []
+
+# Folders polled for changes by --watch
+WATCHED_FOLDERS = ["scripts", "py_html", "py_dom", CODEMIRROR_VENDOR]
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Build the Sci-UX application into the output folder.")
+    parser.add_argument("--clean", action="store_true",
+                        help="discard the previous build and copy every file again")
+    parser.add_argument("--full-pyodide", action="store_true",
+                        help="ship every Pyodide package instead of only the ones the app imports")
+    parser.add_argument("--bytecode", action="store_true",
+                        help="precompile app modules to .pyc (needs the same Python version as Pyodide)")
+    parser.add_argument("--release", action="store_true",
+                        help="ship sourceless .pyc compiled with docstrings and asserts stripped")
+    parser.add_argument("--no-service-worker", action="store_true",
+                        help="do not precache the app in a service worker (useful while developing)")
+    parser.add_argument("--no-compress", action="store_true",
+                        help="skip writing .br/.gz copies of compressible assets (and delete existing ones)")
+    parser.add_argument("--no-tree-shake", action="store_true",
+                        help="bundle every module instead of only the ones reachable from scripts/main.py")
+    parser.add_argument("--jobs", type=int, default=None,
+                        help="worker processes for compiling and compressing (default: one per CPU, 1 = serial)")
+    parser.add_argument("--watch", action="store_true",
+                        help="serve the output, rebuild on changes and hot-swap edited modules in the page")
+    parser.add_argument("--host", default="127.0.0.1",
+                        help="address the --watch server binds to")
+    parser.add_argument("--port", type=int, default=8000,
+                        help="port the --watch server listens on")
+    return parser.parse_args()
+
+def build(args, live_reload=False):
+    """Run the full build and return the results of its steps."""
+    start = time.perf_counter()
+    print("Setting up environment...")
+    
+    manifest = prepare_output("output", incremental=not args.clean)
+    pipeline = BuildPipeline(workers=args.jobs)
+    results = pipeline.results
+    
+    pipeline.add("import graph", bundle_modules, "scripts", BUNDLE_KEEP_MODULES, not args.no_tree_shake)
+    pipeline.add("resolve packages", lambda: required_pyodide_files("scripts", EXTRA_PYODIDE_PACKAGES,
+                                                                    results["import graph"]),
+                 after=["import graph"])
+    
+    # Copying the runtime, the vendored assets and building the bundle are independent
+    pipeline.add("sync pyodide", lambda: sync_pyodide(manifest, *results["resolve packages"],
+                                                      prune=not args.full_pyodide),
+                 after=["resolve packages"])
+    pipeline.add("sync vendor", sync_vendor, manifest)
+    pipeline.add("bundle", lambda: write_bundle(manifest, "scripts", results["resolve packages"][0],
+                                                args.bytecode, args.release, pipeline.map,
+                                                results["import graph"]),
+                 after=["resolve packages"])
+    pipeline.add("manifest", lambda: finish_environment(manifest, results["resolve packages"][1]),
+                 after=["sync pyodide", "sync vendor", "bundle"])
     
-    if not os.path.exists(scripts_folder):
-        return directories
+    # Build single page application with navigation
+    pipeline.add("page", build_page, "output/index.html", "scripts",
+                 service_worker=not args.no_service_worker, live_reload=live_reload,
+                 after=["manifest"])
     
-    for root, dirs, files in os.walk(scripts_folder):
-        # Get relative path from scripts folder
-        rel_path = os.path.relpath(root, ".")
-        
-        # Skip the root scripts folder itself
-        if rel_path != scripts_folder:
-            # Convert to forward slashes for consistency and prepend with /
-            pyodide_path = "/" + rel_path.replace("\\", "/")
-            directories.append(pyodide_path)
+    # Precompressed siblings are picked up by serve.py; without them, old ones must go
+    if not args.no_compress:
+        pipeline.add("compress", compress_output, "output", pipeline.map, after=["page"])
+    else:
+        pipeline.add("compress", remove_compressed, "output", after=["page"])
     
-    return sorted(directories)
+    pipeline.run()
+    for step in ["manifest", "page", "compress"]:
+        if step in results:
+            print(results[step])
+    print(pipeline.summary())
+    print(f"Build complete in {time.perf_counter() - start:.2f}s!")
+    return results
 
-if __name__ == "__main__":
-    print("Setting up environment...")
+def rebuild_bundle(args, needed):
+    """Rebuild only the app bundle and the page that references it; return the bundle name.
+
+    Returns None without writing anything when the edit changed the Pyodide
+    files the app needs, since those are only copied by a full build.
+    """
+    modules = bundle_modules("scripts", BUNDLE_KEEP_MODULES, not args.no_tree_shake)
+    lock, now_needed = required_pyodide_files("scripts", EXTRA_PYODIDE_PACKAGES, modules)
+    if now_needed != needed:
+        return None
+    manifest = BuildManifest("output")
+    manifest.carry_over()
+    bundle_name = write_bundle(manifest, "scripts", lock, modules=modules)
+    finish_environment(manifest, needed)
+    build_page("output/index.html", "scripts", service_worker=False, live_reload=True)
+    # The server would otherwise keep sending the old compressed page
+    compress_output("output")
+    return bundle_name
+
+def watch(args):
+    """Build, serve the output and rebuild whenever a watched file changes."""
+    from py_html.server import LiveReload, make_server
+    from py_html.watch import snapshot, changed_files, hot_swappable_modules
     
-    # Detect directory structure
-    script_dirs = detect_script_directories("scripts")
-    print(f"Detected script directories: {script_dirs}")
+    # A caching service worker would hide rebuilds, and bytecode cannot be hot-swapped
+    args.no_service_worker = True
+    args.bytecode = args.release = False
     
-    # Setup the complete environment in output folder
-    env_result = init_environment("output", "scripts")
-    print(env_result)
+    results = build(args, live_reload=True)
+    needed = results["resolve packages"][1]
     
-    # Build single page application with navigation
-    print("Generating single page application...")
-    page_result = build_page("output/index.html", "scripts", script_dirs)
-    print(page_result)
+    live_reload = LiveReload()
+    server = make_server("output", args.host, args.port, live_reload=live_reload)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    print(f"Serving output at http://{args.host}:{server.server_port}/ - watching {', '.join(WATCHED_FOLDERS)} (Ctrl+C to stop)")
     
-    print("Build complete! Open output/index.html in a web browser.")
-    print("SPA Navigation: Use the navbar to navigate between pages without reloading!")
+    state = snapshot(WATCHED_FOLDERS)
+    try:
+        while True:
+            time.sleep(0.5)
+            current = snapshot(WATCHED_FOLDERS)
+            changed = changed_files(state, current)
+            if not changed:
+                continue
+            state = current
+            print(f"Changed: {', '.join(changed)}")
+            
+            start = time.perf_counter()
+            modules = hot_swappable_modules(changed, "scripts")
+            try:
+                bundle_name = None
+                if modules is not None:
+                    bundle_name = rebuild_bundle(args, needed)
+                    if bundle_name is None:
+                        print("The Pyodide packages the app needs changed, rebuilding everything")
+                if bundle_name is None:
+                    args.clean = False
+                    needed = build(args, live_reload=True)["resolve packages"][1]
+                    live_reload.publish("reload")
+                else:
+                    live_reload.publish("modules", json.dumps({"bundle": bundle_name, "modules": modules}))
+                    print(f"Rebuilt {bundle_name} in {time.perf_counter() - start:.2f}s, hot-swapping {', '.join(modules)}")
+            except Exception as e:
+                # Keep watching; the next save usually fixes it
+                print(f"Rebuild failed: {e}")
+    except KeyboardInterrupt:
+        print("\nStopping")
+    finally:
+        live_reload.close()
+        server.shutdown()
+        server.server_close()
+
+if __name__ == "__main__":
+    args = parse_args()
+    if args.watch:
+        watch(args)
+    else:
+        build(args)
+        print("Run 'python serve.py' and open http://127.0.0.1:8000 in a web browser.")
+        print("SPA Navigation: Use the navbar to navigate between pages without reloading!")
@@ -1,11 +0,0 @@
-"""
-PyHTML Macros - High-level macros for common HTML patterns.
-
-This module provides convenient macros for generating common HTML structures
-like forms, layouts, UI components, and more.
-"""
-
-from .components import *
-from .forms import *
-from .layouts import *
-from .ui import *
\ No newline at end of file
@@ -1,51 +0,0 @@
-"""Setup script for PyHTML library."""
-
-from setuptools import setup, find_packages
-
-with open("README.md", "r", encoding="utf-8") as fh:
-    long_description = fh.read()
-
-setup(
-    name="py-html",
-    version="1.0.0",
-    author="PyHTML Contributors",
-    author_email="",
-    description="A Python library for generating HTML with a fluent API",
-    long_description=long_description,
-    long_description_content_type="text/markdown",
-    url="",
-    packages=find_packages(),
-    classifiers=[
-        "Development Status :: 4 - Beta",
-        "Intended Audience :: Developers",
-        "Topic :: Software Development :: Libraries :: Python Modules",
-        "Topic :: Text Processing :: Markup :: HTML",
-        "License :: OSI Approved :: MIT License",
-        "Programming Language :: Python :: 3",
-        "Programming Language :: Python :: 3.6",
-        "Programming Language :: Python :: 3.7",
-        "Programming Language :: Python :: 3.8",
-        "Programming Language :: Python :: 3.9",
-        "Programming Language :: Python :: 3.10",
-        "Programming Language :: Python :: 3.11",
-    ],
-    python_requires=">=3.6",
-    install_requires=[
-        # No external dependencies
-    ],
-    extras_require={
-        "dev": [
-            "pytest>=6.0",
-            "pytest-cov>=2.0",
-            "black>=21.0",
-            "flake8>=3.8",
-            "mypy>=0.800",
-        ],
-    },
-    keywords="html generation web development templating",
-    project_urls={
-        "Bug Reports": "",
-        "Source": "",
-        "Documentation": "",
-    },
-)
\ No newline at end of file
@@ -1,5 +0,0 @@
-"""Custom CSS styles and frameworks for PyHTML."""
-
-from .framework import create_custom_framework
-
-__all__ = ["create_custom_framework"]
\ No newline at end of file
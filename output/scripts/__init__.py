@@ -1 +0,0 @@
-# Scripts package init file
\ No newline at end of file
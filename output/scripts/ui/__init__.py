@@ -1 +0,0 @@
-"""UI components and applets for sci_ux."""
\ No newline at end of file
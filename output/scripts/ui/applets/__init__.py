@@ -1 +0,0 @@
-"""Applets for sci_ux - reusable UI components."""
\ No newline at end of file
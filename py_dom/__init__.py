@@ -1,4 +1,11 @@
-"""DOM manipulation utilities for Pyodide/JavaScript integration."""
-from .events import EventHandler, events, on_click, on_submit, on_keydown, on_escape
+"""DOM manipulation utilities for Pyodide/JavaScript integration.
 
-__all__ = ['EventHandler', 'events', 'on_click', 'on_submit', 'on_keydown', 'on_escape']
\ No newline at end of file
+Only the event helpers are imported with the package; import everything else
+from its submodule (py_dom.refs, py_dom.router, ...) so the build bundles
+just the modules the app uses.
+"""
+from .events import (EventHandler, events, live_proxies, on_click, on_submit, on_keydown, on_escape,
+                     EventDelegator, delegator, delegate, undelegate)
+
+__all__ = ['EventHandler', 'events', 'live_proxies', 'on_click', 'on_submit', 'on_keydown', 'on_escape',
+           'EventDelegator', 'delegator', 'delegate', 'undelegate']
@@ -0,0 +1,93 @@
+"""Awaitable DOM primitives for code running on Pyodide's asyncio loop (webloop).
+
+Instead of guessing with setTimeout how long the DOM needs, a coroutine awaits
+what it actually depends on:
+
+    await mounted("#te-editor")      # the element is in the document
+    await animation_frame()           # the browser is about to paint
+    event = await next_event(button, "click")
+
+Each wait is a JS promise resolved by JavaScript itself, so no Python proxy is
+created per wait. Run coroutines that belong to a page with events.run(), so
+they are cancelled when the page is left; cancelling a wait aborts it in
+JavaScript too, disconnecting its observer or removing its listener.
+"""
+import js
+
+# Resolves with the element once target (a CSS selector or an element) is in
+# the document; a MutationObserver watches for it only while it is missing.
+# Every wait takes an AbortSignal and resolves with null once it is aborted.
+_mounted = js.Function.new('target', 'signal', '''
+    const find = () => typeof target === 'string'
+        ? document.querySelector(target)
+        : (target.isConnected ? target : null);
+    const found = find();
+    if (found) {
+        return Promise.resolve(found);
+    }
+    return new Promise((resolve) => {
+        const observer = new MutationObserver(() => {
+            const element = find();
+            if (element) {
+                observer.disconnect();
+                resolve(element);
+            }
+        });
+        observer.observe(document, {childList: true, subtree: true});
+        signal.addEventListener('abort', () => {
+            observer.disconnect();
+            resolve(null);
+        }, {once: true});
+    });
+''')
+
+_next_event = js.Function.new('target', 'type', 'signal', '''
+    return new Promise((resolve) => {
+        target.addEventListener(type, resolve, {once: true, signal});
+        signal.addEventListener('abort', () => resolve(null), {once: true});
+    });
+''')
+
+_animation_frame = js.Function.new('signal', '''
+    return new Promise((resolve) => {
+        const frame = requestAnimationFrame(resolve);
+        signal.addEventListener('abort', () => {
+            cancelAnimationFrame(frame);
+            resolve(null);
+        }, {once: true});
+    });
+''')
+
+
+async def _wait(wait, *args):
+    """Await wait(*args, signal) and abort it in JavaScript when the task is cancelled."""
+    controller = js.AbortController.new()
+    try:
+        return await wait(*args, controller.signal)
+    finally:
+        # Once the wait resolved this is a no-op
+        controller.abort()
+
+
+async def mounted(target):
+    """Wait until target is in the document and return the element.
+
+    target is a CSS selector ('#id', '.class') or an element, e.g. one that was
+    created but not inserted yet. Returns at once if it is already there.
+    """
+    return await _wait(_mounted, target)
+
+
+async def next_event(target, event_type):
+    """Wait for the next event_type event on target (an element, an element id, or window) and return it."""
+    if isinstance(target, str):
+        element = js.document.getElementById(target)
+        if element is None:
+            raise LookupError(f"No element with id {target!r}")
+        target = element
+    return await _wait(_next_event, target, event_type)
+
+
+async def animation_frame():
+    """Wait for the next animation frame and return its timestamp."""
+    return await _wait(_animation_frame)
@@ -0,0 +1,49 @@
+"""On-demand loading of external scripts and stylesheets."""
+import js
+
+# Promise factories written in JS so loading an asset needs no Python proxies
+_script_loader = js.Function.new('url', '''
+    return new Promise((resolve, reject) => {
+        const script = document.createElement('script');
+        script.src = url;
+        script.onload = () => resolve(url);
+        script.onerror = () => reject(new Error(`Failed to load ${url}`));
+        document.head.appendChild(script);
+    });
+''')
+
+_stylesheet_loader = js.Function.new('url', '''
+    return new Promise((resolve, reject) => {
+        const link = document.createElement('link');
+        link.rel = 'stylesheet';
+        link.href = url;
+        link.onload = () => resolve(url);
+        link.onerror = () => reject(new Error(`Failed to load ${url}`));
+        document.head.appendChild(link);
+    });
+''')
+
+# url -> JS promise, so each asset is requested once however many callers await it
+_loaded = {}
+
+
+def load_script(url):
+    """Append a <script> for url once and return an awaitable that resolves when it has run."""
+    if url not in _loaded:
+        _loaded[url] = _script_loader(url)
+    return _loaded[url]
+
+
+def load_stylesheet(url):
+    """Append a <link rel="stylesheet"> for url once and return an awaitable that resolves when it applies."""
+    if url not in _loaded:
+        _loaded[url] = _stylesheet_loader(url)
+    return _loaded[url]
+
+
+def asset_url(library, path):
+    """Resolve path against the base URL the build registered for library in window.sciUxAssets."""
+    base = ""
+    if hasattr(js.window, 'sciUxAssets') and hasattr(js.window.sciUxAssets, library):
+        base = getattr(js.window.sciUxAssets, library)
+    return base + path
@@ -0,0 +1,101 @@
+"""Imports app modules straight from the app bundle held in memory.
+
+The page hands the downloaded bundle to install() instead of unpacking it into
+the Emscripten filesystem. A finder at the front of sys.meta_path looks modules
+up in the index the build writes into the bundle, so an import is a dict lookup
+rather than a stat of every sys.path entry. This module only uses the standard
+library, because the page runs it before anything else is importable.
+"""
+import importlib.abc
+import importlib.util
+import io
+import json
+import marshal
+import sys
+import zipfile
+
+# Written by py_html.environment.build_bundle: {module name: [archive path, is package]}
+INDEX_NAME = "__modules__.json"
+
+# Flags, source mtime and source size in front of the marshalled code of a .pyc
+_PYC_HEADER_SIZE = 16
+
+
+class BundleFinder(importlib.abc.MetaPathFinder, importlib.abc.InspectLoader):
+    """Finds and loads the modules listed in a bundle's index.
+
+    Module files are reported under their path in the archive ('/scripts/home.py'),
+    the same place they had when the bundle was unpacked, so tracebacks and
+    py_dom.hot keep working.
+    """
+
+    def __init__(self, data):
+        self.load(data)
+
+    def load(self, data):
+        """Switch to another version of the bundle; modules imported from now on come from it."""
+        self.archive = zipfile.ZipFile(io.BytesIO(data))
+        self.names = set(self.archive.namelist())
+        self.index = json.loads(self.archive.read(INDEX_NAME))
+
+    def find_spec(self, fullname, path=None, target=None):
+        entry = self.index.get(fullname)
+        if entry is None:
+            return None
+        arcname, is_package = entry
+        spec = importlib.util.spec_from_loader(fullname, self, origin="/" + arcname, is_package=is_package)
+        spec.has_location = True
+        if is_package:
+            spec.submodule_search_locations = ["/" + arcname.rsplit("/", 1)[0]]
+        return spec
+
+    def is_package(self, fullname):
+        return self._entry(fullname)[1]
+
+    def get_source(self, fullname):
+        arcname = self._entry(fullname)[0]
+        if arcname.endswith(".pyc"):
+            # Release bundles ship bytecode only
+            return None
+        return importlib.util.decode_source(self.archive.read(arcname))
+
+    def get_code(self, fullname):
+        arcname = self._entry(fullname)[0]
+        if not arcname.endswith(".pyc"):
+            # Bundles built with --bytecode carry a precompiled copy next to the source
+            cached = importlib.util.cache_from_source(arcname)
+            if cached not in self.names:
+                return compile(self.get_source(fullname), "/" + arcname, "exec", dont_inherit=True)
+            arcname = cached
+        return marshal.loads(self.archive.read(arcname)[_PYC_HEADER_SIZE:])
+
+    def _entry(self, fullname):
+        try:
+            return self.index[fullname]
+        except KeyError:
+            raise ImportError(f"{fullname!r} is not in the app bundle", name=fullname) from None
+
+
+def install(data) -> BundleFinder:
+    """Import app modules from the bundle in data (bytes, or a JS Uint8Array).
+
+    If a finder is already installed it is switched to the new bundle, which is
+    how the watch mode swaps in a rebuilt one before reloading modules.
+    """
+    if hasattr(data, 'to_bytes'):
+        data = data.to_bytes()
+    for finder in sys.meta_path:
+        if isinstance(finder, BundleFinder):
+            finder.load(data)
+            return finder
+    finder = BundleFinder(data)
+    sys.meta_path.insert(0, finder)
+    return finder
+
+
+def read(name):
+    """Return the contents of a file in the installed bundle, or None if it has none."""
+    for finder in sys.meta_path:
+        if isinstance(finder, BundleFinder):
+            return finder.archive.read(name) if name in finder.names else None
+    return None
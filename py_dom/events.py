@@ -1,54 +1,234 @@
 """Event handling utilities for Pyodide/JavaScript integration."""
+import asyncio
 import js
 from pyodide.ffi import create_proxy
 
+# Proxies created through counted_proxy that have not been destroyed yet, by
+# every py_dom module and app component. Mirrored to window.sciUxLiveProxies
+# so it can be watched from the browser console.
+_live_proxies = 0
+
+
+def live_proxies() -> int:
+    """Return how many callback proxies are alive; it should stay flat across navigations."""
+    return _live_proxies
+
+
+def _count(change):
+    global _live_proxies
+    _live_proxies += change
+    js.window.sciUxLiveProxies = _live_proxies
+
+
+def counted_proxy(func):
+    """Return create_proxy(func), counted by live_proxies until it is passed to destroy_proxy."""
+    proxy = create_proxy(func)
+    _count(1)
+    return proxy
+
+
+def destroy_proxy(proxy):
+    """Destroy a proxy made by counted_proxy."""
+    proxy.destroy()
+    _count(-1)
+
+
 class EventHandler:
-    """Utility class for managing event handlers with automatic proxy creation."""
+    """A group of event listeners (timeouts, tasks) that lives as long as a page or component.
+
+    Each listener gets its own proxy, also when several share an element and
+    event type. clear_all() removes every listener and destroys its proxy,
+    cancels pending timeouts and tasks, and clears the groups made with scope(). The
+    global `events` group is cleared by py_dom.router on every navigation.
+    """
     
     def __init__(self):
-        self._handlers = {}
+        self._handlers = {}  # key -> [(target, event type, proxy)]
+        self._timeouts = {}  # timer id -> proxy
+        self._tasks = set()
+        self._scopes = []
+        self._parent = None
     
     def add_listener(self, element_id, event_type, handler):
         """Add event listener to element with automatic proxy creation."""
         element = js.document.getElementById(element_id)
         if element:
-            proxy = create_proxy(handler)
-            element.addEventListener(event_type, proxy)
-            # Store proxy to prevent garbage collection
-            self._handlers[f"{element_id}_{event_type}"] = proxy
-            return proxy
+            return self._listen(f"{element_id}_{event_type}", element, event_type, handler)
         return None
     
     def add_document_listener(self, event_type, handler):
         """Add document-level event listener with automatic proxy creation."""
-        proxy = create_proxy(handler)
-        js.document.addEventListener(event_type, proxy)
-        self._handlers[f"document_{event_type}"] = proxy
-        return proxy
+        return self._listen(f"document_{event_type}", js.document, event_type, handler)
+    
+    def add_target_listener(self, target, event_type, handler):
+        """Add event listener to an element (or window) that is already at hand."""
+        target_id = getattr(target, 'id', None) or 'target'
+        return self._listen(f"{target_id}_{event_type}", target, event_type, handler)
     
     def remove_listener(self, element_id, event_type):
-        """Remove event listener and clean up proxy."""
-        key = f"{element_id}_{event_type}"
-        if key in self._handlers:
-            element = js.document.getElementById(element_id)
-            if element:
-                element.removeEventListener(event_type, self._handlers[key])
-            del self._handlers[key]
+        """Remove the element's listeners for event_type and destroy their proxies."""
+        self._remove(f"{element_id}_{event_type}")
     
     def remove_document_listener(self, event_type):
-        """Remove document-level event listener and clean up proxy."""
-        key = f"document_{event_type}"
-        if key in self._handlers:
-            js.document.removeEventListener(event_type, self._handlers[key])
-            del self._handlers[key]
+        """Remove the document-level listeners for event_type and destroy their proxies."""
+        self._remove(f"document_{event_type}")
+    
+    def set_timeout(self, handler, delay=0):
+        """Call handler() once after delay milliseconds, unless the group is cleared first."""
+        timer_id = None
+        
+        def run():
+            destroy_proxy(self._timeouts.pop(timer_id))
+            handler()
+        
+        proxy = counted_proxy(run)
+        timer_id = js.setTimeout(proxy, delay)
+        self._timeouts[timer_id] = proxy
+        return timer_id
+    
+    def run(self, coroutine):
+        """Run coroutine as a task that is cancelled if the group is cleared first."""
+        task = asyncio.ensure_future(coroutine)
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+        return task
+    
+    def scope(self):
+        """Return a new group that is cleared along with this one, e.g. for a modal on a page."""
+        group = EventHandler()
+        group._parent = self
+        self._scopes.append(group)
+        return group
     
     def clear_all(self):
-        """Remove all event listeners and clean up proxies."""
-        self._handlers.clear()
+        """Remove all event listeners, cancel timeouts and tasks, and destroy their proxies."""
+        for key in list(self._handlers):
+            self._remove(key)
+        for timer_id, proxy in self._timeouts.items():
+            js.clearTimeout(timer_id)
+            destroy_proxy(proxy)
+        self._timeouts.clear()
+        for task in list(self._tasks):
+            task.cancel()
+        self._tasks.clear()
+        for group in list(self._scopes):
+            group.clear_all()
+        if self._parent is not None and self in self._parent._scopes:
+            # A cleared scope is done; a new one is made for the next component
+            self._parent._scopes.remove(self)
+    
+    def _listen(self, key, target, event_type, handler):
+        proxy = counted_proxy(handler)
+        target.addEventListener(event_type, proxy)
+        self._handlers.setdefault(key, []).append((target, event_type, proxy))
+        return proxy
+    
+    def _remove(self, key):
+        for target, event_type, proxy in self._handlers.pop(key, []):
+            target.removeEventListener(event_type, proxy)
+            destroy_proxy(proxy)
 
-# Global event handler instance
+# Global event handler instance: the listeners of the current page
 events = EventHandler()
 
+# Builds the single listener of one event type: it matches the event target
+# against every registered selector with closest() and only calls into Python
+# when something matched, innermost element first
+_delegating_listener = js.Function.new('selectors', 'dispatch', '''
+    return (event) => {
+        let target = event.target;
+        if (target && !(target instanceof Element)) {
+            target = target.parentElement;
+        }
+        if (!target) {
+            return;
+        }
+        const matches = [];
+        for (const selector of selectors) {
+            const element = target.closest(selector);
+            if (element) {
+                matches.push([selector, element]);
+            }
+        }
+        if (matches.length) {
+            // Every match is an ancestor of the target, so containment orders them
+            matches.sort((a, b) => a[1] === b[1] ? 0 : (a[1].contains(b[1]) ? 1 : -1));
+            dispatch(event, matches);
+        }
+    };
+''')
+
+
+class EventDelegator:
+    """Delegated events: one document-level listener per event type, whatever the DOM size.
+
+    Handlers are registered per event type and CSS selector, and called as
+    handler(event, element) with the closest element matching the selector, for
+    elements that exist now or are rendered later. Registering again for the
+    same event type and selector replaces the handler, so pages can register
+    on every render. event.stopPropagation() in a handler stops handlers of
+    outer matching elements.
+    """
+
+    def __init__(self):
+        self._handlers = {}   # event type -> {selector: handler}
+        self._selectors = {}  # event type -> JS array of selectors the listener matches
+        self._listeners = {}  # event type -> JS listener
+        self._dispatch_proxy = None
+
+    def on(self, event_type, selector, handler):
+        """Call handler(event, element) for event_type events inside elements matching selector."""
+        handlers = self._handlers.setdefault(event_type, {})
+        if selector not in handlers:
+            if event_type not in self._listeners:
+                self._listen(event_type)
+            self._selectors[event_type].push(selector)
+        handlers[selector] = handler
+        return handler
+
+    def off(self, event_type, selector):
+        """Remove the handler for event_type and selector; the listener goes with the last one."""
+        handlers = self._handlers.get(event_type, {})
+        if handlers.pop(selector, None) is None:
+            return
+        selectors = self._selectors[event_type]
+        selectors.splice(selectors.indexOf(selector), 1)
+        if not handlers:
+            js.document.removeEventListener(event_type, self._listeners.pop(event_type))
+            del self._handlers[event_type], self._selectors[event_type]
+
+    def clear_all(self):
+        """Remove every delegated handler and listener."""
+        for event_type, listener in self._listeners.items():
+            js.document.removeEventListener(event_type, listener)
+        self._handlers.clear()
+        self._selectors.clear()
+        self._listeners.clear()
+
+    def _listen(self, event_type):
+        if self._dispatch_proxy is None:
+            # One proxy serves every event type
+            self._dispatch_proxy = counted_proxy(self._dispatch)
+        selectors = js.Array.new()
+        listener = _delegating_listener(selectors, self._dispatch_proxy)
+        js.document.addEventListener(event_type, listener)
+        self._selectors[event_type] = selectors
+        self._listeners[event_type] = listener
+
+    def _dispatch(self, event, matches):
+        handlers = self._handlers.get(event.type, {})
+        for selector, element in matches:
+            handler = handlers.get(selector)
+            if handler is None:
+                continue
+            handler(event, element)
+            if event.cancelBubble:
+                break
+
+
+# Global delegated event registry
+delegator = EventDelegator()
+
 # Convenience functions for common patterns
 def on_click(element_id, handler):
     """Add click event listener to element."""
@@ -70,4 +250,12 @@ def on_escape(handler):
     def escape_handler(event):
         if event.key == 'Escape':
             handler(event)
-    return events.add_document_listener('keydown', escape_handler)
\ No newline at end of file
+    return events.add_document_listener('keydown', escape_handler)
+
+def delegate(event_type, selector, handler):
+    """Handle event_type for every element matching selector, present or future (see EventDelegator)."""
+    return delegator.on(event_type, selector, handler)
+
+def undelegate(event_type, selector):
+    """Remove a handler registered with delegate()."""
+    delegator.off(event_type, selector)
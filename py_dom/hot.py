@@ -0,0 +1,82 @@
+"""Hot module replacement for the watch mode of build.py."""
+import importlib
+import runpy
+import sys
+from types import ModuleType
+
+# Where app modules say they come from (see py_dom.bundle)
+APP_FOLDERS = ('/scripts/', '/py_html/', '/py_dom/')
+
+_callbacks = []
+
+# Globals of the entry point as run by run_main; runpy puts the loader's own
+# __main__ back afterwards, so sys.modules['__main__'] is not the entry point
+main_globals = None
+
+
+def on_reload(callback):
+    """Register callback to run after modules were hot-swapped, e.g. to re-render the page."""
+    _callbacks.append(callback)
+    return callback
+
+
+def _is_app_module(module) -> bool:
+    path = getattr(module, '__file__', None)
+    return isinstance(path, str) and path.startswith(APP_FOLDERS) and module.__name__ != __name__
+
+
+def run_main(module_name):
+    """Run the entry point module as __main__ and keep its globals (done by the page loader)."""
+    global main_globals
+    main_globals = runpy.run_module(module_name, run_name='__main__', alter_sys=True)
+    return main_globals
+
+
+def _references(namespace, names) -> bool:
+    """True if namespace holds a module, class or function that comes from one of names."""
+    for value in list(namespace.values()):
+        try:
+            name = value.__name__ if isinstance(value, ModuleType) else getattr(value, '__module__', None)
+        except Exception:
+            continue
+        if isinstance(name, str) and name in names:
+            return True
+    return False
+
+
+def reload_modules(names):
+    """Reload the changed modules that are imported, plus every app module that uses them.
+
+    Modules that were never imported pick up their new source on first import.
+    The entry point (__main__) is never reloaded, so RuntimeError is raised if
+    it uses one of them and the page has to be reloaded instead. Callbacks
+    registered with on_reload run afterwards.
+    """
+    importlib.invalidate_caches()
+    stale = {name for name in names if name in sys.modules}
+
+    # Modules that imported names from a stale module hold the old objects
+    grew = True
+    while grew:
+        grew = False
+        for name, module in list(sys.modules.items()):
+            if name not in stale and name != '__main__' and _is_app_module(module) \
+                    and _references(vars(module), stale):
+                stale.add(name)
+                grew = True
+
+    if main_globals is not None and _references(main_globals, stale):
+        raise RuntimeError(f"The entry point uses {sorted(stale)}; reload the page instead")
+
+    # sys.modules lists a module before the modules it imports, so reverse it
+    reloaded = []
+    for name in reversed(list(sys.modules)):
+        if name not in stale:
+            continue
+        importlib.reload(sys.modules[name])
+        reloaded.append(name)
+
+    print(f"Hot-swapped {', '.join(reloaded) or 'nothing'}")
+    for callback in _callbacks:
+        callback()
+    return reloaded
@@ -0,0 +1,139 @@
+"""Mount and unmount hooks for components, driven by one shared MutationObserver.
+
+on_mount(selector, callback) calls callback(element) once for every element
+matching selector that enters the document, including elements that are
+already there when the selector is first watched; on_unmount(selector,
+callback) calls it once the element has left. A component sets itself up in
+its mount hook and releases what it holds (editor instances, bindings,
+proxies) in its unmount hook, instead of relying on setup timing and
+re-initialisation checks.
+
+The observer, and the bookkeeping of which elements are mounted, live in
+JavaScript; Python is only called for elements that match a hook.
+"""
+import js
+
+from .events import counted_proxy
+
+# Tracks the mounted elements of every watched selector and reports changes
+# through dispatch('mount' | 'unmount', selector, element)
+_watcher = js.Function.new('dispatch', '''
+    const watched = new Map();  // selector -> Set of mounted elements
+    const scan = (root, selector, elements) => {
+        const found = root.matches && root.matches(selector) ? [root] : [];
+        if (root.querySelectorAll) {
+            found.push(...root.querySelectorAll(selector));
+        }
+        for (const element of found) {
+            if (!elements.has(element)) {
+                elements.add(element);
+                dispatch('mount', selector, element);
+            }
+        }
+    };
+    const sweep = () => {
+        for (const [selector, elements] of watched) {
+            for (const element of elements) {
+                if (!element.isConnected) {
+                    elements.delete(element);
+                    dispatch('unmount', selector, element);
+                }
+            }
+        }
+    };
+    const observer = new MutationObserver((records) => {
+        if (records.some(record => record.removedNodes.length)) {
+            sweep();
+        }
+        for (const record of records) {
+            for (const node of record.addedNodes) {
+                if (node.nodeType === Node.ELEMENT_NODE && node.isConnected) {
+                    for (const [selector, elements] of watched) {
+                        scan(node, selector, elements);
+                    }
+                }
+            }
+        }
+    });
+    return {
+        watch(selector) {
+            if (watched.has(selector)) {
+                return;
+            }
+            const elements = new Set();
+            watched.set(selector, elements);
+            if (watched.size === 1) {
+                observer.observe(document, {childList: true, subtree: true});
+            }
+            scan(document.documentElement, selector, elements);
+        },
+        unwatch(selector) {
+            watched.delete(selector);
+            if (!watched.size) {
+                observer.disconnect();
+            }
+        },
+    };
+''')
+
+
+class Lifecycle:
+    """Mount and unmount hooks per CSS selector (see the module docstring).
+
+    A selector has at most one hook of each kind; registering again replaces
+    it, so a page module can register its hooks every time it is imported.
+    """
+
+    def __init__(self):
+        self._mount = {}    # selector -> callback(element)
+        self._unmount = {}  # selector -> callback(element)
+        self._watcher = None
+        self._dispatch_proxy = None
+
+    def on_mount(self, selector, callback):
+        """Call callback(element) when an element matching selector enters the document."""
+        self._mount[selector] = callback
+        self._watch(selector)
+        return callback
+
+    def on_unmount(self, selector, callback):
+        """Call callback(element) when an element matching selector has left the document."""
+        self._unmount[selector] = callback
+        self._watch(selector)
+        return callback
+
+    def off(self, selector):
+        """Remove both hooks of selector."""
+        self._mount.pop(selector, None)
+        self._unmount.pop(selector, None)
+        if self._watcher is not None:
+            self._watcher.unwatch(selector)
+
+    def _watch(self, selector):
+        if self._watcher is None:
+            # One proxy serves every selector
+            self._dispatch_proxy = counted_proxy(self._dispatch)
+            self._watcher = _watcher(self._dispatch_proxy)
+        self._watcher.watch(selector)
+
+    def _dispatch(self, kind, selector, element):
+        hooks = self._mount if kind == 'mount' else self._unmount
+        callback = hooks.get(selector)
+        if callback is None:
+            return
+        try:
+            callback(element)
+        except Exception as e:
+            print(f"Error in {kind} hook for {selector}: {e}")
+
+
+# Global lifecycle registry
+lifecycle = Lifecycle()
+
+def on_mount(selector, callback):
+    """Call callback(element) for every element matching selector that enters the document."""
+    return lifecycle.on_mount(selector, callback)
+
+def on_unmount(selector, callback):
+    """Call callback(element) for every element matching selector that leaves the document."""
+    return lifecycle.on_unmount(selector, callback)
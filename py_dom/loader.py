@@ -0,0 +1,125 @@
+"""On-demand loading of the Pyodide packages app modules import.
+
+The page boots without any third-party package. The build records which
+packages each bundled module needs (py_html.environment.package_index), and
+load_module() downloads them before importing the module; py_dom.router does
+this for every route and warms the packages of linked pages while the browser
+is idle. Imports that happen anyway before their package is loaded are caught
+by a finder on sys.meta_path, which loads the package synchronously where the
+browser supports it (JSPI) and otherwise explains what to await.
+"""
+import asyncio
+import importlib
+import importlib.abc
+import importlib.machinery
+import json
+import sys
+import pyodide_js
+from pyodide.ffi import to_js
+
+from .bundle import read
+
+try:
+    from pyodide.ffi import can_run_sync, run_sync
+except ImportError:
+    # Pyodide before 0.27 cannot block on a promise
+    def can_run_sync():
+        return False
+    run_sync = None
+
+# Written into the bundle by py_html.environment.build_bundle (PACKAGE_INDEX_NAME there)
+PACKAGES_NAME = "__packages__.json"
+
+_index = None
+_loaded = set()
+_pending = {}  # package name -> task loading it
+
+
+def _package_index() -> dict:
+    global _index
+    if _index is None:
+        data = read(PACKAGES_NAME)
+        _index = json.loads(data) if data else {"imports": {}, "modules": {}}
+    return _index
+
+
+def is_loaded(package: str) -> bool:
+    """True if the Pyodide package is installed, by this module or by the page."""
+    if package in _loaded:
+        return True
+    if getattr(pyodide_js.loadedPackages, package, None) is not None:
+        _loaded.add(package)
+        return True
+    return False
+
+
+def required_packages(module_name: str) -> list:
+    """Return the packages module_name needs (including through the app modules it imports)."""
+    return _package_index()["modules"].get(module_name, [])
+
+
+def missing_packages(module_name: str) -> list:
+    """Return the packages module_name needs that are not loaded yet."""
+    return [package for package in required_packages(module_name) if not is_loaded(package)]
+
+
+async def _load(packages):
+    await pyodide_js.loadPackage(to_js(packages))
+    _loaded.update(packages)
+    importlib.invalidate_caches()
+
+
+async def load_packages(*packages):
+    """Load Pyodide packages by name; packages already loaded or loading are not requested again."""
+    wanted = [package for package in packages if not is_loaded(package)]
+    new = [package for package in wanted if package not in _pending]
+    if new:
+        task = asyncio.ensure_future(_load(new))
+        for package in new:
+            _pending[package] = task
+
+        def finished(_):
+            for package in new:
+                _pending.pop(package, None)
+        task.add_done_callback(finished)
+    tasks = {_pending[package] for package in wanted if package in _pending}
+    if tasks:
+        await asyncio.gather(*tasks)
+
+
+async def load_module(module_name: str):
+    """Load the packages module_name needs, then import it and return it."""
+    await load_packages(*required_packages(module_name))
+    return importlib.import_module(module_name)
+
+
+class PackageImportFinder(importlib.abc.MetaPathFinder):
+    """Loads the package behind a top-level import whose package is not loaded yet.
+
+    It returns None once the package is in, so the regular path finders import it.
+    """
+
+    def find_spec(self, fullname, path=None, target=None):
+        if path is not None:
+            return None
+        package = _package_index()["imports"].get(fullname)
+        if package is None or is_loaded(package):
+            return None
+        if not can_run_sync():
+            raise ModuleNotFoundError(
+                f"{fullname!r} comes from the Pyodide package {package!r}, which is not loaded yet; "
+                f"await py_dom.loader.load_packages({package!r}) or load_module() first", name=fullname)
+        run_sync(load_packages(package))
+        return None
+
+
+def install():
+    """Put a PackageImportFinder in front of the path finders (done by the page loader before main runs)."""
+    if any(isinstance(finder, PackageImportFinder) for finder in sys.meta_path):
+        return
+    finder = PackageImportFinder()
+    for position, existing in enumerate(sys.meta_path):
+        if existing is importlib.machinery.PathFinder:
+            sys.meta_path.insert(position, finder)
+            return
+    sys.meta_path.append(finder)
@@ -0,0 +1,107 @@
+"""Cached handles to the elements a component declares with ref="name".
+
+py_html renders ref="name" as a data-ref attribute. Refs resolves every
+data-ref element under a root in one JS call the first time a handle is
+needed and keeps the handles, so handlers that run on every keystroke or
+click no longer look elements up by id. A JS-only MutationObserver drops the
+cache as soon as one of the cached elements is removed from the DOM (the
+page re-rendered, a list redrawn) or a new data-ref element is added under
+the root; the next access resolves them again. Until then a name that is
+not in the cache is simply missing, without a lookup.
+"""
+import js
+
+from .events import counted_proxy, destroy_proxy
+
+# Collects the data-ref elements under root (root included) and watches for
+# their removal or for new ones; invalidate is called into Python once, then
+# the observer stops
+_resolve_refs = js.Function.new('root', 'invalidate', '''
+    const handles = {};
+    for (const element of root.querySelectorAll('[data-ref]')) {
+        handles[element.dataset.ref] = element;
+    }
+    if (root.dataset && root.dataset.ref) {
+        handles[root.dataset.ref] = root;
+    }
+    const elements = Object.values(handles).concat([root]);
+    const removed = (node) => elements.some(element => node === element || node.contains(element));
+    const added = (node) => node.nodeType === Node.ELEMENT_NODE && root.contains(node)
+        && (node.matches('[data-ref]') || node.querySelector('[data-ref]') !== null);
+    const observer = new MutationObserver((records) => {
+        for (const record of records) {
+            if (Array.from(record.removedNodes).some(removed) || Array.from(record.addedNodes).some(added)) {
+                observer.disconnect();
+                invalidate();
+                return;
+            }
+        }
+    });
+    observer.observe(document, {childList: true, subtree: true});
+    return [handles, observer];
+''')
+
+
+class Refs:
+    """The ref="name" elements under a root element, resolved once per render.
+
+    root is an element id, an element, or None for the whole page. Look
+    handles up with refs["name"] (KeyError if there is none) or refs.get().
+    """
+
+    def __init__(self, root=None):
+        self.root = root
+        self._handles = None
+        self._observer = None
+        self._invalidate_proxy = None
+
+    def __getitem__(self, name):
+        element = self.get(name)
+        if element is None:
+            raise KeyError(name)
+        return element
+
+    def __contains__(self, name):
+        return self.get(name) is not None
+
+    def get(self, name, default=None):
+        """Return the element declared with ref=name, or default."""
+        return self._resolve().get(name, default)
+
+    def invalidate(self):
+        """Forget the cached handles; they are resolved again on the next access."""
+        if self._observer is not None:
+            self._observer.disconnect()
+        self._handles = None
+        self._observer = None
+
+    def dispose(self):
+        """Forget the handles and destroy the proxy the observer calls; call it on unmount.
+
+        The Refs can still be used afterwards, it resolves again with a new proxy.
+        """
+        self.invalidate()
+        if self._invalidate_proxy is not None:
+            destroy_proxy(self._invalidate_proxy)
+            self._invalidate_proxy = None
+
+    def _resolve(self):
+        if self._handles is None:
+            root = self.root
+            if root is None:
+                root = js.document.body
+            elif isinstance(root, str):
+                root = js.document.getElementById(root)
+            if root is None:
+                return {}
+            if self._invalidate_proxy is None:
+                # One long-lived proxy serves every resolution
+                self._invalidate_proxy = counted_proxy(self._on_removed)
+            handles, self._observer = _resolve_refs(root, self._invalidate_proxy)
+            self._handles = handles.to_py(depth=1)
+        return self._handles
+
+    def _on_removed(self):
+        self._handles = None
+        self._observer = None
+
@@ -0,0 +1,170 @@
+"""Route-aware lazy loading of page modules for single page apps."""
+import asyncio
+import importlib
+import js
+from pyodide.ffi import to_js
+
+from .events import counted_proxy, events
+from .loader import load_packages, missing_packages
+
+# Collects the pages linked from the current DOM in a single JS call
+_linked_pages = js.Function.new('''
+    return Array.from(document.querySelectorAll('.spa-link[data-page]'), link => link.dataset.page);
+''')
+
+
+class LazyModule:
+    """A module that is imported the first time one of its attributes is needed."""
+
+    def __init__(self, name):
+        self.name = name
+        self._module = None
+
+    @property
+    def loaded(self):
+        return self._module is not None
+
+    def load(self):
+        """Import the module if it has not been imported yet and return it."""
+        if self._module is None:
+            self._module = importlib.import_module(self.name)
+        return self._module
+
+    def __getattr__(self, attr):
+        return getattr(self.load(), attr)
+
+
+_lazy_modules = {}
+
+
+def lazy_import(name):
+    """Return a LazyModule for name; nothing is imported until it is used."""
+    if name not in _lazy_modules:
+        _lazy_modules[name] = LazyModule(name)
+    return _lazy_modules[name]
+
+
+class Route:
+    """A page: the module that defines it and the names of its content and setup functions.
+
+    Pass the module as lazy_import("name") so the build bundles it; a plain
+    module name must be listed in BUNDLE_KEEP_MODULES in build.py.
+    """
+
+    def __init__(self, name, module, content, setup=None, aliases=()):
+        self.name = name
+        self.module = module if isinstance(module, LazyModule) else lazy_import(module)
+        self.content = content
+        self.setup = setup
+        self.aliases = tuple(aliases)
+
+
+class Router:
+    """Maps page names to lazily imported routes and prefetches linked pages while idle.
+
+    render is called with the page content and the page's setup function (or None)
+    every time a route is navigated to, after the listeners of the previous page
+    (the global events group) were removed. A page whose module needs Pyodide packages
+    that are not loaded yet is rendered once they are; meanwhile render gets
+    loading(packages) if a loading function is given.
+    """
+
+    def __init__(self, render, loading=None):
+        self._render = render
+        self._loading = loading
+        self._routes = {}
+        self._prefetch_queue = []
+        self._idle_proxy = None
+        self.current = None
+
+    def add(self, route):
+        """Register a route under its name and aliases."""
+        for name in (route.name,) + route.aliases:
+            self._routes[name] = route
+        return route
+
+    def navigate(self, page):
+        """Import the page's module if needed, then render it. Returns False for unknown pages."""
+        route = self._routes.get(page)
+        if route is None:
+            return False
+
+        self.current = route.name
+        # The previous page's listeners, timeouts and their proxies go with it
+        events.clear_all()
+        missing = [] if route.module.loaded else missing_packages(route.module.name)
+        if missing:
+            if self._loading:
+                self._render(self._loading(missing), None)
+            asyncio.ensure_future(self._show_when_loaded(route, missing))
+        else:
+            self._show(route)
+        return True
+
+    async def _show_when_loaded(self, route, packages):
+        try:
+            await load_packages(*packages)
+        except Exception as e:
+            print(f"Error loading {', '.join(packages)} for {route.name}: {e}")
+            return
+        # Another page may have been opened in the meantime
+        if self.current == route.name:
+            self._show(route)
+
+    def _show(self, route):
+        content = getattr(route.module, route.content)()
+        setup = getattr(route.module, route.setup) if route.setup else None
+        self._render(content, setup)
+
+        # Pages linked from this one are the likely next navigations
+        self.prefetch(_linked_pages().to_py())
+
+    def prefetch(self, pages):
+        """Import the modules for pages one at a time whenever the browser is idle.
+
+        Packages a module needs are downloaded first, in the background.
+        """
+        for page in pages:
+            route = self._routes.get(page)
+            if route and not route.module.loaded and route.module not in self._prefetch_queue:
+                self._prefetch_queue.append(route.module)
+        if self._prefetch_queue:
+            self._schedule_idle()
+
+    def _schedule_idle(self):
+        if self._idle_proxy is None:
+            # One long-lived proxy serves every idle callback
+            self._idle_proxy = counted_proxy(self._prefetch_next)
+        if hasattr(js.window, 'requestIdleCallback'):
+            js.window.requestIdleCallback(self._idle_proxy, to_js({'timeout': 2000}, dict_converter=js.Object.fromEntries))
+        else:
+            js.setTimeout(self._idle_proxy, 200)
+
+    def _prefetch_next(self, deadline=None):
+        while self._prefetch_queue:
+            module = self._prefetch_queue.pop(0)
+            if module.loaded:
+                continue
+            missing = missing_packages(module.name)
+            if missing:
+                # Warm the packages; the module is imported on the next idle callback
+                self._prefetch_queue.insert(0, module)
+                asyncio.ensure_future(self._warm(module, missing))
+                return
+            try:
+                module.load()
+            except Exception as e:
+                print(f"Error prefetching {module.name}: {e}")
+            break
+        if self._prefetch_queue:
+            self._schedule_idle()
+
+    async def _warm(self, module, packages):
+        try:
+            await load_packages(*packages)
+        except Exception as e:
+            print(f"Error prefetching {', '.join(packages)} for {module.name}: {e}")
+            if module in self._prefetch_queue:
+                self._prefetch_queue.remove(module)
+        if self._prefetch_queue:
+            self._schedule_idle()
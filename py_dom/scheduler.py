@@ -0,0 +1,99 @@
+"""Frame-coalesced DOM reads and writes.
+
+Handlers that fire on every keystroke or pointer move queue their DOM work
+here instead of touching the DOM directly. Once per animation frame the queued
+reads run first, then all writes are applied in a single call into JavaScript,
+so layout is computed at most once per frame. Writing the same property of the
+same node again before the frame replaces the earlier value.
+"""
+import js
+from pyodide.ffi import to_js
+
+from .events import counted_proxy
+
+# Applies [node or element id, property, value] triples in one FFI call
+_apply_writes = js.Function.new('writes', '''
+    for (const [node, property, value] of writes) {
+        const element = typeof node === 'string' ? document.getElementById(node) : node;
+        if (element) {
+            element[property] = value;
+        }
+    }
+''')
+
+
+class FrameScheduler:
+    """Queues DOM reads and writes and runs them on the next animation frame.
+
+    Reads are callbacks that measure the DOM or query a widget; they may queue
+    writes, which are applied in the same frame. Mutations are callbacks for
+    writes that are not a single property (classList, insertAdjacentHTML...).
+    Queuing the same read or mutation callback twice runs it once.
+    """
+
+    def __init__(self):
+        self._reads = {}      # callback -> None, in queue order
+        self._writes = {}     # (node key, property) -> (node, property, value)
+        self._mutations = {}  # callback -> None, in queue order
+        self._frame_proxy = None
+        self._frame = None
+
+    def read(self, callback):
+        """Call callback() on the next frame, before any write."""
+        self._reads[callback] = None
+        self._schedule()
+        return callback
+
+    def write(self, node, property, value):
+        """Set node[property] = value on the next frame; node is an element or an element id."""
+        # The same element handle (see py_dom.refs) dedupes without a call into JS
+        key = node if isinstance(node, str) else id(node)
+        self._writes[(key, property)] = (node, property, value)
+        self._schedule()
+
+    def mutate(self, callback):
+        """Call callback() on the next frame, after the property writes."""
+        self._mutations[callback] = None
+        self._schedule()
+        return callback
+
+    def flush(self, timestamp=None):
+        """Run the queued reads, then the writes and mutations, now."""
+        if self._frame is not None and timestamp is None:
+            js.cancelAnimationFrame(self._frame)
+        self._frame = None
+
+        reads, self._reads = self._reads, {}
+        for callback in reads:
+            callback()
+
+        writes, self._writes = self._writes, {}
+        if writes:
+            _apply_writes(to_js(list(writes.values())))
+        mutations, self._mutations = self._mutations, {}
+        for callback in mutations:
+            callback()
+
+    def _schedule(self):
+        if self._frame is not None:
+            return
+        if self._frame_proxy is None:
+            # One long-lived proxy serves every frame
+            self._frame_proxy = counted_proxy(self.flush)
+        self._frame = js.requestAnimationFrame(self._frame_proxy)
+
+
+# Global scheduler shared by every component, so a frame has a single flush
+scheduler = FrameScheduler()
+
+def read(callback):
+    """Run callback before the writes of the next frame (see FrameScheduler)."""
+    return scheduler.read(callback)
+
+def write(node, property, value):
+    """Set a DOM property on the next frame; later writes to the same property win."""
+    scheduler.write(node, property, value)
+
+def mutate(callback):
+    """Run a DOM-changing callback on the next frame, after the property writes."""
+    return scheduler.mutate(callback)
@@ -0,0 +1,156 @@
+"""Reactive state: signals, computed values and effects bound to DOM properties.
+
+A Signal holds a value; Computed derives one from signals and is recomputed
+only when one of them changed and it is read. An Effect reruns its function
+when a signal or computed value it read changes. Reruns are queued on the
+frame scheduler (py_dom.scheduler), so several changes in a handler cost one
+rerun, and the DOM writes of every effect are applied in the same flush.
+
+    modified = Signal(False)
+    binding = bind_text(lambda: refs.get("status"), lambda: "●" if modified.value else "")
+    modified.value = True   # the status text changes on the next frame
+"""
+from .scheduler import scheduler, write
+
+# The Computed or Effect whose function is running; the signals it reads are its sources
+_current = None
+
+
+def _track(source):
+    if _current is not None:
+        source._observers.add(_current)
+        _current._sources.add(source)
+
+
+def _run_tracked(observer, func):
+    """Call func as observer, replacing the sources it read last time with the ones it reads now."""
+    global _current
+    observer._unsubscribe()
+    previous, _current = _current, observer
+    try:
+        return func()
+    finally:
+        _current = previous
+
+
+class Signal:
+    """A value that effects and computed values depend on when they read it."""
+
+    def __init__(self, value=None):
+        self._value = value
+        self._observers = set()
+
+    @property
+    def value(self):
+        _track(self)
+        return self._value
+
+    @value.setter
+    def value(self, value):
+        if value is self._value or value == self._value:
+            return
+        self._value = value
+        for observer in list(self._observers):
+            observer._invalidate()
+
+    def peek(self):
+        """Return the value without becoming a dependency of the running effect."""
+        return self._value
+
+    def __repr__(self):
+        return f"Signal({self._value!r})"
+
+
+class Computed:
+    """A value derived from signals, recomputed lazily after one of them changed."""
+
+    def __init__(self, compute):
+        self._compute = compute
+        self._value = None
+        self._dirty = True
+        self._sources = set()
+        self._observers = set()
+
+    @property
+    def value(self):
+        _track(self)
+        if self._dirty:
+            self._value = _run_tracked(self, self._compute)
+            self._dirty = False
+        return self._value
+
+    def peek(self):
+        """Return the value without becoming a dependency of the running effect."""
+        global _current
+        previous, _current = _current, None
+        try:
+            return self.value
+        finally:
+            _current = previous
+
+    def _invalidate(self):
+        if self._dirty:
+            return
+        self._dirty = True
+        for observer in list(self._observers):
+            observer._invalidate()
+
+    def _unsubscribe(self):
+        for source in self._sources:
+            source._observers.discard(self)
+        self._sources.clear()
+
+
+class Effect:
+    """Runs func now and again on the next frame whenever something it read changed."""
+
+    def __init__(self, func):
+        self._func = func
+        self._sources = set()
+        self._disposed = False
+        self._run()
+
+    def dispose(self):
+        """Stop rerunning; call it when the elements the effect updates go away."""
+        self._disposed = True
+        self._unsubscribe()
+
+    def _invalidate(self):
+        if not self._disposed:
+            scheduler.read(self._run)
+
+    def _run(self):
+        if not self._disposed:
+            _run_tracked(self, self._func)
+
+    def _unsubscribe(self):
+        for source in self._sources:
+            source._observers.discard(self)
+        self._sources.clear()
+
+
+def effect(func) -> Effect:
+    """Run func now and whenever the signals it reads change (usable as a decorator)."""
+    return Effect(func)
+
+
+def bind(node, property, source) -> Effect:
+    """Keep node[property] equal to source: a Signal, a Computed or a function of signals.
+
+    node is an element, an element id, or a function returning the element
+    (such as a Refs lookup) so that a re-rendered element is picked up.
+    Dispose of the returned Effect when the element is removed for good.
+    """
+    if isinstance(source, (Signal, Computed)):
+        read = lambda: source.value
+    else:
+        read = source
+
+    def update():
+        write(node() if callable(node) else node, property, read())
+    return Effect(update)
+
+
+def bind_text(node, source) -> Effect:
+    """Keep the text of node equal to source (see bind)."""
+    return bind(node, 'textContent', source)
@@ -0,0 +1,157 @@
+"""Rate limiting for handlers of high-frequency events (typing, scrolling, resizing).
+
+debounce(), throttle() and idle() wrap a function so that bursts of calls run
+it once, or at a bounded rate, with the arguments of the latest call. Each
+wrapper keeps a single JS timer proxy for its whole life instead of creating
+one per call, and timers are only restarted when they actually fire, so a
+call during a burst costs no FFI round-trip. They work as decorators, also on
+methods (each instance gets its own timer), and have cancel() and flush().
+"""
+import functools
+import time
+import js
+from pyodide.ffi import to_js
+
+from .events import counted_proxy, destroy_proxy
+
+
+class _RateLimited:
+    """Base class: holds the pending call and the timer that runs it."""
+
+    def __init__(self, func, wait):
+        functools.update_wrapper(self, func)
+        self.func = func
+        self.wait = wait
+        self._call = None   # (args, kwargs) of the pending call
+        self._timer = None
+        self._proxy = None
+
+    def __get__(self, instance, owner):
+        if instance is None:
+            return self
+        # One wrapper, and timer, per instance; cached so later lookups find it
+        bound = type(self)(self.func.__get__(instance, owner), self.wait)
+        instance.__dict__[self.__name__] = bound
+        return bound
+
+    @property
+    def pending(self) -> bool:
+        """True if a call is waiting to run."""
+        return self._call is not None
+
+    def cancel(self):
+        """Drop the pending call and release the timer proxy."""
+        self._call = None
+        if self._timer is not None:
+            self._clear_timer(self._timer)
+            self._timer = None
+        if self._proxy is not None:
+            destroy_proxy(self._proxy)
+            self._proxy = None
+
+    def flush(self):
+        """Run the pending call now, if there is one, and return its result."""
+        if self._call is None:
+            return None
+        args, kwargs = self._call
+        self._call = None
+        return self.func(*args, **kwargs)
+
+    def _start_timer(self, delay):
+        if self._proxy is None:
+            self._proxy = counted_proxy(self._fire)
+        self._timer = self._set_timer(self._proxy, delay)
+
+    def _set_timer(self, proxy, delay):
+        return js.setTimeout(proxy, delay)
+
+    def _clear_timer(self, timer):
+        js.clearTimeout(timer)
+
+    def _fire(self, *_):
+        self._timer = None
+
+
+class Debounced(_RateLimited):
+    """Runs func wait milliseconds after the last call of a burst."""
+
+    def __init__(self, func, wait):
+        super().__init__(func, wait)
+        self._deadline = 0.0
+
+    def __call__(self, *args, **kwargs):
+        self._call = (args, kwargs)
+        self._deadline = time.monotonic() + self.wait / 1000
+        if self._timer is None:
+            self._start_timer(self.wait)
+
+    def _fire(self, *_):
+        self._timer = None
+        remaining = self._deadline - time.monotonic()
+        if remaining > 0.001:
+            # Called again since the timer was started; wait for the rest
+            self._start_timer(remaining * 1000)
+        else:
+            self.flush()
+
+
+class Throttled(_RateLimited):
+    """Runs func at most once every wait milliseconds: at once, then with the latest arguments."""
+
+    def __init__(self, func, wait):
+        super().__init__(func, wait)
+        self._last = float('-inf')
+
+    def __call__(self, *args, **kwargs):
+        self._call = (args, kwargs)
+        if self._timer is not None:
+            return None
+        elapsed = (time.monotonic() - self._last) * 1000
+        if elapsed >= self.wait:
+            self._last = time.monotonic()
+            return self.flush()
+        self._start_timer(self.wait - elapsed)
+        return None
+
+    def _fire(self, *_):
+        self._timer = None
+        if self._call is not None:
+            self._last = time.monotonic()
+            self.flush()
+
+
+class Idle(_RateLimited):
+    """Runs func once when the browser is idle, at the latest wait milliseconds after the first call."""
+
+    def __call__(self, *args, **kwargs):
+        self._call = (args, kwargs)
+        if self._timer is None:
+            self._start_timer(self.wait)
+
+    def _set_timer(self, proxy, delay):
+        if hasattr(js.window, 'requestIdleCallback'):
+            return js.window.requestIdleCallback(proxy, to_js({'timeout': delay}, dict_converter=js.Object.fromEntries))
+        return js.setTimeout(proxy, 0)
+
+    def _clear_timer(self, timer):
+        if hasattr(js.window, 'cancelIdleCallback'):
+            js.window.cancelIdleCallback(timer)
+        else:
+            js.clearTimeout(timer)
+
+    def _fire(self, *_):
+        self._timer = None
+        self.flush()
+
+
+def debounce(wait):
+    """Decorator: run the function wait ms after the last call of a burst (see Debounced)."""
+    return lambda func: Debounced(func, wait)
+
+def throttle(wait):
+    """Decorator: run the function at most once every wait ms (see Throttled)."""
+    return lambda func: Throttled(func, wait)
+
+def idle(timeout=1000):
+    """Decorator: run the function once when the browser is idle, within timeout ms (see Idle)."""
+    return lambda func: Idle(func, timeout)
@@ -4,34 +4,45 @@ PyHTML - A Python library for generating HTML with a fluent API.
 This library provides a clean, Pythonic way to generate HTML using classes
 and method chaining. It includes support for CSS generation and a comprehensive
 set of HTML elements and macros.
-"""
 
-# Core HTML elements and CSS
-from .elements import *
-from .css import *
+Elements, CSS classes and macros are all available at the top level, but each
+submodule is only imported the first time one of its names is used (PEP 562).
+"""
 
-# Macro imports for convenience
-from .macros import *
+import importlib
 
 __version__ = "1.0.0"
 __author__ = "PyHTML Contributors"
 __description__ = "A Python library for generating HTML with a fluent API"
 
-# Make common macros available at the top level for convenience
-from .macros.components import (
-    document, page_template, breadcrumb, alert, badge, 
-    progress_bar, icon, dropdown, tabs, pagination
-)
-from .macros.forms import (
-    text_field, email_field, password_field, textarea_field,
-    select_field, checkbox_field, radio_field, login_form, 
-    contact_form, search_form
-)
-from .macros.layouts import (
-    container, row, col, grid_layout, sidebar_layout,
-    hero_section, card, navbar, footer, full_page_layout
-)
-from .macros.ui import (
-    modal, accordion, carousel, tooltip, popover,
-    offcanvas, toast, collapse, timeline, spinner
-)
\ No newline at end of file
+_SUBMODULES = ('elements', 'css', 'macros', 'styles')
+
+# Everything py_html.css exports; all other names come from the macros package,
+# which also re-exports the HTML elements
+_CSS_EXPORTS = ('CSS', 'CSSBuilder', 'CSSRule', 'MediaQuery', 'RawCSS')
+
+
+def __getattr__(name):
+    if name in _SUBMODULES:
+        return importlib.import_module(f'.{name}', __name__)
+
+    if name == '__all__':
+        macros = importlib.import_module('.macros', __name__)
+        value = list(_CSS_EXPORTS) + macros.__all__
+    elif name in _CSS_EXPORTS:
+        value = getattr(importlib.import_module('.css', __name__), name)
+    elif not name.startswith('__'):
+        try:
+            value = getattr(importlib.import_module('.macros', __name__), name)
+        except AttributeError:
+            raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    macros = importlib.import_module('.macros', __name__)
+    return sorted(set(globals()) | set(_SUBMODULES) | set(_CSS_EXPORTS) | set(dir(macros)))
@@ -0,0 +1,141 @@
+"""Precompressed copies of text and WebAssembly assets for the static server."""
+import gzip
+import os
+
+# Assets worth compressing; wheels and zips are already deflated
+COMPRESSIBLE_SUFFIXES = ('.html', '.js', '.mjs', '.css', '.wasm', '.json', '.map', '.svg', '.txt', '.metadata')
+
+# Sibling suffix for each Content-Encoding, in order of preference
+ENCODINGS = {'br': '.br', 'gzip': '.gz'}
+
+# Small files gain nothing once headers are counted
+MIN_SIZE = 1024
+
+# A sibling is only kept if it is at most this fraction of the original
+MIN_RATIO = 0.9
+
+
+def compressed_source(rel_path: str):
+    """Return the path of the file a .br/.gz sibling was made from, or None."""
+    for suffix in ENCODINGS.values():
+        if rel_path.endswith(suffix):
+            return rel_path[:-len(suffix)]
+    return None
+
+
+def _changed_ns(stat) -> int:
+    """When a file's contents last changed: its mtime or ctime, which covers files replaced by hardlinks."""
+    return max(stat.st_mtime_ns, stat.st_ctime_ns)
+
+
+def is_fresh(path: str, sibling: str) -> bool:
+    """True if the compressed sibling was written after path last changed."""
+    try:
+        return os.stat(sibling).st_mtime_ns >= _changed_ns(os.stat(path))
+    except OSError:
+        return False
+
+
+def _compressors():
+    """Return (suffix, compress function) pairs for the encodings available here."""
+    compressors = []
+    try:
+        import brotli
+        compressors.append((ENCODINGS['br'], lambda data: brotli.compress(data, quality=11)))
+    except ImportError:
+        pass
+    # mtime=0 keeps the output identical between builds
+    compressors.append((ENCODINGS['gzip'], lambda data: gzip.compress(data, compresslevel=9, mtime=0)))
+    return compressors
+
+
+def compress_file(path: str, suffixes) -> tuple:
+    """Write the given siblings of path; return (siblings written, siblings removed).
+
+    Runs in a worker process when the build uses a process pool.
+    """
+    with open(path, 'rb') as f:
+        data = f.read()
+    written = removed = 0
+    for suffix, compress in _compressors():
+        if suffix not in suffixes:
+            continue
+        sibling = path + suffix
+        compressed = compress(data)
+        if len(compressed) > len(data) * MIN_RATIO:
+            # Not worth serving; make sure an outdated sibling does not linger
+            if os.path.exists(sibling):
+                os.remove(sibling)
+                removed += 1
+            continue
+        with open(sibling, 'wb') as f:
+            f.write(compressed)
+        written += 1
+    return written, removed
+
+
+def compress_output(output_folder: str, map_func=map) -> str:
+    """Write .br (if the brotli package is installed) and .gz siblings for compressible assets.
+
+    Siblings are only rewritten when the original changed since they were made
+    (see is_fresh). Siblings whose original no longer exists, and siblings of
+    encodings that are not available now (a .br from a build that had brotli),
+    are removed. Files are compressed through map_func, which can be a process
+    pool's map.
+    """
+    suffixes = [suffix for suffix, _ in _compressors()]
+    unavailable = [suffix for suffix in ENCODINGS.values() if suffix not in suffixes]
+    unchanged = removed = 0
+    paths, stale = [], []
+
+    for root, dirs, files in os.walk(output_folder):
+        for file in files:
+            path = os.path.join(root, file)
+            source = compressed_source(path)
+            if source is not None:
+                if not os.path.exists(source):
+                    os.remove(path)
+                    removed += 1
+                continue
+            if file.startswith('.') or not file.endswith(COMPRESSIBLE_SUFFIXES):
+                continue
+            stat = os.stat(path)
+            if stat.st_size < MIN_SIZE:
+                for suffix in ENCODINGS.values():
+                    if os.path.exists(path + suffix):
+                        os.remove(path + suffix)
+                        removed += 1
+                continue
+
+            for suffix in unavailable:
+                if os.path.exists(path + suffix):
+                    os.remove(path + suffix)
+                    removed += 1
+
+            outdated = []
+            for suffix in suffixes:
+                if is_fresh(path, path + suffix):
+                    unchanged += 1
+                else:
+                    outdated.append(suffix)
+            if outdated:
+                paths.append(path)
+                stale.append(tuple(outdated))
+
+    written = 0
+    for file_written, file_removed in map_func(compress_file, paths, stale):
+        written += file_written
+        removed += file_removed
+
+    return f"Compressed assets ({', '.join(suffixes)}): {written} written, {unchanged} unchanged, {removed} removed"
+
+
+def remove_compressed(output_folder: str) -> str:
+    """Delete every .br/.gz sibling, for builds made with --no-compress."""
+    removed = 0
+    for root, dirs, files in os.walk(output_folder):
+        for file in files:
+            if compressed_source(file) is not None:
+                os.remove(os.path.join(root, file))
+                removed += 1
+    return f"Removed {removed} compressed siblings"
@@ -0,0 +1,269 @@
+"""Static import analysis used by the build to decide what ships to the browser."""
+import ast
+import json
+import os
+
+# Files under py_html that only run on the build machine and never in Pyodide
+BUILD_ONLY_MODULES = (
+    "py_html/setup.py",
+    "py_html/environment.py",
+    "py_html/dependencies.py",
+    "py_html/compression.py",
+    "py_html/server.py",
+    "py_html/pipeline.py",
+    "py_html/watch.py",
+)
+
+# Files every Pyodide deployment needs regardless of which packages are used
+PYODIDE_CORE_FILES = (
+    "pyodide.js",
+    "pyodide.mjs",
+    "pyodide.asm.js",
+    "pyodide.asm.wasm",
+    "python_stdlib.zip",
+    "pyodide-lock.json",
+)
+
+# Calls whose literal string argument names a module imported at run time, by argument position
+DYNAMIC_IMPORT_CALLS = {
+    'import_module': 0,
+    '__import__': 0,
+    'lazy_import': 0,
+    'LazyModule': 0,
+}
+
+
+def iter_python_files(folders):
+    """Yield the relative path of every .py file under the given folders."""
+    for folder in folders:
+        if not os.path.exists(folder):
+            continue
+        for root, dirs, files in os.walk(folder):
+            dirs[:] = sorted(d for d in dirs if d != '__pycache__')
+            for file in sorted(files):
+                if file.endswith(".py"):
+                    path = os.path.relpath(os.path.join(root, file), ".").replace(os.sep, "/")
+                    if path not in BUILD_ONLY_MODULES:
+                        yield path
+
+
+def scan_imports(path) -> set:
+    """Return the top-level names of every absolute import in a Python file."""
+    with open(path, 'r', encoding='utf-8') as f:
+        tree = ast.parse(f.read(), filename=str(path))
+
+    names = set()
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Import):
+            for alias in node.names:
+                names.add(alias.name.split('.')[0])
+        elif isinstance(node, ast.ImportFrom) and node.level == 0 and node.module:
+            names.add(node.module.split('.')[0])
+    return names
+
+
+def scan_module_imports(path) -> list:
+    """Return (module, names, level) for every import in a Python file, including dynamic ones.
+
+    names is the tuple of names of a from-import, or None for a plain import.
+    Calls listed in DYNAMIC_IMPORT_CALLS with a literal module name, such as
+    importlib.import_module('.css', __name__) or lazy_import('home'), count as
+    plain imports.
+    """
+    with open(path, 'r', encoding='utf-8') as f:
+        tree = ast.parse(f.read(), filename=str(path))
+
+    imports = []
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Import):
+            imports.extend((alias.name, None, 0) for alias in node.names)
+        elif isinstance(node, ast.ImportFrom):
+            imports.append((node.module or '', tuple(alias.name for alias in node.names), node.level))
+        elif isinstance(node, ast.Call):
+            func = node.func
+            name = func.id if isinstance(func, ast.Name) else getattr(func, 'attr', None)
+            position = DYNAMIC_IMPORT_CALLS.get(name)
+            if position is None or len(node.args) <= position:
+                continue
+            arg = node.args[position]
+            if isinstance(arg, ast.Constant) and isinstance(arg.value, str) and arg.value.strip('.'):
+                module = arg.value.lstrip('.')
+                imports.append((module, None, len(arg.value) - len(module)))
+    return imports
+
+
+def lazy_submodules(init_path, files) -> list:
+    """Return the submodules a package with a module __getattr__ may import on attribute access.
+
+    Those are the files next to init_path that the package names in a string
+    literal, e.g. in a tuple of lazily exported submodules.
+    """
+    with open(init_path, 'r', encoding='utf-8') as f:
+        tree = ast.parse(f.read(), filename=str(init_path))
+    if not any(isinstance(node, ast.FunctionDef) and node.name == '__getattr__' for node in tree.body):
+        return []
+
+    folder = os.path.dirname(init_path)
+    found = []
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Constant) and isinstance(node.value, str) and node.value.isidentifier():
+            found.extend(find_module(node.value, folder, files) or [])
+    return found
+
+
+def find_module(name: str, folder: str, files):
+    """Return the files executed to import name from folder, parent packages first, or None.
+
+    folder plays the part of a sys.path entry ("" for the current directory);
+    files is the set of candidate paths.
+    """
+    if not name:
+        return []
+    parts = name.split('.')
+    found = []
+    path = folder
+    for i, part in enumerate(parts):
+        path = f"{path}/{part}" if path else part
+        if f"{path}/__init__.py" in files:
+            found.append(f"{path}/__init__.py")
+        elif i == len(parts) - 1 and f"{path}.py" in files:
+            found.append(f"{path}.py")
+        elif not any(file.startswith(path + "/") for file in files):
+            # Neither a module nor a (namespace) package
+            return None
+    return found
+
+
+def imported_files(path: str, files, roots=("",)) -> set:
+    """Return the files in files that importing path executes directly.
+
+    Absolute imports are looked up in roots in order, like sys.path; relative
+    imports next to path. Names taken from a package are followed if they are
+    submodules, and a lazy package (see lazy_submodules) that is imported whole
+    or has attributes taken from it brings the submodules it names.
+    """
+    result = set()
+    for module, names, level in scan_module_imports(path):
+        if level:
+            base = os.path.dirname(path)
+            for _ in range(level - 1):
+                base = os.path.dirname(base)
+            bases = [base]
+        else:
+            bases = roots
+
+        for base in bases:
+            found = find_module(module, base, files)
+            if found is None:
+                continue
+            result.update(found)
+            target = found[-1] if found else f"{base}/__init__.py"
+            if names is None:
+                accessed = [file for file in found if file.endswith("/__init__.py")]
+            elif target.endswith("__init__.py"):
+                package = os.path.dirname(target)
+                submodules = [find_module(name, package, files) for name in names if name != '*']
+                for submodule in submodules:
+                    result.update(submodule or [])
+                accessed = [target] if '*' in names or None in submodules else []
+            else:
+                accessed = []
+            for package in accessed:
+                if package in files:
+                    result.update(lazy_submodules(package, files))
+            break
+    return result
+
+
+def import_graph(entries, files, roots=("",)) -> dict:
+    """Return {file: files it imports directly} for every file reachable from the entry files.
+
+    Imports are followed statically (see imported_files), so modules that are
+    only imported with a computed name have to be listed as entries.
+    """
+    files = set(files)
+    graph = {}
+    pending = [path for path in entries if path in files]
+    while pending:
+        path = pending.pop()
+        if path in graph:
+            continue
+        graph[path] = imported_files(path, files, roots)
+        pending.extend(graph[path] - graph.keys())
+    return graph
+
+
+def reachable_modules(entries, files, roots=("",)) -> set:
+    """Return the files in files reachable from the entry files through their imports."""
+    return set(import_graph(entries, files, roots))
+
+
+def closure(graph: dict, path: str) -> set:
+    """Return path and every file it imports, directly or indirectly, in an import graph."""
+    reached = set()
+    pending = [path]
+    while pending:
+        current = pending.pop()
+        if current not in reached:
+            reached.add(current)
+            pending.extend(graph.get(current, ()))
+    return reached
+
+
+def collect_imports(folders) -> set:
+    """Return the top-level names imported anywhere in the given folders."""
+    names = set()
+    for path in iter_python_files(folders):
+        names |= scan_imports(path)
+    return names
+
+
+def load_pyodide_lock(pyodide_folder: str = "pyodide") -> dict:
+    """Load pyodide-lock.json, or return None if the runtime is not present."""
+    lock_path = os.path.join(pyodide_folder, "pyodide-lock.json")
+    if not os.path.exists(lock_path):
+        return None
+    with open(lock_path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def import_providers(lock: dict) -> dict:
+    """Map every top-level import name in the lock file to the package that provides it."""
+    providers = {}
+    for name, info in lock['packages'].items():
+        for import_name in info.get('imports', []):
+            providers.setdefault(import_name, name)
+    return providers
+
+
+def resolve_packages(import_names, lock: dict, extra_packages=()) -> set:
+    """Resolve import names to the transitive closure of Pyodide packages they need.
+
+    Names that no package provides (stdlib modules, app modules, js, pyodide) are
+    ignored. extra_packages lists package names to include unconditionally, for
+    modules that are imported dynamically or loaded by the page itself.
+    """
+    packages = lock['packages']
+    providers = import_providers(lock)
+
+    pending = [providers[name] for name in import_names if name in providers]
+    pending += [name for name in extra_packages if name in packages]
+
+    resolved = set()
+    while pending:
+        name = pending.pop()
+        if name in resolved:
+            continue
+        resolved.add(name)
+        pending.extend(dep for dep in packages[name].get('depends', []) if dep not in resolved)
+    return resolved
+
+
+def pyodide_files(lock: dict, package_names) -> set:
+    """Return the file names in the Pyodide folder needed for the given packages."""
+    files = set(PYODIDE_CORE_FILES)
+    for name in package_names:
+        file_name = lock['packages'][name]['file_name']
+        files.add(file_name)
+        files.add(f"{file_name}.metadata")
+    return files
@@ -19,6 +19,7 @@ class HTMLElement:
         self.role = kwargs.get('role')  # ARIA role
         self.data = kwargs.get('data', {})  # data-* attributes
         self.aria = kwargs.get('aria', {})  # aria-* attributes
+        self.ref = kwargs.get('ref')  # handle name for py_dom.refs (rendered as data-ref)
         
         # Content management
         self.children = []
@@ -88,6 +89,8 @@ class HTMLElement:
             attrs.append(f'role="{self.role}"')
         
         # Data attributes
+        if self.ref:
+            attrs.append(f'data-ref="{self.ref}"')
         for key, value in self.data.items():
             attrs.append(f'data-{key}="{value}"')
         
@@ -693,7 +696,7 @@ class Style(HTMLElement):
     
     def add(self, *items):
         """Add CSS rules, raw CSS strings, or text content."""
-        from css import CSSRule, MediaQuery, CSSBuilder
+        from .css import CSSRule, MediaQuery, CSSBuilder
         
         for item in items:
             if isinstance(item, (CSSRule, MediaQuery)):
@@ -1,84 +1,990 @@
-def init_environment(output_folder: str, scripts_folder: str = "scripts") -> str:
-    """Setup complete PyHTML environment by copying all necessary files to output folder."""
-    import os
-    import shutil
-    from pathlib import Path
+import base64
+import hashlib
+import json
+import os
+import shutil
+import threading
+import time
+from pathlib import Path
+
+from .compression import compressed_source
+
+MANIFEST_NAME = ".build-manifest.json"
+BUNDLE_NAME = "app.zip"
+SERVICE_WORKER_NAME = "sw.js"
+# Module index inside the bundle, read by py_dom/bundle.py (INDEX_NAME there)
+MODULE_INDEX_NAME = "__modules__.json"
+# Imports app modules from the bundle in memory; the page runs it from source
+BUNDLE_IMPORTER = "py_dom/bundle.py"
+# Which Pyodide packages each bundled module needs, read by py_dom/loader.py (PACKAGES_NAME there)
+PACKAGE_INDEX_NAME = "__packages__.json"
+# Modules the page loader imports itself, bundled whatever main imports:
+# py_dom.loader's import finder is installed and main is run through py_dom.hot
+PAGE_MODULES = ("py_dom.loader", "py_dom.hot")
+# Pyodide packages the page loader installs before running main; everything
+# else is loaded by py_dom.loader when the module that imports it is needed
+BOOT_PACKAGES = ()
+
+# CodeMirror is vendored into the output and loaded by the text editor on demand
+CODEMIRROR_VERSION = "5.65.16"
+CODEMIRROR_CDN = f"https://cdnjs.cloudflare.com/ajax/libs/codemirror/{CODEMIRROR_VERSION}/"
+CODEMIRROR_VENDOR = f"vendor/codemirror/{CODEMIRROR_VERSION}"
+CODEMIRROR_FILES = (
+    "codemirror.min.css",
+    "theme/default.min.css",
+    "codemirror.min.js",
+    "mode/python/python.min.js",
+    "mode/javascript/javascript.min.js",
+    "mode/htmlmixed/htmlmixed.min.js",
+    "mode/css/css.min.js",
+    "mode/markdown/markdown.min.js",
+    "mode/xml/xml.min.js",
+    "addon/edit/matchbrackets.min.js",
+    "addon/edit/closebrackets.min.js",
+)
+# SHA-256 of every vendored CodeMirror file, in sha256sum format, committed with the vendor folder
+VENDOR_CHECKSUMS = "SHA256SUMS"
+# A failed CodeMirror download is not retried by incremental builds for this long
+VENDOR_RETRY_SECONDS = 24 * 60 * 60
+
+# Linux FICLONE ioctl, used to reflink files on copy-on-write filesystems
+_FICLONE = 0x40049409
+
+
+def _file_digest(path) -> str:
+    """Return the SHA-256 hex digest of a file, read in chunks."""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1024 * 1024), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _tree_digest(folder) -> str:
+    """Return a SHA-256 hex digest covering the relative paths and contents of every file in folder."""
+    digest = hashlib.sha256()
+    for root, dirs, files in os.walk(folder):
+        dirs.sort()
+        for file in sorted(files):
+            path = os.path.join(root, file)
+            digest.update(os.path.relpath(path, folder).replace(os.sep, '/').encode())
+            digest.update(_file_digest(path).encode())
+    return digest.hexdigest()
+
+
+def fingerprint(rel_path: str, digest: str, folder: bool = False) -> str:
+    """Put the first 12 digits of a content digest into a file or folder name.
+
+    app.zip becomes app.<hash>.zip and a folder such as pyodide becomes
+    pyodide.<hash>, so the name changes whenever the content does and the
+    server can mark it as immutable.
+    """
+    if folder:
+        return f"{rel_path}.{digest[:12]}"
+    stem, ext = os.path.splitext(rel_path)
+    return f"{stem}.{digest[:12]}{ext}"
+
+
+def load_manifest(output_folder) -> dict:
+    """Return the build manifest saved in output_folder, or an empty one.
+
+    'assets' maps plain asset names to the fingerprinted names of the last build,
+    'files' holds the size and digest of every file it placed, 'precache'
+    lists the files the service worker should cache and 'failed_downloads'
+    maps vendor folders to the time their download last failed.
+    """
+    path = Path(output_folder) / MANIFEST_NAME
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            manifest = json.load(f)
+    except (OSError, ValueError):
+        manifest = {}
+    return {'files': {}, 'assets': {}, 'precache': [], 'failed_downloads': {}, **manifest}
+
+
+def _reflink(src, dest) -> bool:
+    """Clone src into dest on filesystems that support it (btrfs, xfs, apfs)."""
+    try:
+        import fcntl
+    except ImportError:
+        return False
+    try:
+        with open(src, 'rb') as fsrc, open(dest, 'wb') as fdest:
+            fcntl.ioctl(fdest.fileno(), _FICLONE, fsrc.fileno())
+    except OSError:
+        if os.path.exists(dest):
+            os.remove(dest)
+        return False
+    shutil.copystat(src, dest)
+    return True
+
+
+def _place_file(src, dest, link: bool = False):
+    """Put a copy of src at dest, preferring a hardlink or reflink over a byte copy.
+
+    dest is always unlinked first so an existing hardlink is never written through.
+    """
+    dest.parent.mkdir(parents=True, exist_ok=True)
+    if dest.exists() or dest.is_symlink():
+        dest.unlink()
+    if link:
+        try:
+            os.link(src, dest)
+            return
+        except OSError:
+            pass
+    if not _reflink(src, dest):
+        shutil.copy2(src, dest)
+
+
+class BuildManifest:
+    """Content hashes and mtimes of every file the build has placed in the output folder.
+
+    Files whose size and mtime match the previous build are skipped without being
+    read; files whose mtime changed are hashed and only copied if the content differs.
+    Different build steps may sync into the same manifest from separate threads.
+    """
+
+    def __init__(self, output_folder):
+        self.output_path = Path(output_folder)
+        self.path = self.output_path / MANIFEST_NAME
+        self.previous = {}
+        self.entries = {}
+        # Plain asset name -> fingerprinted name in the output, read by build_page
+        self.assets = {}
+        # Files the page needs to boot offline, precached by the service worker
+        self.precache = []
+        # Vendor folder -> time its download failed, so offline builds do not wait on it every time
+        self.failed_downloads = {}
+        self.copied = 0
+        self.unchanged = 0
+        self.removed = 0
+        self._lock = threading.Lock()
+        if self.path.exists():
+            try:
+                with open(self.path, 'r', encoding='utf-8') as f:
+                    saved = json.load(f)
+                self.previous = saved.get('files', {})
+                self.failed_downloads = saved.get('failed_downloads', {})
+            except (OSError, ValueError):
+                self.previous = {}
+
+    def carry_over(self):
+        """Keep everything from the previous build, for rebuilds that only replace some files."""
+        self.entries.update(self.previous)
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                saved = json.load(f)
+        except (OSError, ValueError):
+            return
+        self.assets.update(saved.get('assets', {}))
+        self.precache = list(saved.get('precache', []))
+
+    def sync_file(self, src, rel_path: str, link: bool = False) -> bool:
+        """Copy src to rel_path in the output folder if it changed. Returns True if copied."""
+        stat = os.stat(src)
+        dest = self.output_path / rel_path
+        entry = self.previous.get(rel_path)
+        digest = None
+
+        if entry and entry['size'] == stat.st_size and dest.exists():
+            if entry['mtime_ns'] == stat.st_mtime_ns:
+                self._record(rel_path, entry, copied=False)
+                return False
+            # Touched but possibly identical: compare content before copying
+            digest = _file_digest(src)
+            if digest == entry['sha256']:
+                self._record(rel_path, dict(entry, mtime_ns=stat.st_mtime_ns), copied=False)
+                return False
+
+        if digest is None:
+            digest = _file_digest(src)
+        # Adopt files left behind by a build that predates the manifest
+        adopted = not entry and dest.exists() and dest.stat().st_size == stat.st_size \
+            and _file_digest(dest) == digest
+        if not adopted:
+            _place_file(src, dest, link)
+        
+        self._record(rel_path, {
+            'size': stat.st_size,
+            'mtime_ns': stat.st_mtime_ns,
+            'sha256': digest,
+        }, copied=not adopted)
+        return True
+
+    def write_file(self, rel_path: str, data: bytes) -> bool:
+        """Write generated content to rel_path if it differs from the last build. Returns True if written."""
+        dest = self.output_path / rel_path
+        digest = hashlib.sha256(data).hexdigest()
+        entry = self.previous.get(rel_path)
+        
+        if entry and entry['sha256'] == digest and dest.exists():
+            self._record(rel_path, entry, copied=False)
+            return False
+        
+        dest.parent.mkdir(parents=True, exist_ok=True)
+        if dest.exists():
+            dest.unlink()
+        with open(dest, 'wb') as f:
+            f.write(data)
+        self._record(rel_path, {
+            'size': len(data),
+            'mtime_ns': dest.stat().st_mtime_ns,
+            'sha256': digest,
+        }, copied=True)
+        return True
+
+    def _record(self, rel_path: str, entry: dict, copied: bool):
+        with self._lock:
+            self.entries[rel_path] = entry
+            if copied:
+                self.copied += 1
+            else:
+                self.unchanged += 1
+
+    def sync_tree(self, src_folder, dest_folder: str, link: bool = False, include=None):
+        """Mirror src_folder into dest_folder, removing files that no longer exist in src.
+
+        include is an optional predicate on the path relative to src_folder; files it
+        rejects are not copied and are removed from the destination.
+        """
+        synced = set()
+        for root, dirs, files in os.walk(src_folder):
+            dirs[:] = sorted(d for d in dirs if d != '__pycache__')
+            for file in sorted(files):
+                if file.endswith('.pyc'):
+                    continue
+                src = os.path.join(root, file)
+                rel = os.path.relpath(src, src_folder).replace(os.sep, '/')
+                if include is not None and not include(rel):
+                    continue
+                rel_path = f"{dest_folder}/{rel}"
+                self.sync_file(src, rel_path, link)
+                synced.add(rel_path)
+        
+        # Remove anything in the destination tree that is not part of this sync
+        dest_root = self.output_path / dest_folder
+        if dest_root.exists():
+            for root, dirs, files in os.walk(dest_root, topdown=False):
+                for file in files:
+                    path = Path(root) / file
+                    rel_path = path.relative_to(self.output_path).as_posix()
+                    # Precompressed siblings of synced files are kept
+                    if rel_path not in synced and compressed_source(rel_path) not in synced:
+                        path.unlink()
+                        with self._lock:
+                            self.removed += 1
+                if root != str(dest_root) and not os.listdir(root):
+                    os.rmdir(root)
+
+    def remove_stale(self):
+        """Delete files recorded by the previous build that this build did not produce."""
+        for rel_path in set(self.previous) - set(self.entries):
+            path = self.output_path / rel_path
+            if path.exists():
+                path.unlink()
+                self.removed += 1
+                parent = path.parent
+                while parent != self.output_path and not any(parent.iterdir()):
+                    parent.rmdir()
+                    parent = parent.parent
+
+    def save(self):
+        """Write the manifest for the next incremental build."""
+        self.output_path.mkdir(parents=True, exist_ok=True)
+        with open(self.path, 'w', encoding='utf-8') as f:
+            json.dump({'files': self.entries, 'assets': self.assets, 'precache': self.precache,
+                       'failed_downloads': self.failed_downloads}, f, indent=1, sort_keys=True)
+
+    def summary(self) -> str:
+        return f"{self.copied} copied, {self.unchanged} unchanged, {self.removed} removed"
+
+
+def compile_module(source: bytes, filename: str, optimize: int = 0) -> bytes:
+    """Compile module source to the contents of an unchecked hash-based .pyc file (PEP 552).
+
+    Unchecked pycs are used as-is by the importer without stat-ing or hashing
+    the source, which is what we want inside an immutable bundle.
+    """
+    import importlib.util
+    import marshal
+    
+    code = compile(source, filename, 'exec', dont_inherit=True, optimize=optimize)
+    flags = 0b01  # hash-based, not validated against the source
+    return (importlib.util.MAGIC_NUMBER + flags.to_bytes(4, 'little')
+            + importlib.util.source_hash(source) + marshal.dumps(code))
+
+
+def import_roots(scripts_folder: str = "scripts") -> list:
+    """Return the folders absolute imports are resolved from in the page (see module_index)."""
+    if not os.path.exists(scripts_folder):
+        return [""]
+    return ["", os.path.relpath(scripts_folder, ".").replace(os.sep, "/")]
+
+
+def module_index(arcnames) -> dict:
+    """Map the name each bundled module is imported as to [archive path, is package].
+
+    py_html and py_dom modules keep their package names, while modules in the
+    scripts folder are top-level (scripts/ui/modal.py is ui.modal), as are the
+    modules of a bundle built without a scripts folder. Precompiled __pycache__
+    entries are found next to their source by the importer.
+    """
+    index = {}
+    for arcname in sorted(arcnames):
+        if "__pycache__/" in arcname:
+            continue
+        stem = arcname[:-4] if arcname.endswith(".pyc") else arcname[:-3]
+        if stem.startswith("scripts/"):
+            stem = stem[len("scripts/"):]
+        parts = stem.split("/")
+        is_package = parts[-1] == "__init__"
+        if is_package:
+            parts.pop()
+        if parts:
+            index.setdefault(".".join(parts), [arcname, is_package])
+    return index
+
+
+def bundle_modules(scripts_folder: str = "scripts", keep=(), tree_shake: bool = True) -> list:
+    """Return the Python files that go into the application bundle.
+
+    With tree_shake=True only the modules reachable from the entry point
+    (scripts/main.py) through static imports ship, plus PAGE_MODULES, the modules
+    named in keep (dotted names, as imported in the page) and whatever they
+    import. Without an entry point, or with tree_shake=False, every module ships.
+    """
+    import glob
+    from .dependencies import find_module, iter_python_files, reachable_modules
+    
+    if os.path.exists(scripts_folder):
+        files = list(iter_python_files([scripts_folder]))
+        entry = os.path.relpath(os.path.join(scripts_folder, "main.py"), ".").replace(os.sep, "/")
+    else:
+        files = sorted(glob.glob("*.py"))
+        entry = "main.py"
+    files += iter_python_files(["py_html", "py_dom"])
+    roots = import_roots(scripts_folder)
+    if not tree_shake or entry not in files:
+        return files
+    
+    entries = [entry]
+    for name in (*PAGE_MODULES, *keep):
+        for root in roots:
+            found = find_module(name, root, files)
+            if found:
+                entries += found
+                break
+        else:
+            print(f"Warning: module {name!r} in the bundle keep-list was not found")
+    
+    reached = reachable_modules(entries, files, roots)
+    print(f"Bundling {len(reached)} of {len(files)} modules reachable from {entry}")
+    return [path for path in files if path in reached]
+
+
+def bundle_sources(scripts_folder: str = "scripts", modules=None) -> list:
+    """Return (path, archive name) for every module that goes into the bundle.
+
+    modules restricts them to those files (see bundle_modules).
+    """
+    import glob
+    from .dependencies import iter_python_files
+    
+    if os.path.exists(scripts_folder):
+        sources = [(path, "scripts/" + os.path.relpath(path, scripts_folder).replace(os.sep, "/"))
+                   for path in iter_python_files([scripts_folder])]
+    else:
+        # Fall back to current directory if scripts folder doesn't exist
+        sources = [(path, path) for path in sorted(glob.glob("*.py"))]
+    sources += [(path, path) for path in iter_python_files(["py_html", "py_dom"])]
+    if modules is not None:
+        modules = set(modules)
+        sources = [(path, arcname) for path, arcname in sources if path in modules]
+    return sources
+
+
+def package_index(scripts_folder: str, lock: dict, modules=None) -> dict:
+    """Return the Pyodide packages the bundled modules need, for py_dom.loader.
+
+    The result maps "imports" to {top-level import name: package} for every
+    package import in the bundle, and "modules" to {module name: [packages]}
+    for every module that needs a package, directly or through the app modules
+    it imports, so the packages can be loaded before the module is imported.
+    """
+    from .dependencies import closure, import_graph, import_providers, scan_imports
+    
+    sources = bundle_sources(scripts_folder, modules)
+    paths = [path for path, _ in sources]
+    module_names = {arcname: name for name, (arcname, _) in module_index(arcname for _, arcname in sources).items()}
+    graph = import_graph(paths, paths, import_roots(scripts_folder))
+    providers = import_providers(lock)
+    
+    imports = {}
+    direct = {}
+    for path in paths:
+        names = [name for name in scan_imports(path) if name in providers]
+        imports.update((name, providers[name]) for name in names)
+        direct[path] = {providers[name] for name in names}
+    
+    needs = {}
+    for path, arcname in sources:
+        packages = set().union(*(direct[imported] for imported in closure(graph, path)))
+        if packages and arcname in module_names:
+            needs[module_names[arcname]] = sorted(packages)
+    return {"imports": dict(sorted(imports.items())), "modules": dict(sorted(needs.items()))}
+
+
+def build_bundle(scripts_folder: str = "scripts", bytecode: bool = False, release: bool = False,
+                 map_func=map, modules=None, packages: dict = None) -> bytes:
+    """Pack every application Python module into a single zip archive.
+
+    Archive paths mirror the source layout (py_html/, py_dom/, scripts/) and
+    timestamps are fixed, so unchanged sources always produce identical bytes.
+    The archive also holds the module index (see module_index) that the page's
+    importer looks modules up in, and the package index (see package_index) if
+    packages is given.
+
+    With bytecode=True each module also gets a precompiled __pycache__ entry for the
+    running interpreter, which must match the Python version of the bundled Pyodide.
+    With release=True modules are compiled with docstrings and asserts stripped and
+    shipped as sourceless .pyc files only.
+
+    Modules are compiled through map_func, which can be a process pool's map.
+    modules restricts the bundle to those files (see bundle_modules).
+    """
+    import io
+    import sys
+    import zipfile
+    
+    files = {}
+    compiled = []  # (archive name, source, filename) for every module to compile
+    for path, arcname in bundle_sources(scripts_folder, modules):
+        with open(path, 'rb') as f:
+            source = f.read()
+        if release:
+            compiled.append((arcname[:-3] + ".pyc", source, "/" + arcname))
+            continue
+        files[arcname] = source
+        if bytecode:
+            folder, name = os.path.split(arcname)
+            cached = f"{folder}/__pycache__/{name[:-3]}.{sys.implementation.cache_tag}.pyc"
+            compiled.append((cached.lstrip("/"), source, "/" + arcname))
+    
+    if compiled:
+        names, module_sources, filenames = zip(*compiled)
+        optimize = [2 if release else 0] * len(compiled)
+        files.update(zip(names, map_func(compile_module, module_sources, filenames, optimize)))
+    files[MODULE_INDEX_NAME] = json.dumps(module_index(files), sort_keys=True).encode('utf-8')
+    if packages is not None:
+        files[PACKAGE_INDEX_NAME] = json.dumps(packages).encode('utf-8')
+    
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, 'w', zipfile.ZIP_DEFLATED) as bundle:
+        for arcname in sorted(files):
+            info = zipfile.ZipInfo(arcname, date_time=(1980, 1, 1, 0, 0, 0))
+            info.compress_type = zipfile.ZIP_DEFLATED
+            info.external_attr = 0o644 << 16
+            bundle.writestr(info, files[arcname])
+    return buffer.getvalue()
+
+
+def fetch_vendor_assets(vendor_folder: str = CODEMIRROR_VENDOR, download: bool = True) -> bool:
+    """Download any CodeMirror files missing from vendor_folder. Returns True if all are present.
+
+    The vendor folder is meant to be committed; this only fills it in the first time.
+    Every file is checked against the VENDOR_CHECKSUMS file in the folder, and a
+    mismatch raises ValueError, failing the build. The first complete download
+    writes that file, to be committed with the folder. With download=False
+    missing files are only reported.
+    """
+    import urllib.request
+    
+    folder = Path(vendor_folder)
+    checksums_path = folder / VENDOR_CHECKSUMS
+    expected = {}
+    if checksums_path.exists():
+        with open(checksums_path, 'r', encoding='utf-8') as f:
+            for line in f:
+                if line.strip():
+                    digest, name = line.split(maxsplit=1)
+                    expected[name.strip()] = digest
     
+    for name in CODEMIRROR_FILES:
+        path = folder / name
+        if path.exists():
+            continue
+        if not download:
+            return False
+        try:
+            with urllib.request.urlopen(CODEMIRROR_CDN + name, timeout=10) as response:
+                data = response.read()
+        except OSError as e:
+            print(f"Warning: could not download CodeMirror ({e}); the editor will load it from the CDN "
+                  f"and will not work offline until {vendor_folder} is committed")
+            return False
+        if name in expected and hashlib.sha256(data).hexdigest() != expected[name]:
+            raise ValueError(f"Downloaded {name} does not match its SHA-256 in {checksums_path}")
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path, 'wb') as f:
+            f.write(data)
+        print(f"Downloaded {name} to {vendor_folder}")
+    
+    digests = {name: _file_digest(folder / name) for name in CODEMIRROR_FILES}
+    for name, digest in digests.items():
+        if name in expected and digest != expected[name]:
+            raise ValueError(f"{folder / name} does not match its SHA-256 in {checksums_path}")
+    if not checksums_path.exists():
+        with open(checksums_path, 'w', encoding='utf-8') as f:
+            f.writelines(f"{digest}  {name}\n" for name, digest in digests.items())
+        print(f"Wrote {checksums_path}; commit it with {vendor_folder}")
+    return True
+
+
+def prepare_output(output_folder: str, incremental: bool = True) -> BuildManifest:
+    """Create the output folder and return the manifest of the previous build.
+
+    incremental=False empties the output folder first, including files that no
+    build manifest records (such as the output of older build layouts).
+    """
     output_path = Path(output_folder)
     
     # Create output directory
     output_path.mkdir(parents=True, exist_ok=True)
     print(f"Created output directory: {output_path}")
     
-    # Copy pyodide folder if it exists
-    if os.path.exists("pyodide"):
-        pyodide_dest = output_path / "pyodide"
-        if pyodide_dest.exists():
-            shutil.rmtree(pyodide_dest)
-        shutil.copytree("pyodide", pyodide_dest)
-        print(f"Copied pyodide folder to {pyodide_dest}")
-    
-    # Copy py_html folder
-    if os.path.exists("py_html"):
-        py_html_dest = output_path / "py_html"
-        if py_html_dest.exists():
-            shutil.rmtree(py_html_dest)
-        shutil.copytree("py_html", py_html_dest)
-        print(f"Copied py_html folder to {py_html_dest}")
-    
-    # Copy py_dom folder
-    if os.path.exists("py_dom"):
-        py_dom_dest = output_path / "py_dom"
-        if py_dom_dest.exists():
-            shutil.rmtree(py_dom_dest)
-        shutil.copytree("py_dom", py_dom_dest)
-        print(f"Copied py_dom folder to {py_dom_dest}")
-    
-    # Copy scripts folder
-    if os.path.exists(scripts_folder):
-        scripts_dest = output_path / "scripts"
-        if scripts_dest.exists():
-            shutil.rmtree(scripts_dest)
-        shutil.copytree(scripts_folder, scripts_dest)
-        print(f"Copied {scripts_folder} folder to {scripts_dest}")
+    if not incremental:
+        for path in output_path.iterdir():
+            if path.is_dir() and not path.is_symlink():
+                shutil.rmtree(path)
+            else:
+                path.unlink()
     
-    return f"Environment setup complete in {output_path}"
+    return BuildManifest(output_path)
 
-def build_page(filename: str, scripts_folder: str = "scripts", additional_directories: list = None) -> str:
-    """Generate HTML file with PyHTML environment setup."""
-    import os
-    import glob
-    from pathlib import Path
+
+def required_pyodide_files(scripts_folder: str = "scripts", extra_packages=(), modules=None):
+    """Return (lock, file names) for the Pyodide runtime and the packages the app imports.
+
+    Only the imports of modules are considered when it is given (see
+    bundle_modules). Both are None when there is no Pyodide runtime to ship.
+    """
+    from .dependencies import collect_imports, scan_imports, load_pyodide_lock, resolve_packages, pyodide_files
+    
+    lock = load_pyodide_lock("pyodide")
+    if not lock:
+        return None, None
+    if modules is not None:
+        imports = set().union(*map(scan_imports, modules))
+    else:
+        imports = collect_imports([scripts_folder, "py_html", "py_dom"])
+    packages = resolve_packages(imports, lock, extra_packages)
+    print(f"Pyodide packages required: {sorted(packages) or 'none'}")
+    return lock, pyodide_files(lock, packages)
+
+
+def sync_pyodide(manifest: BuildManifest, lock: dict = None, needed=None, prune: bool = True) -> str:
+    """Mirror the Pyodide runtime into a fingerprinted folder and return its name.
+
+    With prune=True only the files in needed are copied.
+    """
+    pyodide_folder = "pyodide"
+    if not os.path.exists("pyodide"):
+        return pyodide_folder
+    
+    # The lock file pins the release and every package's sha256, so it identifies the runtime
+    if lock:
+        pyodide_folder = fingerprint("pyodide", _file_digest("pyodide/pyodide-lock.json"), folder=True)
+    include = (lambda rel: rel in needed) if prune and needed is not None else None
+    
+    # The Pyodide runtime never changes between builds, so it is hardlinked where possible
+    manifest.sync_tree("pyodide", pyodide_folder, link=True, include=include)
+    manifest.assets["pyodide/"] = pyodide_folder + "/"
+    # Runtime folders from other Pyodide releases (or from before fingerprinting)
+    for path in manifest.output_path.glob("pyodide*"):
+        if path.is_dir() and path.name != pyodide_folder:
+            shutil.rmtree(path)
+    print(f"Synced pyodide folder to {manifest.output_path / pyodide_folder}")
+    return pyodide_folder
+
+
+def sync_vendor(manifest: BuildManifest):
+    """Mirror the vendored CodeMirror into a fingerprinted folder; None if it is unavailable.
+
+    A failed download is recorded in the manifest and not retried for
+    VENDOR_RETRY_SECONDS, so offline builds do not wait for the timeout every
+    time; a clean build (which starts without a manifest) retries at once.
+    """
+    # Vendored CodeMirror, served next to the app instead of from a CDN
+    failed = manifest.failed_downloads.get(CODEMIRROR_VENDOR)
+    retry = failed is None or time.time() - failed >= VENDOR_RETRY_SECONDS
+    if not fetch_vendor_assets(CODEMIRROR_VENDOR, download=retry):
+        if retry:
+            manifest.failed_downloads[CODEMIRROR_VENDOR] = time.time()
+        else:
+            print("Skipped downloading CodeMirror, which failed recently; the editor will load it from the CDN")
+        return None
+    manifest.failed_downloads.pop(CODEMIRROR_VENDOR, None)
+    vendor_folder = fingerprint(CODEMIRROR_VENDOR, _tree_digest(CODEMIRROR_VENDOR), folder=True)
+    manifest.sync_tree(CODEMIRROR_VENDOR, vendor_folder, include=lambda rel: rel != VENDOR_CHECKSUMS)
+    manifest.assets[CODEMIRROR_VENDOR + "/"] = vendor_folder + "/"
+    print(f"Synced {CODEMIRROR_VENDOR} to {manifest.output_path / vendor_folder}")
+    return vendor_folder
+
+
+def write_bundle(manifest: BuildManifest, scripts_folder: str = "scripts", lock: dict = None,
+                 bytecode: bool = False, release: bool = False, map_func=map, modules=None) -> str:
+    """Build the application bundle, write it under its fingerprinted name and return that name.
+
+    Bytecode is only produced when the build interpreter has the same Python
+    version as the bundled Pyodide. map_func and modules are passed to build_bundle,
+    along with the package index when there is a Pyodide runtime.
+    """
+    import sys
+    
+    # .pyc files are only loadable by the exact Python version they were compiled with
+    if (bytecode or release) and lock:
+        target = tuple(int(part) for part in lock['info']['python'].split('.')[:2])
+        if sys.version_info[:2] != target:
+            print(f"Warning: bytecode needs Python {target[0]}.{target[1]} to match Pyodide, "
+                  f"but the build is running on {sys.version_info[0]}.{sys.version_info[1]}; "
+                  "shipping sources instead")
+            bytecode = release = False
     
-    # Get all Python files from scripts folder
-    python_files = []
+    # py_html, py_dom and the scripts ship as one archive fetched in a single request
+    packages = package_index(scripts_folder, lock, modules) if lock else None
+    bundle = build_bundle(scripts_folder, bytecode, release, map_func, modules, packages)
+    bundle_name = fingerprint(BUNDLE_NAME, hashlib.sha256(bundle).hexdigest())
+    # A manifest carried over from the last build still lists the bundle this one replaces
+    previous_name = manifest.assets.get(BUNDLE_NAME)
+    if previous_name and previous_name != bundle_name:
+        manifest.entries.pop(previous_name, None)
+    manifest.assets[BUNDLE_NAME] = bundle_name
+    if manifest.write_file(bundle_name, bundle):
+        print(f"Wrote application bundle {manifest.output_path / bundle_name}")
+    return bundle_name
+
+
+def finish_environment(manifest: BuildManifest, needed=None) -> str:
+    """Record the precache list, delete stale files and save the manifest."""
+    pyodide_folder = manifest.assets.get("pyodide/", "pyodide/").rstrip("/")
+    
+    # The service worker precaches everything except Pyodide packages the app never imports
+    manifest.precache = sorted(
+        rel_path for rel_path in manifest.entries
+        if needed is None or not rel_path.startswith(pyodide_folder + "/")
+        or rel_path[len(pyodide_folder) + 1:] in needed
+    )
+    
+    manifest.remove_stale()
+    manifest.save()
+    
+    return f"Environment setup complete in {manifest.output_path} ({manifest.summary()})"
+
+
+def init_environment(output_folder: str, scripts_folder: str = "scripts", incremental: bool = True,
+                     prune_pyodide: bool = True, extra_packages=(), bytecode: bool = False,
+                     release: bool = False, keep_modules=(), tree_shake: bool = True) -> str:
+    """Setup complete PyHTML environment by copying all necessary files to output folder.
+
+    The Pyodide runtime is mirrored into output_folder/pyodide.<hash> and the
+    py_html, py_dom and scripts modules the entry point imports (plus
+    keep_modules, see bundle_modules) are packed into a single app.<hash>.zip
+    bundle. Every name carries a digest of its content (the lock file for the
+    Pyodide runtime), so browsers can cache them forever; the mapping from plain
+    to fingerprinted names is saved in the build manifest for build_page.
+
+    With incremental=True only files that changed since the last build are copied
+    (hardlinked for the Pyodide runtime), and files that were removed from the
+    sources are deleted from the output. incremental=False wipes the copied folders
+    and starts from scratch.
+
+    With prune_pyodide=True only the Pyodide core runtime and the wheels needed by
+    the app's imports (plus extra_packages, for dynamic imports) are copied.
+
+    bytecode and release are passed to build_bundle. Bytecode is only produced when
+    the build interpreter has the same Python version as the bundled Pyodide.
+
+    This runs every step serially; build.py runs the same steps as a BuildPipeline.
+    """
+    manifest = prepare_output(output_folder, incremental)
+    modules = bundle_modules(scripts_folder, keep_modules, tree_shake)
+    lock, needed = required_pyodide_files(scripts_folder, extra_packages, modules)
+    sync_pyodide(manifest, lock, needed, prune_pyodide)
+    sync_vendor(manifest)
+    write_bundle(manifest, scripts_folder, lock, bytecode, release, modules=modules)
+    return finish_environment(manifest, needed)
+
+
+# Service worker that precaches the files needed to boot and serves them cache-first.
+# __PRECACHE__ and __PAGE__ are filled in by build_service_worker.
+SERVICE_WORKER_TEMPLATE = """// Generated by build.py; changes are overwritten on the next build.
+// Every build precaches into its own cache, so installing an update never
+// touches the cache the active worker is serving from
+const CACHE_PREFIX = 'sci-ux-precache';
+const CACHE_NAME = `${CACHE_PREFIX}-__VERSION__`;
+const REVISIONS_KEY = '__sci-ux-revisions__';
+
+// [url, revision] for every file the app needs to boot, relative to this script
+const PRECACHE = __PRECACHE__;
+const PAGE = '__PAGE__';
+
+const absolute = (url) => new URL(url, self.location).href;
+const precached = new Set(PRECACHE.map(([url]) => absolute(url)));
+const scope = new URL('./', self.location).pathname;
+
+async function cachedRevisions(cache) {
+    const response = await cache.match(absolute(REVISIONS_KEY));
+    return response ? response.json() : {};
+}
+
+async function earlierCaches() {
+    const names = await caches.keys();
+    return names.filter((name) => name.startsWith(CACHE_PREFIX) && name !== CACHE_NAME);
+}
+
+// Navigations the page answers: the scope root, the page and dotless paths (every asset URL has a dot)
+function isAppRoute(url) {
+    if (url.origin !== self.location.origin || !url.pathname.startsWith(scope)) {
+        return false;
+    }
+    const path = url.pathname.slice(scope.length);
+    return path === PAGE || !path.includes('.');
+}
+
+// The page is fetched network-first so a new build is picked up; the cached one keeps it working offline
+async function pageResponse() {
+    try {
+        const response = await fetch(absolute(PAGE), { cache: 'no-cache' });
+        if (response.ok) {
+            return response;
+        }
+    } catch (error) {
+        // Offline: fall back to the cached page
+    }
+    const cache = await caches.open(CACHE_NAME);
+    return (await cache.match(absolute(PAGE))) || fetch(absolute(PAGE));
+}
+
+self.addEventListener('install', (event) => {
+    event.waitUntil((async () => {
+        const cache = await caches.open(CACHE_NAME);
+        // Entries whose revision did not change are copied from earlier builds instead of downloaded
+        const earlier = [];
+        for (const name of await earlierCaches()) {
+            const previous = await caches.open(name);
+            earlier.push([previous, await cachedRevisions(previous)]);
+        }
+        await Promise.all(PRECACHE.map(async ([url, revision]) => {
+            if (await cache.match(absolute(url))) {
+                return;
+            }
+            for (const [previous, revisions] of earlier) {
+                const response = revisions[absolute(url)] === revision && await previous.match(absolute(url));
+                if (response) {
+                    await cache.put(absolute(url), response);
+                    return;
+                }
+            }
+            const response = await fetch(absolute(url), { cache: 'reload' });
+            if (!response.ok) {
+                throw new Error(`Could not precache ${url}: ${response.status}`);
+            }
+            await cache.put(absolute(url), response);
+        }));
+        const revisions = Object.fromEntries(PRECACHE.map(([url, revision]) => [absolute(url), revision]));
+        await cache.put(absolute(REVISIONS_KEY), new Response(JSON.stringify(revisions), {
+            headers: { 'Content-Type': 'application/json' }
+        }));
+        await self.skipWaiting();
+    })());
+});
+
+self.addEventListener('activate', (event) => {
+    event.waitUntil((async () => {
+        // The caches of earlier builds are no longer served from
+        for (const name of await earlierCaches()) {
+            await caches.delete(name);
+        }
+        await self.clients.claim();
+    })());
+});
+
+self.addEventListener('fetch', (event) => {
+    const request = event.request;
+    if (request.method !== 'GET') {
+        return;
+    }
+    const url = new URL(request.url);
+    if (request.mode === 'navigate' ? isAppRoute(url) : url.href === absolute(PAGE)) {
+        event.respondWith(pageResponse());
+        return;
+    }
+    // Fingerprinted files never change, so they are served cache-first
+    if (request.mode === 'navigate' || !precached.has(request.url)) {
+        return;
+    }
+    event.respondWith((async () => {
+        const cache = await caches.open(CACHE_NAME);
+        return (await cache.match(request.url)) || fetch(request);
+    })());
+});
+"""
+
+
+def build_service_worker(manifest: dict, page_name: str, page_digest: str) -> str:
+    """Return the service worker script precaching the manifest's precache list and the page.
+
+    Entries are versioned by content digest, so an update only downloads the
+    files that changed since the version the browser has cached. The cache
+    is named after a digest of every entry, so each build has its own.
+    """
+    entries = [[rel_path, manifest['files'][rel_path]['sha256'][:12]]
+               for rel_path in manifest['precache'] if rel_path in manifest['files']]
+    entries.append([page_name, page_digest[:12]])
+    precache = "[\n" + ",\n".join(f"    {json.dumps(entry)}" for entry in entries) + "\n]"
+    version = hashlib.sha256(precache.encode('utf-8')).hexdigest()[:12]
+    return (SERVICE_WORKER_TEMPLATE
+            .replace('__PRECACHE__', precache)
+            .replace('__PAGE__', page_name)
+            .replace('__VERSION__', version))
+
+
+def boot_downloads(output_folder, pyodide_base: str, bundle_name: str):
+    """Return (href, preload attributes) for every download on the boot path, in the order they are needed.
+
+    pyodide.asm.js is injected as a classic script; everything else is
+    requested with fetch(), so those hints need crossorigin to be reused, and
+    package hints carry the integrity Pyodide checks wheels against. Files that
+    are missing from the output are skipped.
+    """
+    from .dependencies import load_pyodide_lock, resolve_packages
+    
+    hints = [
+        (pyodide_base + "pyodide.asm.js", 'as="script"'),
+        (pyodide_base + "pyodide.asm.wasm", 'as="fetch" type="application/wasm" crossorigin'),
+        (pyodide_base + "pyodide-lock.json", 'as="fetch" type="application/json" crossorigin'),
+        (pyodide_base + "python_stdlib.zip", 'as="fetch" crossorigin'),
+        (bundle_name, 'as="fetch" crossorigin'),
+    ]
+    lock = load_pyodide_lock("pyodide")
+    if lock:
+        for name in sorted(resolve_packages((), lock, BOOT_PACKAGES)):
+            package = lock['packages'][name]
+            integrity = base64.b64encode(bytes.fromhex(package['sha256'])).decode('ascii')
+            hints.append((pyodide_base + package['file_name'],
+                          f'as="fetch" crossorigin integrity="sha256-{integrity}"'))
+    
+    return [(href, attributes) for href, attributes in hints if (Path(output_folder) / href).is_file()]
+
+
+def preload_hints(output_folder, pyodide_base: str, bundle_name: str) -> str:
+    """Return <link rel="preload"> tags for the boot downloads (see boot_downloads).
+
+    Without them the browser only discovers the WebAssembly module, the standard
+    library, the lock file, the bundle and the boot packages once pyodide.js has run.
+    """
+    return "\n    ".join(f'<link rel="preload" href="{href}" {attributes}>'
+                          for href, attributes in boot_downloads(output_folder, pyodide_base, bundle_name))
+
+
+def build_page(filename: str, scripts_folder: str = "scripts", service_worker: bool = True,
+               live_reload: bool = False) -> str:
+    """Generate HTML file with PyHTML environment setup.
+
+    The page imports the app straight from the downloaded bundle through the
+    importer in py_dom/bundle.py, which is embedded in the page.
+
+    With service_worker=True a service worker that precaches the runtime, the
+    app bundle and the vendored assets is written next to the page, so repeat
+    visits boot from the cache and work offline. Otherwise the page unregisters
+    any service worker left by an earlier build.
+
+    With live_reload=True (build.py --watch) the page listens to the development
+    server's event stream: changed app modules are swapped into the running
+    interpreter through py_dom.hot, and any other change reloads the page.
+    """
+    # The entry point is imported as the "main" module, from source or bytecode
     if os.path.exists(scripts_folder):
-        for root, dirs, files in os.walk(scripts_folder):
-            for file in files:
-                if file.endswith(".py"):
-                    rel_path = os.path.relpath(os.path.join(root, file), ".")
-                    python_files.append(rel_path)
+        main_module = "main" if os.path.exists(os.path.join(scripts_folder, "main.py")) else ""
     else:
-        # Fall back to current directory if scripts folder doesn't exist
-        python_files = glob.glob("*.py")
-    
-    # Get all Python files from py_html module
-    py_html_files = []
-    if os.path.exists("py_html"):
-        for root, dirs, files in os.walk("py_html"):
-            for file in files:
-                if file.endswith(".py"):
-                    rel_path = os.path.relpath(os.path.join(root, file), ".")
-                    py_html_files.append(rel_path)
-    
-    # Get all Python files from py_dom module
-    py_dom_files = []
-    if os.path.exists("py_dom"):
-        for root, dirs, files in os.walk("py_dom"):
-            for file in files:
-                if file.endswith(".py"):
-                    rel_path = os.path.relpath(os.path.join(root, file), ".")
-                    py_dom_files.append(rel_path)
+        main_module = "main" if os.path.exists("main.py") else ""
+    
+    # A JS string literal that cannot end the surrounding <script> element
+    with open(BUNDLE_IMPORTER, 'r', encoding='utf-8') as f:
+        bundle_importer = json.dumps(f.read()).replace("</", "<\\/")
+    
+    # Assets are referenced by the fingerprinted names init_environment gave them
+    output_folder = Path(filename).parent
+    manifest = load_manifest(output_folder)
+    assets = manifest['assets']
+    pyodide_base = assets.get("pyodide/", "pyodide/")
+    bundle_name = assets.get(BUNDLE_NAME, BUNDLE_NAME)
+    
+    # CodeMirror comes from the output folder when it was vendored, otherwise from the CDN
+    codemirror_base = assets.get(CODEMIRROR_VENDOR + "/", CODEMIRROR_CDN)
+    
+    # The loader reports progress against the decoded size of every boot download:
+    # the bundle byte by byte, the runtime and packages Pyodide fetches once each is done
+    runtime_sizes = {href: (output_folder / href).stat().st_size
+                     for href, _ in boot_downloads(output_folder, pyodide_base, bundle_name)
+                     if href != bundle_name}
+    bundle_path = output_folder / bundle_name
+    bundle_size = bundle_path.stat().st_size if bundle_path.exists() else 0
+    boot_size = bundle_size + sum(runtime_sizes.values())
+    
+    # Registered once the page has loaded so it does not compete with the boot downloads
+    if service_worker:
+        sw_registration = f"""if ('serviceWorker' in navigator) {{
+            window.addEventListener('load', () => {{
+                navigator.serviceWorker.register('{SERVICE_WORKER_NAME}').catch((error) => {{
+                    console.warn('Service worker not registered:', error);
+                }});
+            }});
+        }}"""
+    else:
+        sw_registration = """if ('serviceWorker' in navigator) {
+            navigator.serviceWorker.getRegistrations().then((registrations) => {
+                registrations.forEach((registration) => registration.unregister());
+            });
+        }"""
+    
+    # Watch mode client for the events published by build.py --watch
+    live_reload_client = ""
+    if live_reload:
+        from .server import LIVE_RELOAD_PATH
+        live_reload_client = f"""// Watch mode: changed modules are swapped in, anything else reloads the page
+        function connectLiveReload() {{
+            const events = new EventSource('{LIVE_RELOAD_PATH}');
+            events.addEventListener('reload', () => location.reload());
+            events.addEventListener('modules', async (event) => {{
+                const pyodide = window.sciUxPyodide;
+                if (!pyodide || !window.sciUxStarted) {{
+                    location.reload();
+                    return;
+                }}
+                const {{ bundle, modules }} = JSON.parse(event.data);
+                try {{
+                    const response = await fetch(bundle);
+                    if (!response.ok) {{
+                        throw new Error(`Could not load ${{bundle}}: ${{response.status}}`);
+                    }}
+                    const importer = pyodide.pyimport('py_dom.bundle');
+                    importer.install(new Uint8Array(await response.arrayBuffer()));
+                    importer.destroy();
+                    await pyodide.runPythonAsync(`
+                        from py_dom.hot import reload_modules
+                        reload_modules(${{JSON.stringify(modules)}})
+                    `);
+                    console.log('Hot-swapped', modules);
+                }} catch (error) {{
+                    console.error('Hot swap failed, reloading the page:', error);
+                    location.reload();
+                }}
+            }});
+        }}
+        
+        connectLiveReload();"""
     
     # Generate the HTML template
     html_content = f'''<!DOCTYPE html>
@@ -87,20 +993,8 @@ def build_page(filename: str, scripts_folder: str = "scripts", additional_direct
     <meta charset="UTF-8">
     <meta name="viewport" content="width=device-width, initial-scale=1.0">
     <title>Python UX Application</title>
-    <script src="pyodide/pyodide.js"></script>
-    
-    <!-- CodeMirror CSS and JS -->
-    <link rel="stylesheet" href="https://cdnjs.cloudflare.com/ajax/libs/codemirror/5.65.16/codemirror.min.css">
-    <link rel="stylesheet" href="https://cdnjs.cloudflare.com/ajax/libs/codemirror/5.65.16/theme/default.min.css">
-    <script src="https://cdnjs.cloudflare.com/ajax/libs/codemirror/5.65.16/codemirror.min.js"></script>
-    <script src="https://cdnjs.cloudflare.com/ajax/libs/codemirror/5.65.16/mode/python/python.min.js"></script>
-    <script src="https://cdnjs.cloudflare.com/ajax/libs/codemirror/5.65.16/mode/javascript/javascript.min.js"></script>
-    <script src="https://cdnjs.cloudflare.com/ajax/libs/codemirror/5.65.16/mode/htmlmixed/htmlmixed.min.js"></script>
-    <script src="https://cdnjs.cloudflare.com/ajax/libs/codemirror/5.65.16/mode/css/css.min.js"></script>
-    <script src="https://cdnjs.cloudflare.com/ajax/libs/codemirror/5.65.16/mode/markdown/markdown.min.js"></script>
-    <script src="https://cdnjs.cloudflare.com/ajax/libs/codemirror/5.65.16/mode/xml/xml.min.js"></script>
-    <script src="https://cdnjs.cloudflare.com/ajax/libs/codemirror/5.65.16/addon/edit/matchbrackets.min.js"></script>
-    <script src="https://cdnjs.cloudflare.com/ajax/libs/codemirror/5.65.16/addon/edit/closebrackets.min.js"></script>
+    {preload_hints(output_folder, pyodide_base, bundle_name)}
+    <script src="{pyodide_base}pyodide.js"></script>
     
     <style>
         body {{
@@ -118,139 +1012,179 @@ def build_page(filename: str, scripts_folder: str = "scripts", additional_direct
             margin: 0 auto;
             display: none;
         }}
-        .spinner {{
-            border: 4px solid #f3f3f3;
-            border-top: 4px solid #3498db;
-            border-radius: 50%;
-            width: 40px;
-            height: 40px;
-            animation: spin 2s linear infinite;
-            margin: 0 auto;
+        #loading-progress {{
+            width: 320px;
+            max-width: 80%;
+            height: 8px;
         }}
-        @keyframes spin {{
-            0% {{ transform: rotate(0deg); }}
-            100% {{ transform: rotate(360deg); }}
+        #loading-bytes {{
+            color: #888;
+            font-size: 13px;
         }}
     </style>
 </head>
 <body>
     <div id="loading">
-        <div class="spinner"></div>
-        <p>Loading Python environment...</p>
+        <progress id="loading-progress" max="{boot_size}" value="0"></progress>
+        <p id="loading-status">Loading Python environment...</p>
+        <p id="loading-bytes"></p>
     </div>
     
     <div id="content"></div>
 
     <script>
-        async function initializeApp() {{
+        // Base URLs for assets that Python code loads on demand (see py_dom.assets)
+        window.sciUxAssets = {{ codemirror: "{codemirror_base}" }};
+        
+        // Per-phase timings, also recorded as performance measures named "sci-ux:<phase>"
+        const loadTimings = {{}};
+        window.sciUxLoadTimings = loadTimings;
+        
+        function setStatus(text) {{
+            const status = document.getElementById('loading-status');
+            if (status) {{
+                status.textContent = text;
+            }}
+        }}
+        
+        async function timed(phase, promise) {{
+            const start = performance.now();
+            performance.mark(`sci-ux:${{phase}}:start`);
             try {{
-                // Initialize Pyodide with local installation
-                const pyodide = await loadPyodide({{
-                    indexURL: "./pyodide/"
-                }});
-                
-                // Install required packages
-                await pyodide.loadPackage(['micropip']);
-                
-                // Load and mount py_html module files
-                const pyHtmlFiles = {py_html_files};
-                
-                // Load and mount py_dom module files
-                const pyDomFiles = {py_dom_files};
-                
-                // Create py_html module structure in Pyodide
-                pyodide.FS.mkdir('/py_html');
-                pyodide.FS.mkdir('/py_html/macros');
-                pyodide.FS.mkdir('/py_html/styles');
-                
-                // Create py_dom module structure in Pyodide
-                pyodide.FS.mkdir('/py_dom');
-                
-                // Create scripts module structure in Pyodide
-                pyodide.FS.mkdir('/scripts');
-                
-                // Create additional directories dynamically
-                const additionalDirs = {additional_directories or []};
-                for (const dir of additionalDirs) {{
-                    try {{
-                        pyodide.FS.mkdir(dir);
-                        console.log(`Created directory: ${{dir}}`);
-                    }} catch (error) {{
-                        console.warn(`Could not create directory ${{dir}}:`, error);
-                    }}
-                }}
-                
-                // Load each py_html file
-                for (const file of pyHtmlFiles) {{
-                    try {{
-                        const response = await fetch(file);
-                        const content = await response.text();
-                        pyodide.FS.writeFile(`/${{file}}`, content);
-                        console.log(`Loaded ${{file}}`);
-                    }} catch (error) {{
-                        console.warn(`Could not load ${{file}}:`, error);
-                    }}
+                return await promise;
+            }} finally {{
+                loadTimings[phase] = Math.round(performance.now() - start);
+                performance.measure(`sci-ux:${{phase}}`, `sci-ux:${{phase}}:start`);
+            }}
+        }}
+        
+        // Byte-level progress across the boot downloads
+        const progress = {{ loaded: 0, total: {boot_size} }};
+        
+        function reportProgress(bytes) {{
+            progress.loaded += bytes;
+            const bar = document.getElementById('loading-progress');
+            const label = document.getElementById('loading-bytes');
+            if (bar) {{
+                bar.max = Math.max(progress.total, progress.loaded);
+                bar.value = progress.loaded;
+            }}
+            if (label) {{
+                const kb = (n) => (n / 1024).toFixed(0);
+                label.textContent = `${{kb(progress.loaded)}} / ${{kb(Math.max(progress.total, progress.loaded))}} KB`;
+            }}
+        }}
+        
+        async function fetchWithProgress(url) {{
+            const response = await fetch(url);
+            if (!response.ok) {{
+                throw new Error(`Could not load ${{url}}: ${{response.status}}`);
+            }}
+            if (!response.body) {{
+                const buffer = new Uint8Array(await response.arrayBuffer());
+                reportProgress(buffer.length);
+                return buffer;
+            }}
+            // Stream the body so progress is reported as bytes arrive
+            const reader = response.body.getReader();
+            const chunks = [];
+            let received = 0;
+            while (true) {{
+                const {{ done, value }} = await reader.read();
+                if (done) {{
+                    break;
                 }}
-                
-                // Load each py_dom file
-                for (const file of pyDomFiles) {{
-                    try {{
-                        const response = await fetch(file);
-                        const content = await response.text();
-                        pyodide.FS.writeFile(`/${{file}}`, content);
-                        console.log(`Loaded ${{file}}`);
-                    }} catch (error) {{
-                        console.warn(`Could not load ${{file}}:`, error);
+                chunks.push(value);
+                received += value.length;
+                reportProgress(value.length);
+            }}
+            const buffer = new Uint8Array(received);
+            let offset = 0;
+            for (const chunk of chunks) {{
+                buffer.set(chunk, offset);
+                offset += chunk.length;
+            }}
+            return buffer;
+        }}
+        
+        // Pyodide fetches the runtime and packages itself, so each counts once its resource entry appears
+        const runtimeSizes = new Map(Object.entries({json.dumps(runtime_sizes)})
+            .map(([href, size]) => [new URL(href, document.baseURI).href, size]));
+        if (runtimeSizes.size && window.PerformanceObserver) {{
+            const observer = new PerformanceObserver((list) => {{
+                for (const entry of list.getEntries()) {{
+                    const size = runtimeSizes.get(entry.name);
+                    if (size !== undefined) {{
+                        runtimeSizes.delete(entry.name);
+                        reportProgress(size);
                     }}
                 }}
-                
-                // Load Python files from scripts folder
-                const pythonFiles = {python_files};
-                for (const file of pythonFiles) {{
-                    try {{
-                        const response = await fetch(file);
-                        const content = await response.text();
-                        pyodide.FS.writeFile(`/${{file}}`, content);
-                        console.log(`Loaded ${{file}}`);
-                    }} catch (error) {{
-                        console.warn(`Could not load ${{file}}:`, error);
-                    }}
+                if (!runtimeSizes.size) {{
+                    observer.disconnect();
                 }}
+            }});
+            observer.observe({{ type: 'resource', buffered: true }});
+        }}
+        
+        async function initializeApp() {{
+            try {{
+                const total = performance.now();
                 
-                // Add py_html, py_dom and scripts to Python path
-                let pythonPathSetup = `
-                    import sys
-                    sys.path.insert(0, '/py_html')
-                    sys.path.insert(0, '/py_dom')
-                    sys.path.insert(0, '/scripts')`;
+                // Start downloading the app bundle while Pyodide boots
+                const bundlePromise = timed('fetch bundle', fetchWithProgress('{bundle_name}'));
+                // Awaited below; until then a failed download must not be reported as unhandled
+                bundlePromise.catch(() => {{}});
                 
-                // Add additional directories to Python path
-                for (const dir of additionalDirs) {{
-                    pythonPathSetup += `
-                    sys.path.insert(0, '${{dir}}')`;
-                }}
+                // Initialize Pyodide with local installation
+                setStatus('Starting Python...');
+                const pyodide = await timed('boot pyodide', loadPyodide({{
+                    indexURL: "./{pyodide_base}"
+                }}));
+                // Kept for the watch mode client, and handy in the browser console
+                window.sciUxPyodide = pyodide;
                 
-                pythonPathSetup += `
-                    sys.path.insert(0, '/')
-                    print("Python path updated with py_html, py_dom and scripts (including detected subdirectories)")
-                `;
+                // Install required packages while the app is loaded
+                const packagesPromise = timed('load packages', pyodide.loadPackage({json.dumps(list(BOOT_PACKAGES))}));
                 
-                await pyodide.runPython(pythonPathSetup);
+                // Import py_html, py_dom and the scripts from the bundle in memory (py_dom/bundle.py)
+                setStatus('Loading application...');
+                const bundle = await bundlePromise;
+                await timed('install bundle', Promise.resolve().then(() => {{
+                    const globals = pyodide.toPy({{}});
+                    const installBundle = pyodide.runPython(`
+                        import sys, types
+                        def install_bundle(source, data):
+                            importer = types.ModuleType('py_dom.bundle')
+                            importer.__file__ = '/py_dom/bundle.py'
+                            exec(compile(source, importer.__file__, 'exec'), importer.__dict__)
+                            sys.modules[importer.__name__] = importer
+                            importer.install(data)
+                        install_bundle
+                    `, {{ globals }});
+                    installBundle({bundle_importer}, bundle);
+                    installBundle.destroy();
+                    globals.destroy();
+                }}));
+                await packagesPromise;
                 
-                // Look for and execute main.py from scripts folder or current directory
-                let mainScript = null;
-                if (pythonFiles.includes('{scripts_folder}/main.py')) {{
-                    mainScript = '{scripts_folder}/main.py';
-                }} else if (pythonFiles.includes('main.py')) {{
-                    mainScript = 'main.py';
+                // Execute main from the bundle (main.py, or main.pyc in release builds)
+                setStatus('Rendering...');
+                const mainModule = '{main_module}';
+                if (mainModule) {{
+                    // Imports of packages that are not loaded yet go through py_dom.loader's finder;
+                    // py_dom.hot keeps main's globals so a hot swap can tell when main uses a changed module
+                    await timed('run main', pyodide.runPythonAsync(`
+                        from py_dom.loader import install
+                        install()
+                        from py_dom.hot import run_main
+                        run_main('${{mainModule}}')
+                    `));
+                    console.log(`Executed ${{mainModule}}`);
                 }}
                 
-                if (mainScript) {{
-                    const response = await fetch(mainScript);
-                    const mainCode = await response.text();
-                    await pyodide.runPython(mainCode);
-                    console.log(`Executed ${{mainScript}}`);
-                }}
+                window.sciUxStarted = true;
+                loadTimings['total'] = Math.round(performance.now() - total);
+                console.table(loadTimings);
                 
                 // Hide loading and show content
                 const loadingElement = document.getElementById('loading');
@@ -271,8 +1205,12 @@ def build_page(filename: str, scripts_folder: str = "scripts", additional_direct
             }}
         }}
         
-        // Start loading when page is ready
-        window.addEventListener('DOMContentLoaded', initializeApp);
+        // The elements above are already parsed, so start loading immediately
+        initializeApp();
+        
+        {sw_registration}
+        
+        {live_reload_client}
     </script>
 </body>
 </html>'''
@@ -286,7 +1224,12 @@ def build_page(filename: str, scripts_folder: str = "scripts", additional_direct
     with open(filename, 'w', encoding='utf-8') as f:
         f.write(html_content)
     
+    sw_path = output_folder / SERVICE_WORKER_NAME
+    if service_worker:
+        page_digest = hashlib.sha256(html_content.encode('utf-8')).hexdigest()
+        with open(sw_path, 'w', encoding='utf-8') as f:
+            f.write(build_service_worker(manifest, Path(filename).name, page_digest))
+    elif sw_path.exists():
+        sw_path.unlink()
+    
     return f"Generated {filename}"
-
-
-
@@ -3,9 +3,66 @@ PyHTML Macros - High-level macros for common HTML patterns.
 
 This module provides convenient macros for generating common HTML structures
 like forms, layouts, UI components, and more.
+
+Submodules are imported the first time one of their macros is used (PEP 562),
+so importing the package itself costs almost nothing.
 """
 
-from .components import *
-from .forms import *
-from .layouts import *
-from .ui import *
\ No newline at end of file
+import importlib
+
+# Macro names exported by each submodule, in the order the submodules were
+# star-imported before; a name defined twice resolves to the first module
+_EXPORTS = {
+    'components': (
+        'document', 'page_template', 'breadcrumb', 'alert', 'badge', 'progress_bar',
+        'icon', 'button_group', 'dropdown', 'tabs', 'pagination',
+    ),
+    'forms': (
+        'form_group', 'text_field', 'email_field', 'password_field', 'textarea_field',
+        'select_field', 'checkbox_field', 'radio_field', 'file_field', 'hidden_field',
+        'submit_button', 'reset_button', 'form_actions', 'login_form', 'contact_form',
+        'search_form', 'inline_form',
+    ),
+    'layouts': (
+        'container', 'row', 'col', 'grid_layout', 'sidebar_layout', 'hero_section',
+        'card', 'navbar', 'footer', 'full_page_layout', 'dashboard_layout',
+    ),
+    'ui': (
+        'modal', 'accordion', 'carousel', 'tooltip', 'popover', 'offcanvas', 'toast',
+        'collapse', 'breadcrumb_advanced', 'timeline', 'spinner',
+    ),
+}
+
+_SUBMODULE_OF = {}
+for _module, _names in _EXPORTS.items():
+    for _name in _names:
+        _SUBMODULE_OF.setdefault(_name, _module)
+
+
+def __getattr__(name):
+    if name in _EXPORTS:
+        return importlib.import_module(f'.{name}', __name__)
+
+    if name == '__all__':
+        # Only star imports ask for this; they get every macro plus the HTML elements
+        elements = importlib.import_module('..elements', __name__)
+        value = [n for n in vars(elements) if not n.startswith('_')] + list(_SUBMODULE_OF)
+    elif name in _SUBMODULE_OF:
+        module = importlib.import_module(f'.{_SUBMODULE_OF[name]}', __name__)
+        value = getattr(module, name)
+    elif not name.startswith('__'):
+        # The macro modules re-export the HTML elements they are built from
+        elements = importlib.import_module('..elements', __name__)
+        try:
+            value = getattr(elements, name)
+        except AttributeError:
+            raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_EXPORTS) | set(_SUBMODULE_OF))
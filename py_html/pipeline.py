@@ -0,0 +1,91 @@
+"""A small task graph for the build, with a process pool for fan-out work."""
+import multiprocessing
+import os
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, ThreadPoolExecutor, wait
+
+# Below this many items the cost of starting worker processes outweighs the gain
+MIN_PARALLEL_ITEMS = 16
+
+
+class BuildPipeline:
+    """Named build steps run in dependency order, with independent steps run concurrently.
+
+    Steps themselves run on threads, since they mostly copy files or wait on
+    other work. CPU-bound per-item work inside a step (compiling modules,
+    compressing assets) goes through map(), which spreads it over a process pool
+    started the first time there is enough work for it. With workers=1 everything
+    runs serially in the calling process.
+    """
+
+    def __init__(self, workers: int = None):
+        self.workers = workers or os.cpu_count() or 1
+        self.steps = {}
+        self.timings = {}
+        self.results = {}
+        self.pool = None
+        self._pool_lock = threading.Lock()
+
+    def add(self, name: str, func, *args, after=(), **kwargs) -> str:
+        """Register func(*args, **kwargs) as a step that starts once the steps in after are done."""
+        for dependency in after:
+            if dependency not in self.steps:
+                raise ValueError(f"Step {name!r} depends on unknown step {dependency!r}")
+        self.steps[name] = (func, args, kwargs, tuple(after))
+        return name
+
+    def map(self, func, *iterables) -> list:
+        """Like map(), but spread over the process pool when there are enough items.
+
+        func must be a module-level function so it can be sent to another process.
+        """
+        iterables = [list(iterable) for iterable in iterables]
+        count = min((len(iterable) for iterable in iterables), default=0)
+        if self.workers == 1 or count < MIN_PARALLEL_ITEMS:
+            return list(map(func, *iterables))
+        with self._pool_lock:
+            if self.pool is None:
+                # Steps run on threads, and forking a threaded process is unsafe
+                methods = multiprocessing.get_all_start_methods()
+                context = multiprocessing.get_context("forkserver" if "forkserver" in methods else "spawn")
+                self.pool = ProcessPoolExecutor(max_workers=self.workers, mp_context=context)
+        chunksize = max(1, count // (self.workers * 4))
+        return list(self.pool.map(func, *iterables, chunksize=chunksize))
+
+    def run(self) -> dict:
+        """Run every step and return their results by name. The first failing step's error is raised."""
+        try:
+            with ThreadPoolExecutor(max_workers=max(len(self.steps), 1)) as threads:
+                pending = dict(self.steps)
+                running = {}
+                while pending or running:
+                    for name, (func, args, kwargs, after) in list(pending.items()):
+                        if all(dependency in self.results for dependency in after):
+                            del pending[name]
+                            running[threads.submit(self._run_step, name, func, args, kwargs)] = name
+                    if not running:
+                        raise RuntimeError(f"Build steps form a cycle: {sorted(pending)}")
+                    done, _ = wait(running, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        self.results[running.pop(future)] = future.result()
+        finally:
+            if self.pool is not None:
+                self.pool.shutdown()
+                self.pool = None
+        return self.results
+
+    def _run_step(self, name, func, args, kwargs):
+        start = time.perf_counter()
+        try:
+            return func(*args, **kwargs)
+        finally:
+            self.timings[name] = time.perf_counter() - start
+
+    def summary(self) -> str:
+        """Per-step wall-clock times, in the order the steps finished."""
+        width = max((len(name) for name in self.timings), default=0)
+        lines = [f"Build steps ({self.workers} worker{'s' if self.workers != 1 else ''}):"]
+        for name in self.results:
+            lines.append(f"  {name:<{width}}  {self.timings.get(name, 0):7.3f}s")
+        return "\n".join(lines)
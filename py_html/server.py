@@ -0,0 +1,337 @@
+"""A caching static file server for the build output (standard library only).
+
+Compared to python -m http.server it serves the .br/.gz siblings written by
+py_html.compression when the browser accepts them, answers Range requests,
+sends ETags and long-lived Cache-Control for content-fingerprinted files, and
+handles requests on a fixed thread pool. In watch mode it also streams
+rebuild notifications to the page as server-sent events.
+"""
+import email.utils
+import os
+import queue
+import re
+import shutil
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from http import HTTPStatus
+from http.server import HTTPServer, SimpleHTTPRequestHandler
+
+from .compression import ENCODINGS, is_fresh
+
+# Files whose name, or the name of a folder they are in, carries a content hash
+# (app.<hash>.zip, pyodide.<hash>/...; see py_html.environment.fingerprint) never change
+FINGERPRINT_PATTERN = re.compile(r'\.[0-9a-f]{12}(\.[^/]*)?(/|$)')
+
+IMMUTABLE_CACHE = "public, max-age=31536000, immutable"
+REVALIDATE_CACHE = "no-cache"
+
+# Server-sent events endpoint the page listens on in watch mode
+LIVE_RELOAD_PATH = "/__sci-ux/events"
+
+_RANGE_PATTERN = re.compile(r'^bytes=(\d*)-(\d*)$')
+
+
+def parse_accept_encoding(header: str) -> dict:
+    """Map each coding in an Accept-Encoding header to its q-value."""
+    codings = {}
+    for part in (header or "").split(','):
+        coding, _, params = part.strip().partition(';')
+        if not coding:
+            continue
+        q = 1.0
+        params = params.strip()
+        if params.startswith('q='):
+            try:
+                q = float(params[2:])
+            except ValueError:
+                q = 0.0
+        codings[coding.strip().lower()] = q
+    return codings
+
+
+def parse_range(header: str, size: int):
+    """Return (start, end) inclusive for a single-range header, or None if it cannot be satisfied.
+
+    Multiple ranges are not supported and are treated as unsatisfiable.
+    """
+    match = _RANGE_PATTERN.match((header or "").strip())
+    if not match:
+        return None
+    first, last = match.groups()
+    if not first:
+        if not last or int(last) == 0:
+            return None
+        # Suffix range: the last N bytes
+        return max(size - int(last), 0), size - 1
+    start = int(first)
+    end = min(int(last), size - 1) if last else size - 1
+    if start >= size or start > end:
+        return None
+    return start, end
+
+
+class StaticRequestHandler(SimpleHTTPRequestHandler):
+    """Serves files from a directory with compression, ranges and cache validation."""
+
+    protocol_version = "HTTP/1.1"
+    # Idle keep-alive connections give their worker back after this many seconds
+    timeout = 15
+
+    extensions_map = {
+        **SimpleHTTPRequestHandler.extensions_map,
+        '.wasm': 'application/wasm',
+        '.js': 'text/javascript',
+        '.mjs': 'text/javascript',
+        '.json': 'application/json',
+        '.map': 'application/json',
+        '.whl': 'application/zip',
+        '.zip': 'application/zip',
+        '.metadata': 'text/plain',
+    }
+
+    def do_GET(self):
+        f = self.send_head()
+        if f:
+            try:
+                self.copy_range(f)
+            finally:
+                f.close()
+
+    def do_HEAD(self):
+        f = self.send_head()
+        if f:
+            f.close()
+
+    def send_head(self):
+        self.range = None
+        path = self.translate_path(self.path)
+        if os.path.isdir(path):
+            index = os.path.join(path, "index.html")
+            if not self.path.split('?', 1)[0].endswith('/') or not os.path.isfile(index):
+                # Redirects and directory listings are left to the base class
+                return super().send_head()
+            path = index
+
+        if not os.path.isfile(path):
+            self.send_error(HTTPStatus.NOT_FOUND, "File not found")
+            return None
+
+        # Ranges are served from the original file, never from a compressed sibling
+        range_header = self.headers.get('Range')
+        encoding, served_path = None, path
+        if not range_header:
+            encoding, served_path = self.choose_encoding(path)
+
+        try:
+            f = open(served_path, 'rb')
+        except OSError:
+            self.send_error(HTTPStatus.NOT_FOUND, "File not found")
+            return None
+
+        try:
+            stat = os.fstat(f.fileno())
+            etag = f'"{stat.st_size:x}-{stat.st_mtime_ns:x}{"-" + encoding if encoding else ""}"'
+            # Only the part of the path inside the served folder can carry a fingerprint
+            rel_path = os.path.relpath(path, self.directory).replace(os.sep, '/')
+            cache_control = IMMUTABLE_CACHE if FINGERPRINT_PATTERN.search(rel_path) else REVALIDATE_CACHE
+            has_siblings = any(os.path.exists(path + suffix) for suffix in ENCODINGS.values())
+
+            if self.is_not_modified(etag, stat.st_mtime):
+                self.send_response(HTTPStatus.NOT_MODIFIED)
+                self.send_header("ETag", etag)
+                self.send_header("Cache-Control", cache_control)
+                if has_siblings:
+                    self.send_header("Vary", "Accept-Encoding")
+                self.send_header("Content-Length", "0")
+                self.end_headers()
+                f.close()
+                return None
+
+            size = stat.st_size
+            self.range = (0, size - 1)
+            # If-Range: only honour the range if the client still has this version
+            if range_header and self.headers.get('If-Range', etag) == etag:
+                self.range = parse_range(range_header, size)
+                if self.range is None:
+                    self.send_response(HTTPStatus.REQUESTED_RANGE_NOT_SATISFIABLE)
+                    self.send_header("Content-Range", f"bytes */{size}")
+                    self.send_header("Content-Length", "0")
+                    self.end_headers()
+                    f.close()
+                    return None
+                self.send_response(HTTPStatus.PARTIAL_CONTENT)
+                self.send_header("Content-Range", f"bytes {self.range[0]}-{self.range[1]}/{size}")
+            else:
+                self.send_response(HTTPStatus.OK)
+
+            self.send_header("Content-Type", self.guess_type(path))
+            if encoding:
+                self.send_header("Content-Encoding", encoding)
+            if has_siblings:
+                self.send_header("Vary", "Accept-Encoding")
+            self.send_header("Content-Length", str(self.range[1] - self.range[0] + 1))
+            self.send_header("Accept-Ranges", "bytes")
+            self.send_header("ETag", etag)
+            self.send_header("Last-Modified", self.date_time_string(stat.st_mtime))
+            self.send_header("Cache-Control", cache_control)
+            self.end_headers()
+            return f
+        except Exception:
+            f.close()
+            raise
+
+    def choose_encoding(self, path):
+        """Return (Content-Encoding, file to send) for the best sibling the client accepts.
+
+        A sibling older than its original (left by an earlier build) is never sent.
+        """
+        accepted = parse_accept_encoding(self.headers.get('Accept-Encoding'))
+        for encoding, suffix in ENCODINGS.items():
+            if accepted.get(encoding, accepted.get('*', 0)) > 0 and is_fresh(path, path + suffix):
+                return encoding, path + suffix
+        return None, path
+
+    def is_not_modified(self, etag: str, mtime: float) -> bool:
+        """Evaluate If-None-Match, falling back to If-Modified-Since."""
+        if_none_match = self.headers.get('If-None-Match')
+        if if_none_match is not None:
+            tags = [tag.strip() for tag in if_none_match.split(',')]
+            return '*' in tags or etag in tags or f"W/{etag}" in tags
+        if_modified_since = self.headers.get('If-Modified-Since')
+        if if_modified_since:
+            try:
+                since = email.utils.parsedate_to_datetime(if_modified_since)
+            except (TypeError, ValueError, IndexError, OverflowError):
+                return False
+            return since is not None and int(mtime) <= since.timestamp()
+        return False
+
+    def copy_range(self, f):
+        """Send the selected byte range of f, or all of it when no range was selected."""
+        if self.range is None:
+            shutil.copyfileobj(f, self.wfile, 1024 * 1024)
+            return
+        start, end = self.range
+        f.seek(start)
+        remaining = end - start + 1
+        while remaining > 0:
+            chunk = f.read(min(remaining, 1024 * 1024))
+            if not chunk:
+                break
+            self.wfile.write(chunk)
+            remaining -= len(chunk)
+
+
+class PooledHTTPServer(HTTPServer):
+    """An HTTPServer that handles each connection on a fixed-size thread pool."""
+
+    def __init__(self, server_address, handler_class, workers: int = 32):
+        super().__init__(server_address, handler_class)
+        self.pool = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="sci-ux-http")
+
+    def process_request(self, request, client_address):
+        self.pool.submit(self.process_request_thread, request, client_address)
+
+    def process_request_thread(self, request, client_address):
+        try:
+            self.finish_request(request, client_address)
+        except Exception:
+            self.handle_error(request, client_address)
+        finally:
+            self.shutdown_request(request)
+
+    def server_close(self):
+        super().server_close()
+        self.pool.shutdown(wait=False, cancel_futures=True)
+
+
+class LiveReload:
+    """Broadcasts server-sent events to every page connected to LIVE_RELOAD_PATH."""
+
+    def __init__(self):
+        self._clients = set()
+        self._lock = threading.Lock()
+
+    def publish(self, event: str, data: str = ""):
+        """Send an event to every connected page."""
+        with self._lock:
+            for client in self._clients:
+                client.put((event, data))
+
+    def subscribe(self) -> queue.Queue:
+        client = queue.Queue()
+        with self._lock:
+            self._clients.add(client)
+        return client
+
+    def unsubscribe(self, client: queue.Queue):
+        with self._lock:
+            self._clients.discard(client)
+
+    def close(self):
+        """End every event stream so its worker thread is released."""
+        self.publish(None)
+
+
+class LiveReloadRequestHandler(StaticRequestHandler):
+    """StaticRequestHandler that also streams LiveReload events to the page."""
+
+    # Comment lines sent while idle, so dead connections are noticed
+    keepalive_interval = 15
+
+    def __init__(self, *args, live_reload: LiveReload = None, **kwargs):
+        self.live_reload = live_reload
+        super().__init__(*args, **kwargs)
+
+    def do_GET(self):
+        if self.path.split('?', 1)[0] == LIVE_RELOAD_PATH and self.live_reload is not None:
+            self.stream_events()
+        else:
+            super().do_GET()
+
+    def stream_events(self):
+        self.send_response(HTTPStatus.OK)
+        self.send_header("Content-Type", "text/event-stream")
+        self.send_header("Cache-Control", "no-cache")
+        self.end_headers()
+        # The stream has no length, so the connection ends with it
+        self.close_connection = True
+
+        client = self.live_reload.subscribe()
+        try:
+            while True:
+                try:
+                    event, data = client.get(timeout=self.keepalive_interval)
+                except queue.Empty:
+                    message = ": keep-alive\n\n"
+                else:
+                    if event is None:
+                        return
+                    message = f"event: {event}\ndata: {data}\n\n"
+                self.wfile.write(message.encode('utf-8'))
+                self.wfile.flush()
+        except (BrokenPipeError, ConnectionResetError):
+            pass
+        finally:
+            self.live_reload.unsubscribe(client)
+
+
+def make_server(directory: str = "output", host: str = "127.0.0.1", port: int = 8000, workers: int = 32,
+                live_reload: LiveReload = None) -> PooledHTTPServer:
+    """Create a server for directory; with live_reload it also serves the event stream."""
+    if live_reload is not None:
+        handler = partial(LiveReloadRequestHandler, directory=directory, live_reload=live_reload)
+    else:
+        handler = partial(StaticRequestHandler, directory=directory)
+    return PooledHTTPServer((host, port), handler, workers)
+
+
+def serve(directory: str = "output", host: str = "127.0.0.1", port: int = 8000, workers: int = 32):
+    """Serve directory until interrupted."""
+    with make_server(directory, host, port, workers) as server:
+        print(f"Serving {directory} at http://{host}:{server.server_port}/ ({workers} worker threads)")
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            print("\nStopping server")
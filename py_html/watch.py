@@ -0,0 +1,65 @@
+"""Polling file watcher used by build.py --watch (standard library only)."""
+import os
+
+from .dependencies import BUILD_ONLY_MODULES
+from .environment import BUNDLE_IMPORTER
+
+
+def snapshot(folders) -> dict:
+    """Return {path: (mtime_ns, size)} for every file under the given folders."""
+    files = {}
+    for folder in folders:
+        if not os.path.exists(folder):
+            continue
+        for root, dirs, names in os.walk(folder):
+            dirs[:] = [d for d in dirs if d != '__pycache__' and not d.startswith('.')]
+            for name in names:
+                if name.endswith('.pyc') or name.startswith('.'):
+                    continue
+                path = os.path.join(root, name)
+                try:
+                    stat = os.stat(path)
+                except OSError:
+                    continue
+                files[path.replace(os.sep, '/')] = (stat.st_mtime_ns, stat.st_size)
+    return files
+
+
+def changed_files(before: dict, after: dict) -> list:
+    """Return the sorted paths that were added, removed or modified between two snapshots."""
+    return sorted(path for path in before.keys() | after.keys() if before.get(path) != after.get(path))
+
+
+def module_name(path: str, scripts_folder: str = "scripts"):
+    """Return the name a Python file is imported as in Pyodide, or None if it is not app code."""
+    path = path.replace(os.sep, '/')
+    if not path.endswith('.py') or path in BUILD_ONLY_MODULES:
+        return None
+    scripts_prefix = scripts_folder.rstrip('/') + '/'
+    if path.startswith(scripts_prefix):
+        # Modules in the scripts folder are imported as top-level modules
+        rel = path[len(scripts_prefix):]
+    elif path.startswith(('py_html/', 'py_dom/')):
+        rel = path
+    else:
+        return None
+    parts = rel[:-3].split('/')
+    if parts[-1] == '__init__':
+        parts.pop()
+    return '.'.join(parts) or None
+
+
+def hot_swappable_modules(paths, scripts_folder: str = "scripts", entry_module: str = "main"):
+    """Return the module names to reload in the running page, or None if the page must reload.
+
+    Only edits to existing app modules can be swapped in; anything else (new or
+    deleted files, the entry point, the bundle importer, build scripts,
+    non-Python assets) needs a full rebuild and reload.
+    """
+    names = []
+    for path in paths:
+        name = module_name(path, scripts_folder)
+        if name is None or name == entry_module or path == BUNDLE_IMPORTER or not os.path.exists(path):
+            return None
+        names.append(name)
+    return names
@@ -8,16 +8,15 @@ Demonstrates the file explorer applet integrated with the main application.
 import js
 from py_html.elements import *
 from py_html.css import CSS
-from py_dom import events, on_click
+from py_dom.lifecycle import on_mount, on_unmount
 from ui.applets.file_explorer import create_file_explorer
 
+# One explorer serves every visit; it is set up when its element is mounted
+explorer = create_file_explorer("main-file-explorer")
+
 
 def create_file_explorer_demo_content():
     """Create the file explorer demo page content."""
-    
-    explorer = create_file_explorer("main-file-explorer")
-    js.window.sci_ux_file_explorer = explorer
-    print("Created new file explorer instance in create_content")  # Debug
 
     return Div(class_="app-container").add(
         # Page header
@@ -83,33 +82,26 @@ def create_file_explorer_demo_content():
     )
 
 
-def setup_file_explorer_demo_handlers():
-    """Set up event handlers for the file explorer demo page."""
+def mount_file_explorer(element):
+    """Set up the explorer each time its element enters the page."""
+    # Add styles to page if not already present
+    if not js.document.getElementById('file-explorer-styles'):
+        styles = explorer.get_styles()
+        style_content = "\n".join(str(style) for style in styles)
+        style_element = f'<style id="file-explorer-styles">{style_content}</style>'
+        js.document.head.insertAdjacentHTML('beforeend', style_element)
     
-    # Get the file explorer instance and set up its handlers
-    explorer_element = js.document.getElementById("main-file-explorer")
-    if explorer_element:
-        # Use the same persistence logic as create_file_explorer_demo_content
-        if hasattr(js.window, 'sci_ux_file_explorer') and js.window.sci_ux_file_explorer is not None:
-            explorer = js.window.sci_ux_file_explorer
-            print("Using existing file explorer instance for handlers")  # Debug
-        else:
-            # Fallback - create new instance if somehow not found
-            from ui.applets.file_explorer import FileExplorer
-            explorer = FileExplorer("main-file-explorer")
-            js.window.sci_ux_file_explorer = explorer
-            print("Created fallback file explorer instance")  # Debug
-        
-        # Add styles to page if not already present
-        if not js.document.getElementById('file-explorer-styles'):
-            styles = explorer.get_styles()
-            style_content = "\n".join(str(style) for style in styles)
-            style_element = f'<style id="file-explorer-styles">{style_content}</style>'
-            js.document.head.insertAdjacentHTML('beforeend', style_element)
-        
-        # Always setup event handlers to ensure they work after navigation
-        explorer.setup_event_handlers()
-        print("Event handlers set up for file explorer")  # Debug
+    explorer.setup_event_handlers()
+    print("Event handlers set up for file explorer")  # Debug
+
+
+def unmount_file_explorer(element):
+    """Release the explorer's bindings and listeners once it left the page."""
+    explorer.unmount()
+
+
+on_mount("#main-file-explorer", mount_file_explorer)
+on_unmount("#main-file-explorer", unmount_file_explorer)
 
 
 def get_file_explorer_demo_styles():
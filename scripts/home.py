@@ -7,6 +7,7 @@ from py_html.macros.forms import *
 from py_html.macros.ui import *
 from py_html.css import CSS
 from py_dom import events, on_click, on_escape
+from py_dom.aio import mounted
 import include
 
 def create_home_content():
@@ -231,26 +232,41 @@ form.add_validation("email", "required|email")
         style_element = f'<style id="modal-styles">{style_content}</style>'
         js.document.head.insertAdjacentHTML('beforeend', style_element)
     js.document.body.insertAdjacentHTML('beforeend', str(modal))
-    # Use a small delay to ensure modal DOM is ready
-    from pyodide.ffi import create_proxy
-    setup_handler_proxy = create_proxy(setup_modal_handlers)
-    js.setTimeout(setup_handler_proxy, 10)
+    # Wire up the modal once it is in the DOM
+    events.run(setup_modal_when_mounted())
+
+# Listeners of the open feature modal; released when it closes
+modal_events = None
+
+def close_feature_modal():
+    """Remove the feature modal and its listeners."""
+    modal = js.document.getElementById('feature-modal')
+    if modal:
+        modal.remove()
+    if modal_events:
+        modal_events.clear_all()
+
+async def setup_modal_when_mounted():
+    await mounted('#feature-modal')
+    setup_modal_handlers()
 
 def setup_modal_handlers():
+    global modal_events
 
     def close_modal(event):
-        modal = js.document.getElementById('feature-modal')
-        if modal:
-            modal.remove()
+        close_feature_modal()
     
     def handle_overlay_click(event):
         if event.target.id == 'feature-modal':
             close_modal(event)
     
-    # Add event listeners using py_dom
-    on_click('modal-close-btn', close_modal)
-    on_click('modal-got-it-btn', close_modal)
-    events.add_listener('feature-modal', 'click', handle_overlay_click)
+    # The modal's listeners live in a scope of the page's group
+    if modal_events:
+        modal_events.clear_all()
+    modal_events = events.scope()
+    modal_events.add_listener('modal-close-btn', 'click', close_modal)
+    modal_events.add_listener('modal-got-it-btn', 'click', close_modal)
+    modal_events.add_listener('feature-modal', 'click', handle_overlay_click)
 
 def setup_home_event_handlers():
     """Set up event handlers specific to the home page."""
@@ -273,12 +289,10 @@ def setup_home_event_handlers():
     setup_global_modal_handlers()
 
 def setup_global_modal_handlers():
-    """Set up global modal handlers that persist across page navigations."""
+    """Set up the escape key handler that closes the feature modal while the home page is open."""
     
     def handle_escape_key_global(event):
-        modal = js.document.getElementById('feature-modal')
-        if modal:
-            modal.remove()
+        close_feature_modal()
     
     # Remove any existing global escape handler
     events.remove_document_listener('keydown')
@@ -2,12 +2,11 @@
 import js
 from py_html.elements import *
 from py_html.css import CSS
-from pyodide.ffi import create_proxy
+from py_dom.router import Router, Route, lazy_import
+from py_dom.events import events, delegate, counted_proxy
+from py_dom.aio import mounted
+from py_dom.hot import on_reload
 from sci_ux_components import NavItem, navbar, get_navbar_css
-from home import create_home_content, setup_home_event_handlers
-from about import create_about_content
-from file_explorer_demo import create_file_explorer_demo_content, setup_file_explorer_demo_handlers
-from text_editor_demo import create_text_editor_demo_content, setup_text_editor_demo_handlers
 
 def create_styles():
     # Include navbar styles
@@ -116,9 +115,7 @@ def render_page_content(page_content):
         # Render to DOM
         html_content = str(full_content)
         js.document.body.innerHTML = html_content
-        
-        # Re-setup event handlers after page change (but skip navigation handlers)
-        setup_page_specific_event_handlers()
+        # Navigation links need no re-setup: their click handler is delegated
             
     except Exception as e:
         print(f"Error rendering page: {e}")
@@ -129,55 +126,45 @@ def render_page_content(page_content):
             P(f"Error: {e}", style="color: red;")
         ))
 
+def render_route(page_content, setup=None):
+    """Render a page and run its setup function once the DOM is ready."""
+    render_page_content(page_content)
+    if setup:
+        # Set up page-specific event handlers as soon as the page is in the DOM
+        events.run(setup_when_mounted(setup))
+
+
+async def setup_when_mounted(setup):
+    """Run a page's setup function once its content is in the document."""
+    await mounted(".app-container")
+    setup()
+
+
+def create_loading_content(packages):
+    """Placeholder shown while the Pyodide packages a page needs are downloaded."""
+    return Div(class_="app-container").add(
+        Div(class_="card").add(P(f"Loading {', '.join(packages)}..."))
+    )
+
+
+# Page modules are only imported the first time their route is visited
+router = Router(render_route, loading=create_loading_content)
+router.add(Route("home", lazy_import("home"), "create_home_content", "setup_home_event_handlers"))
+router.add(Route("about", lazy_import("about"), "create_about_content"))
+# The file explorer sets itself up through its mount hook (py_dom.lifecycle)
+router.add(Route("file-explorer", lazy_import("file_explorer_demo"), "create_file_explorer_demo_content"))
+router.add(Route("text-editor", lazy_import("text_editor_demo"),
+                 "create_text_editor_demo_content", "setup_text_editor_demo_handlers",
+                 aliases=["text-editor-open"]))
+
+# In watch mode (build.py --watch) edited page modules are swapped in; show the new version
+on_reload(lambda: router.navigate(router.current or "home"))
+
+
 def render_home():
     """Render the home page content."""
-    home_content = create_home_content()
-    render_page_content(home_content)
-    # Set up home-specific event handlers with a small delay to ensure DOM is ready
-    home_handler_proxy = create_proxy(setup_home_event_handlers)
-    js.setTimeout(home_handler_proxy, 50)
-
-def render_about():
-    """Render the about page content."""
-    about_content = create_about_content()
-    render_page_content(about_content)
-
-def render_file_explorer():
-    """Render the file explorer demo page content."""
-    fe_content = create_file_explorer_demo_content()
-    render_page_content(fe_content)
-    # Set up file explorer specific event handlers with a small delay
-    fe_handler_proxy = create_proxy(setup_file_explorer_demo_handlers)
-    js.setTimeout(fe_handler_proxy, 50)
-
-def render_text_editor():
-    """Render the text editor demo page content."""
-    te_content = create_text_editor_demo_content()
-    render_page_content(te_content)
-    # Set up text editor specific event handlers with a small delay
-    te_handler_proxy = create_proxy(setup_text_editor_demo_handlers)
-    js.setTimeout(te_handler_proxy, 50)
-
-
-def setup_page_specific_event_handlers():
-    """Setup event handlers that need to be re-attached after page changes."""
-    
-    def handle_nav_click(event):
-        if event.target.classList.contains('spa-link'):
-            event.preventDefault()
-            page = event.target.getAttribute('data-page')
-            # Use the globally stored navigate function
-            if hasattr(js.window, 'sci_ux_navigate'):
-                js.window.sci_ux_navigate(page)
-    
-    # Re-attach handlers to .spa-link elements that were just created
-    nav_handler = create_proxy(handle_nav_click)
-    nav_links = js.document.querySelectorAll('.spa-link')
-    for link in nav_links:
-        link.addEventListener('click', nav_handler)
-    
-    if nav_links.length > 0:
-        print(f"Attached navigation handlers to {nav_links.length} spa-links")  # Debug
+    router.navigate("home")
+
 
 def setup_global_navigation_handlers():
     """Setup navigation handlers that only need to be attached once."""
@@ -197,25 +184,21 @@ def setup_global_navigation_handlers():
     def navigate_to_page(page):
         """Navigate to a specific page."""
         print(f"Navigating to: {page}")  # Debug
-        if page == 'home':
-            render_home()
-        elif page == 'about':
-            render_about()
-        elif page == 'file-explorer':
-            render_file_explorer()
-        elif page == 'text-editor' or page == 'text-editor-open':
-            render_text_editor()
+        router.navigate(page)
+    
+    def handle_nav_click(event, link):
+        event.preventDefault()
+        navigate_to_page(link.getAttribute('data-page'))
     
-    # Create proxies
-    hash_handler = create_proxy(handle_hash_change)
-    custom_nav_handler = create_proxy(handle_custom_navigation)
+    # One document-level listener serves the .spa-link elements of every render
+    delegate('click', '.spa-link', handle_nav_click)
     
     # Set up hash change handler
-    js.window.addEventListener('hashchange', hash_handler)
+    js.window.addEventListener('hashchange', counted_proxy(handle_hash_change))
     
     # Set up custom navigation handler (only if not already set up)
     if not hasattr(js.window, '_sci_ux_nav_handler_attached'):
-        js.window.addEventListener('sci-ux-navigate', custom_nav_handler)
+        js.window.addEventListener('sci-ux-navigate', counted_proxy(handle_custom_navigation))
         js.window._sci_ux_nav_handler_attached = True
         print("Global navigation handler attached")  # Debug
     else:
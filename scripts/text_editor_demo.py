@@ -6,19 +6,20 @@ Demonstrates the text editor applet with syntax highlighting capabilities.
 """
 
 import js
-from pyodide.ffi import create_proxy
 from py_html.elements import *
 from py_html.css import CSS
-from py_dom import events, on_click
+from py_dom import delegate
+from py_dom.lifecycle import on_mount, on_unmount
 from ui.applets.text_editor import create_text_editor
 
+# One editor serves every visit; it is set up when its element is mounted
+# and releases CodeMirror when the element is removed
+editor = create_text_editor("main-text-editor")
+
 
 def create_text_editor_demo_content():
     """Create the text editor demo page content."""
     
-    # Create text editor instance
-    editor = create_text_editor("main-text-editor")
-    
     return Div(class_="app-container").add(
         # Page header
         Div(class_="hero", style="margin-bottom: 30px;").add(
@@ -179,67 +180,59 @@ def create_text_editor_demo_content():
     )
 
 
+def mount_text_editor(element):
+    """Set up the editor each time its element enters the page."""
+    # Add styles to page if not already present
+    if not js.document.getElementById('text-editor-styles'):
+        styles = editor.get_styles()
+        style_content = "\n".join(str(style) for style in styles)
+        style_element = f'<style id="text-editor-styles">{style_content}</style>'
+        js.document.head.insertAdjacentHTML('beforeend', style_element)
+    
+    # Creates the CodeMirror instance and binds the status bar
+    editor.setup_event_handlers()
+    print("Event handlers set up for text editor")  # Debug
+    
+    # Check if a file is being opened from file explorer
+    if hasattr(js.window, 'sci_ux_file_data') and js.window.sci_ux_file_data:
+        file_data = js.window.sci_ux_file_data
+        print(f"Loading file: {file_data}")  # Debug
+        editor.set_content(file_data['content'], file_data['name'])
+        # Clear the file data
+        js.window.sci_ux_file_data = None
+
+
+def unmount_text_editor(element):
+    """Release the editor's CodeMirror instance and handlers once it left the page."""
+    editor.unmount()
+
+
+on_mount("#main-text-editor", mount_text_editor)
+on_unmount("#main-text-editor", unmount_text_editor)
+
+
 def setup_text_editor_demo_handlers():
     """Set up event handlers for the text editor demo page."""
     
-    # Get the text editor instance and set up its handlers
-    editor_element = js.document.getElementById("main-text-editor")
-    if editor_element:
-        # Check if we already have a text editor instance
-        if not hasattr(js.window, 'sci_ux_text_editor') or js.window.sci_ux_text_editor is None:
-            # Create a new instance to set up handlers
-            from ui.applets.text_editor import TextEditor
-            editor = TextEditor("main-text-editor")
-            js.window.sci_ux_text_editor = editor
-            print("Created new text editor instance")  # Debug
-        else:
-            editor = js.window.sci_ux_text_editor
-            print("Reusing existing text editor instance")  # Debug
-        
-        # Add styles to page if not already present
-        if not js.document.getElementById('text-editor-styles'):
-            styles = editor.get_styles()
-            style_content = "\n".join(str(style) for style in styles)
-            style_element = f'<style id="text-editor-styles">{style_content}</style>'
-            js.document.head.insertAdjacentHTML('beforeend', style_element)
-        
-        # Always setup event handlers to ensure they work after navigation
-        # This will check if CodeMirror DOM element exists and recreate if needed
-        editor.setup_event_handlers()
-        print("Event handlers set up for text editor")  # Debug
-        
-        # Check if a file is being opened from file explorer
-        if hasattr(js.window, 'sci_ux_file_data') and js.window.sci_ux_file_data:
-            file_data = js.window.sci_ux_file_data
-            print(f"Loading file: {file_data}")  # Debug
-            editor.set_content(file_data['content'], file_data['name'])
-            # Clear the file data
-            js.window.sci_ux_file_data = None
+    # Setup sample code click handlers
+    def handle_sample_click(event, card):
+        sample_type = card.getAttribute('data-type')
+        sample_code = card.querySelector('code').textContent
         
-        # Setup sample code click handlers
-        def handle_sample_click(event):
-            card = event.target.closest('.sample-card')
-            if card:
-                sample_type = card.getAttribute('data-type')
-                sample_code = card.querySelector('code').textContent
-                
-                # Set content in editor
-                editor.set_content(sample_code, f"sample.{get_extension_for_type(sample_type)}")
-        
-        def get_extension_for_type(sample_type):
-            extensions = {
-                'python': 'py',
-                'javascript': 'js', 
-                'html': 'html',
-                'json': 'json'
-            }
-            return extensions.get(sample_type, 'txt')
-        
-        # Add click handlers to sample cards
-        sample_cards = js.document.querySelectorAll('.sample-card')
-        for card in sample_cards:
-            click_proxy = create_proxy(handle_sample_click)
-            card.addEventListener('click', click_proxy)
+        # Set content in editor
+        editor.set_content(sample_code, f"sample.{get_extension_for_type(sample_type)}")
+    
+    def get_extension_for_type(sample_type):
+        extensions = {
+            'python': 'py',
+            'javascript': 'js', 
+            'html': 'html',
+            'json': 'json'
+        }
+        return extensions.get(sample_type, 'txt')
+    
+    # One delegated handler serves every sample card
+    delegate('click', '.sample-card', handle_sample_click)
 
 
 def get_text_editor_demo_styles():
@@ -7,10 +7,12 @@ create, rename, and delete files in a virtual file system using Pyodide.
 """
 
 import js
-from pyodide.ffi import create_proxy
 from py_html.elements import *
 from py_html.css import CSS
 from py_dom import events, on_click
+from py_dom.refs import Refs
+from py_dom.signals import Signal, bind
+from py_dom.aio import animation_frame
 from typing import Dict, List, Optional
 from datetime import datetime
 import json
@@ -266,8 +268,19 @@ class FileExplorer:
     def __init__(self, container_id: str = "file-explorer"):
         self.container_id = container_id
         self.fs = VirtualFileSystem()
-        self.selected_item = None
+        self._selected_item = Signal(None)  # The Delete button follows it (see setup_event_handlers)
+        self._delete_binding = None
+        self._list_events = None  # Listeners of the file list container
+        self.refs = Refs(container_id)  # Elements declared with ref=, looked up once per render
         print(f"Created FileExplorer instance with ID: {container_id}")  # Debug
+    
+    @property
+    def selected_item(self):
+        return self._selected_item.value
+    
+    @selected_item.setter
+    def selected_item(self, value):
+        self._selected_item.value = value
         
     def get_file_icon(self, item: FileSystemItem) -> str:
         """Get appropriate icon for file type."""
@@ -302,11 +315,11 @@ class FileExplorer:
         return Div(class_="fe-toolbar").add(
             Button("+ New Folder", class_="fe-btn fe-btn-new-folder", id="fe-new-folder"),
             Button("+ New File", class_="fe-btn fe-btn-new-file", id="fe-new-file"),
-            Button("Delete", class_="fe-btn fe-btn-delete", id="fe-delete", disabled=True),
+            Button("Delete", class_="fe-btn fe-btn-delete", id="fe-delete", ref="delete", disabled=True),
             Button("Up", class_="fe-btn fe-btn-up", id="fe-up"),
             Button("Reset", class_="fe-btn fe-btn-reset", id="fe-reset", 
                    style="background: #dc3545; color: white; margin-left: 10px;"),
-            Span(class_="fe-path-display", id="fe-path", content=self.fs.get_path_string())
+            Span(class_="fe-path-display", id="fe-path", ref="path", content=self.fs.get_path_string())
         )
     
     def create_file_item_row(self, item: FileSystemItem) -> Tr:
@@ -339,7 +352,7 @@ class FileExplorer:
                     Th("Modified")
                 )
             ),
-            Tbody(id="fe-file-list").add(
+            Tbody(id="fe-file-list", ref="file-list").add(
                 *[self.create_file_item_row(item) for item in sorted_items]
             )
         )
@@ -511,7 +524,7 @@ class FileExplorer:
     
     def refresh_file_list(self):
         """Refresh the file list display."""
-        file_list = js.document.getElementById("fe-file-list")
+        file_list = self.refs.get("file-list")
         if file_list:
             # Clear current list
             file_list.innerHTML = ""
@@ -525,7 +538,7 @@ class FileExplorer:
                 file_list.insertAdjacentHTML('beforeend', row_html)
         
         # Update path display
-        path_display = js.document.getElementById("fe-path")
+        path_display = self.refs.get("path")
         if path_display:
             path_display.textContent = self.fs.get_path_string()
         
@@ -540,16 +553,27 @@ class FileExplorer:
         for row in selected_rows:
             row.classList.remove('selected')
         
+        # Disables the delete button through its binding
         self.selected_item = None
-        
-        # Update delete button state
-        delete_btn = js.document.getElementById("fe-delete")
-        if delete_btn:
-            delete_btn.disabled = True
+    
+    def unmount(self):
+        """Release the bindings, list listeners and element handles once the explorer left the page."""
+        if self._delete_binding:
+            self._delete_binding.dispose()
+            self._delete_binding = None
+        if self._list_events:
+            self._list_events.clear_all()
+            self._list_events = None
+        self.refs.dispose()
     
     def setup_event_handlers(self):
         """Setup all event handlers for the file explorer."""
         
+        # Delete is only enabled while an item is selected
+        if self._delete_binding:
+            self._delete_binding.dispose()
+        self._delete_binding = bind(lambda: self.refs.get("delete"), "disabled", lambda: self.selected_item is None)
+        
         def handle_new_folder(event):
             name = js.prompt("Enter folder name:")
             if name and name.strip():
@@ -603,12 +627,9 @@ class FileExplorer:
         """Setup event handlers for file list items using delegation."""
         
         # Remove existing handlers first to prevent duplicates
-        if hasattr(self, '_handlers_attached'):
-            table_container = js.document.querySelector(f"#{self.container_id} .fe-file-list-container")
-            if table_container and hasattr(self, '_click_proxy'):
-                table_container.removeEventListener('click', self._click_proxy)
-                table_container.removeEventListener('dblclick', self._dblclick_proxy)
-                table_container.removeEventListener('contextmenu', self._contextmenu_proxy)
+        if self._list_events:
+            self._list_events.clear_all()
+        self._list_events = events.scope()
         
         def handle_table_click(event):
             # Find the closest row
@@ -622,11 +643,6 @@ class FileExplorer:
             # Select the row
             row.classList.add('selected')
             self.selected_item = row.getAttribute('data-name')
-            
-            # Enable delete button
-            delete_btn = js.document.getElementById("fe-delete")
-            if delete_btn:
-                delete_btn.disabled = False
         
         def handle_table_double_click(event):
             # Prevent event bubbling and default behavior
@@ -676,16 +692,16 @@ class FileExplorer:
                         # We'll use a custom event to trigger navigation
                         print(f"Dispatching navigation event for file: {item_name}")  # Debug
                         
-                        # Use setTimeout to ensure file data is properly set before navigation
-                        def delayed_navigation():
+                        # Navigate after this handler returns, on the next frame
+                        async def delayed_navigation():
+                            await animation_frame()
                             nav_event = js.CustomEvent.new('sci-ux-navigate', {
                                 'detail': {'page': 'text-editor-open'}
                             })
                             js.window.dispatchEvent(nav_event)
                             print("Navigation event dispatched (delayed)")  # Debug
                         
-                        nav_proxy = create_proxy(delayed_navigation)
-                        js.setTimeout(nav_proxy, 50)  # 50ms delay
+                        events.run(delayed_navigation())
                     else:
                         js.alert(f"Could not open file: {item_name}")
                 except Exception as e:
@@ -700,17 +716,9 @@ class FileExplorer:
         # Use delegation - attach to the table container instead of individual rows
         table_container = js.document.querySelector(f"#{self.container_id} .fe-file-list-container")
         if table_container:
-            # Store proxy references for cleanup
-            self._click_proxy = create_proxy(handle_table_click)
-            self._dblclick_proxy = create_proxy(handle_table_double_click)
-            self._contextmenu_proxy = create_proxy(handle_table_context_menu)
-            
-            table_container.addEventListener('click', self._click_proxy)
-            table_container.addEventListener('dblclick', self._dblclick_proxy)
-            table_container.addEventListener('contextmenu', self._contextmenu_proxy)
-            
-            # Mark that handlers are attached
-            self._handlers_attached = True
+            self._list_events.add_target_listener(table_container, 'click', handle_table_click)
+            self._list_events.add_target_listener(table_container, 'dblclick', handle_table_double_click)
+            self._list_events.add_target_listener(table_container, 'contextmenu', handle_table_context_menu)
             print("File list handlers attached using delegation")  # Debug
         else:
             print(f"Warning: Could not find table container for {self.container_id}")  # Debug
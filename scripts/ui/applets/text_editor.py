@@ -8,10 +8,16 @@ in scientific computing.
 """
 
 import js
-from pyodide.ffi import create_proxy
+import asyncio
 from py_html.elements import *
 from py_html.css import CSS
-from py_dom import events, on_click
+from py_dom import events
+from py_dom.assets import load_script, load_stylesheet, asset_url
+from py_dom.events import counted_proxy, destroy_proxy
+from py_dom.scheduler import read, write
+from py_dom.timing import debounce, throttle
+from py_dom.refs import Refs
+from py_dom.signals import Signal, bind, bind_text
 from typing import Dict, List, Optional
 import json
 
@@ -19,6 +25,33 @@ import json
 class CodeMirrorHelper:
     """Helper class for CodeMirror integration."""
     
+    # CodeMirror is loaded the first time an editor is created, not with the page
+    CORE_STYLES = ['codemirror.min.css', 'theme/default.min.css']
+    CORE_SCRIPT = 'codemirror.min.js'
+    ADDON_SCRIPTS = ['addon/edit/matchbrackets.min.js', 'addon/edit/closebrackets.min.js']
+    
+    # Modes that delegate to other modes need those loaded as well
+    MODE_DEPENDENCIES = {
+        'htmlmixed': ['xml', 'javascript', 'css'],
+        'markdown': ['xml'],
+    }
+    
+    @staticmethod
+    async def ensure_loaded(mode: str = 'text'):
+        """Load the CodeMirror core, addons and the files for mode, each only once."""
+        styles = [load_stylesheet(asset_url('codemirror', path)) for path in CodeMirrorHelper.CORE_STYLES]
+        
+        # Addons and modes register themselves on the CodeMirror global
+        await load_script(asset_url('codemirror', CodeMirrorHelper.CORE_SCRIPT))
+        
+        modes = [] if mode == 'text' else CodeMirrorHelper.MODE_DEPENDENCIES.get(mode, []) + [mode]
+        scripts = [load_script(asset_url('codemirror', path)) for path in CodeMirrorHelper.ADDON_SCRIPTS]
+        scripts += [load_script(asset_url('codemirror', f'mode/{name}/{name}.min.js')) for name in modes]
+        
+        # All requests are already in flight; wait for every one of them
+        for pending in styles + scripts:
+            await pending
+    
     @staticmethod
     def detect_mode(filename: str) -> str:
         """Detect CodeMirror mode from filename."""
@@ -68,25 +101,67 @@ class TextEditor:
     
     def __init__(self, container_id: str = "text-editor"):
         self.container_id = container_id
-        self.current_file = None
-        self.current_mode = 'text'
-        self.is_modified = False
+        # Editor state; the status bar, file name and Save button follow it (see bind_status)
+        self._current_file = Signal(None)
+        self._current_mode = Signal('text')
+        self._is_modified = Signal(False)
+        self._bindings = []
+        self._editor_proxies = {}  # CodeMirror event -> proxy, released by unmount()
         self.content = ""
         self.editor_instance = None
         self.is_saving = False  # Prevent multiple save operations
+        self._loading_codemirror = False
+        self._open_modal = None  # File picker of the last Open
+        self.refs = Refs(container_id)  # Elements declared with ref=, looked up once per render
+    
+    @property
+    def current_file(self):
+        return self._current_file.value
+    
+    @current_file.setter
+    def current_file(self, value):
+        self._current_file.value = value
+    
+    @property
+    def current_mode(self):
+        return self._current_mode.value
+    
+    @current_mode.setter
+    def current_mode(self, value):
+        self._current_mode.value = value
+    
+    @property
+    def is_modified(self):
+        return self._is_modified.value
+    
+    @is_modified.setter
+    def is_modified(self, value):
+        self._is_modified.value = value
+    
+    def bind_status(self):
+        """Bind the status bar, file name and Save button of the rendered editor to its state."""
+        for binding in self._bindings:
+            binding.dispose()
+        self._bindings = [
+            bind_text(lambda: self.refs.get("file-status"), lambda: "●" if self.is_modified else ""),
+            bind_text(lambda: self.refs.get("language-info"),
+                      lambda: CodeMirrorHelper.get_display_name(self.current_mode)),
+            bind_text(lambda: self.refs.get("file-info"), lambda: self.current_file or "Untitled"),
+            bind(lambda: self.refs.get("save"), "disabled", lambda: not (self.is_modified and self.current_file)),
+        ]
         
     def create_toolbar(self) -> Div:
         """Create editor toolbar with file operations."""
         return Div(class_="te-toolbar").add(
             Button("New", class_="te-btn te-btn-new", id="te-new"),
             Button("Open", class_="te-btn te-btn-open", id="te-open"),
-            Button("Save", class_="te-btn te-btn-save", id="te-save", disabled=True),
+            Button("Save", class_="te-btn te-btn-save", id="te-save", ref="save", disabled=True),
             Button("Save As", class_="te-btn te-btn-save-as", id="te-save-as"),
             Div(class_="te-separator"),
             Button("Undo", class_="te-btn te-btn-undo", id="te-undo"),
             Button("Redo", class_="te-btn te-btn-redo", id="te-redo"),
             Div(class_="te-separator"),
-            Select(class_="te-language-select", id="te-language").add(
+            Select(class_="te-language-select", id="te-language", ref="language").add(
                 Option("Auto-detect", value="auto", selected=True),
                 Option("Plain Text", value="text"),
                 Option("Python", value="python"),
@@ -95,21 +170,21 @@ class TextEditor:
                 Option("CSS", value="css"),
                 Option("JSON", value="javascript")
             ),
-            Span(class_="te-file-info", id="te-file-info").add("Untitled")
+            Span(class_="te-file-info", id="te-file-info", ref="file-info").add("Untitled")
         )
     
     def create_editor_area(self) -> Div:
         """Create the main editor area for CodeMirror."""
         return Div(class_="te-editor-container").add(
-            Div(class_="te-editor-wrapper", id="te-editor")
+            Div(class_="te-editor-wrapper", id="te-editor", ref="editor")
         )
     
     def create_status_bar(self) -> Div:
         """Create status bar showing cursor position and file info."""
         return Div(class_="te-status-bar").add(
-            Span(class_="te-cursor-info", id="te-cursor-info").add("Line 1, Column 1"),
-            Span(class_="te-file-status", id="te-file-status").add(""),
-            Span(class_="te-language-info", id="te-language-info").add("Plain Text")
+            Span(class_="te-cursor-info", id="te-cursor-info", ref="cursor-info").add("Line 1, Column 1"),
+            Span(class_="te-file-status", id="te-file-status", ref="file-status").add(""),
+            Span(class_="te-language-info", id="te-language-info", ref="language-info").add("Plain Text")
         )
     
     # Remove this method - we'll use the reusable modal system instead
@@ -237,12 +312,14 @@ class TextEditor:
     def create_codemirror_instance(self):
         """Create CodeMirror instance."""
         try:
-            # Check if CodeMirror is available
+            # Load CodeMirror on first use; this method runs again once it is available
             if not hasattr(js, 'CodeMirror'):
-                print("CodeMirror is not available")
+                if not self._loading_codemirror:
+                    self._loading_codemirror = True
+                    asyncio.ensure_future(self._load_codemirror())
                 return
                 
-            editor_element = js.document.getElementById("te-editor")
+            editor_element = self.refs.get("editor")
             if editor_element and not self.editor_instance:
                 # Clear the element first
                 editor_element.innerHTML = ""
@@ -260,54 +337,68 @@ class TextEditor:
                 }
                 self.editor_instance = js.CodeMirror(editor_element, config)
                 
-                # Set up change handler with create_proxy
+                # Set up change handler with a counted proxy (see py_dom.events.live_proxies)
                 def on_change(cm, change):
-                    self.content = cm.getValue()
+                    # Marks the file modified and enables Save through the bindings
                     self.is_modified = True
-                    self.update_status_bar()
-                    
-                    # Enable save button
-                    save_btn = js.document.getElementById("te-save")
-                    if save_btn and self.current_file:
-                        save_btn.disabled = False
+                    # Copy the text out of CodeMirror once typing pauses, not per keystroke
+                    self._read_content()
                 
-                change_proxy = create_proxy(on_change)
-                self.editor_instance.on("change", change_proxy)
+                self._editor_proxies["change"] = counted_proxy(on_change)
+                self.editor_instance.on("change", self._editor_proxies["change"])
                 
-                # Set up cursor activity handler with create_proxy
+                # Set up cursor activity handler
                 def on_cursor_activity(cm):
                     self.update_cursor_info()
                 
-                cursor_proxy = create_proxy(on_cursor_activity)
-                self.editor_instance.on("cursorActivity", cursor_proxy)
+                self._editor_proxies["cursorActivity"] = counted_proxy(on_cursor_activity)
+                self.editor_instance.on("cursorActivity", self._editor_proxies["cursorActivity"])
                 
                 print(f"CodeMirror instance created with mode: {self.current_mode}")
                 
         except Exception as e:
             print(f"Error creating CodeMirror instance: {e}")
     
+    async def _load_codemirror(self):
+        """Fetch CodeMirror and the current mode, then create the editor."""
+        try:
+            await CodeMirrorHelper.ensure_loaded(self.current_mode)
+        except Exception as e:
+            print(f"Error loading CodeMirror: {e}")
+            return
+        finally:
+            self._loading_codemirror = False
+        self.create_codemirror_instance()
+        # set_mode or set_content may have switched modes while CodeMirror was loading
+        if self.editor_instance:
+            await self._apply_mode(self.current_mode)
+    
+    async def _apply_mode(self, mode: str):
+        """Load the files for mode if needed and switch the editor to it."""
+        try:
+            await CodeMirrorHelper.ensure_loaded(mode)
+        except Exception as e:
+            print(f"Error loading CodeMirror mode {mode}: {e}")
+            return
+        if self.editor_instance and self.current_mode == mode:
+            self.editor_instance.setOption("mode", mode)
+    
+    @throttle(100)
     def update_cursor_info(self):
-        """Update cursor position from CodeMirror."""
+        """Update cursor position from CodeMirror, at most ten times a second."""
+        read(self._read_cursor)
+    
+    def _read_cursor(self):
         if self.editor_instance:
             cursor = self.editor_instance.getCursor()
             line = cursor.line + 1  # CodeMirror lines are 0-indexed
             column = cursor.ch + 1  # CodeMirror columns are 0-indexed
-            
-            cursor_info = js.document.getElementById("te-cursor-info")
-            if cursor_info:
-                cursor_info.textContent = f"Line {line}, Column {column}"
+            write(self.refs.get("cursor-info"), "textContent", f"Line {line}, Column {column}")
     
-    def update_status_bar(self):
-        """Update status bar information."""
-        file_status = js.document.getElementById("te-file-status")
-        language_info = js.document.getElementById("te-language-info")
-        
-        if file_status:
-            status = "●" if self.is_modified else ""
-            file_status.textContent = status
-        
-        if language_info:
-            language_info.textContent = CodeMirrorHelper.get_display_name(self.current_mode)
+    @debounce(250)
+    def _read_content(self):
+        if self.editor_instance:
+            self.content = self.editor_instance.getValue()
     
     def set_content(self, content: str, filename: str = None):
         """Set editor content and update mode."""
@@ -324,28 +415,20 @@ class TextEditor:
             try:
                 print(f"Updating existing CodeMirror with content length: {len(content)}")  # Debug
                 self.editor_instance.setValue(content)
-                self.editor_instance.setOption("mode", self.current_mode)
+                asyncio.ensure_future(self._apply_mode(self.current_mode))
                 print(f"Successfully updated CodeMirror with mode: {self.current_mode}")  # Debug
             except Exception as e:
                 print(f"Error updating CodeMirror content: {e}")
                 # Reset editor instance and try again
-                self.editor_instance = None
+                self._release_editor()
                 self.create_codemirror_instance()
         else:
             # Create CodeMirror instance if it doesn't exist
             print("Creating new CodeMirror instance")  # Debug
             self.create_codemirror_instance()
         
-        # Update displays
-        self.update_status_bar()
-        
-        # Update file info
-        file_info = js.document.getElementById("te-file-info")
-        if file_info:
-            file_info.textContent = filename or "Untitled"
-        
         # Update language select
-        language_select = js.document.getElementById("te-language")
+        language_select = self.refs.get("language")
         if language_select:
             language_select.value = self.current_mode
         
@@ -355,14 +438,40 @@ class TextEditor:
         """Set editor mode."""
         self.current_mode = mode
         if self.editor_instance:
-            self.editor_instance.setOption("mode", mode)
-        self.update_status_bar()
+            asyncio.ensure_future(self._apply_mode(mode))
+    
+    def unmount(self):
+        """Release the CodeMirror instance, its handlers and the bindings once the editor left the page.
+        
+        The editor state (file, mode, modified flag) is kept for the next mount.
+        """
+        for binding in self._bindings:
+            binding.dispose()
+        self._bindings = []
+        self._read_content.flush()
+        self._read_content.cancel()
+        self.update_cursor_info.cancel()
+        self._release_editor()
+        self.refs.dispose()
+        if self._open_modal:
+            self._open_modal.remove()
+            self._open_modal = None
+    
+    def _release_editor(self):
+        """Detach the handlers from the CodeMirror instance, destroy their proxies and drop it."""
+        if self.editor_instance:
+            for event_type, proxy in self._editor_proxies.items():
+                self.editor_instance.off(event_type, proxy)
+        for proxy in self._editor_proxies.values():
+            destroy_proxy(proxy)
+        self._editor_proxies = {}
+        self.editor_instance = None
     
     def setup_event_handlers(self):
         """Setup all event handlers for the text editor."""
         
         # Check if DOM element exists and recreate CodeMirror if needed
-        editor_element = js.document.getElementById("te-editor")
+        editor_element = self.refs.get("editor")
         if not editor_element:
             print("Warning: te-editor DOM element not found")
             return
@@ -370,12 +479,17 @@ class TextEditor:
         # If CodeMirror instance exists but DOM changed, reset it
         if self.editor_instance and not editor_element.querySelector('.CodeMirror'):
             print("DOM changed, resetting CodeMirror instance")
-            self.editor_instance = None
+            # Keep what was typed since the last read before the instance goes
+            self._read_content.flush()
+            self._release_editor()
         
         # Create CodeMirror instance if needed
         if not self.editor_instance:
             self.create_codemirror_instance()
         
+        # The page was rendered from defaults; show this editor's state
+        self.bind_status()
+        
         def handle_language_change(event):
             mode = event.target.value
             if mode == 'auto' and self.current_file:
@@ -396,8 +510,13 @@ class TextEditor:
             try:
                 from ui.modal import create_file_explorer_modal
                 
+                # Replace the modal of the previous Open, listeners included
+                if self._open_modal:
+                    self._open_modal.remove()
+                
                 # Create and show file explorer modal
                 modal = create_file_explorer_modal("te-file-open-modal")
+                self._open_modal = modal
                 
                 # Set up file selection callback
                 def on_file_selected(file_data):
@@ -466,12 +585,6 @@ class TextEditor:
                     print(f"Successfully saved {self.current_file}")  # Debug
                     js.alert(f"Saved {self.current_file}")
                     self.is_modified = False
-                    self.update_status_bar()
-                    
-                    # Disable save button
-                    save_btn = js.document.getElementById("te-save")
-                    if save_btn:
-                        save_btn.disabled = True
                 else:
                     js.alert(f"File not found: {self.current_file}")
                     
@@ -548,23 +661,11 @@ class TextEditor:
                     
                     print(f"Save As completed - current_file set to: {self.current_file}")  # Debug
                     
-                    # Update UI
-                    file_info = js.document.getElementById("te-file-info")
-                    if file_info:
-                        file_info.textContent = filename
-                    
                     # Update language select
-                    language_select = js.document.getElementById("te-language")
+                    language_select = self.refs.get("language")
                     if language_select:
                         language_select.value = self.current_mode
                     
-                    self.update_status_bar()
-                    
-                    # Disable save button
-                    save_btn = js.document.getElementById("te-save")
-                    if save_btn:
-                        save_btn.disabled = True
-                    
                     js.alert(f"Saved as {filename}")
                     
                 except Exception as e:
@@ -573,10 +674,9 @@ class TextEditor:
                     self.is_saving = False  # Reset saving flag
         
         
-        language_select = js.document.getElementById("te-language")
+        language_select = self.refs.get("language")
         if language_select:
-            change_proxy = create_proxy(handle_language_change)
-            language_select.addEventListener('change', change_proxy)
+            events.add_listener("te-language", 'change', handle_language_change)
         
         # Setup toolbar button handlers - use direct event listener attachment
         # to ensure they work after navigation
@@ -592,13 +692,8 @@ class TextEditor:
                 button = js.document.getElementById(button_id)
                 if button:
                     # Remove any existing listeners to prevent duplicates
-                    if hasattr(self, f'_{button_id}_proxy'):
-                        button.removeEventListener('click', getattr(self, f'_{button_id}_proxy'))
-                    
-                    # Create new proxy and attach
-                    proxy = create_proxy(handler)
-                    setattr(self, f'_{button_id}_proxy', proxy)
-                    button.addEventListener('click', proxy)
+                    events.remove_listener(button_id, 'click')
+                    events.add_listener(button_id, 'click', handler)
                     print(f"Attached handler to {button_id}")  # Debug
                 else:
                     print(f"Warning: Button {button_id} not found")  # Debug
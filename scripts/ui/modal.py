@@ -7,10 +7,9 @@ the application for various purposes like file dialogs, confirmations, etc.
 """
 
 import js
-from pyodide.ffi import create_proxy
 from py_html.elements import *
 from py_html.css import CSS
-from py_dom import events, on_click
+from py_dom import events, delegate, undelegate
 from typing import Dict, List, Optional, Callable, Any
 
 
@@ -37,6 +36,8 @@ class Modal:
         self.closeable = closeable
         self.on_close_callback = None
         self.on_confirm_callback = None
+        # Listeners of this modal, cleared when it is removed or the page changes
+        self.events = events.scope()
         
     def set_on_close(self, callback: Callable):
         """Set callback for when modal is closed."""
@@ -106,10 +107,11 @@ class Modal:
             modal_element.style.display = "none"
     
     def remove(self):
-        """Remove the modal from DOM."""
+        """Remove the modal from DOM along with its event listeners."""
         modal_element = js.document.getElementById(self.modal_id)
         if modal_element:
             modal_element.remove()
+        self.events.clear_all()
     
     def setup_handlers(self):
         """Set up event handlers for the modal."""
@@ -131,20 +133,20 @@ class Modal:
         
         # Set up close button handlers
         if self.closeable:
-            on_click(f"{self.modal_id}-close", handle_close)
+            self.events.add_listener(f"{self.modal_id}-close", 'click', handle_close)
         
         # Set up confirm button if it exists
         confirm_btn = js.document.getElementById(f"{self.modal_id}-confirm")
         if confirm_btn:
-            on_click(f"{self.modal_id}-confirm", handle_confirm)
+            self.events.add_listener(f"{self.modal_id}-confirm", 'click', handle_confirm)
         
         # Set up cancel button if it exists
         cancel_btn = js.document.getElementById(f"{self.modal_id}-cancel")
         if cancel_btn:
-            on_click(f"{self.modal_id}-cancel", handle_close)
+            self.events.add_listener(f"{self.modal_id}-cancel", 'click', handle_close)
         
         # Close on overlay click
-        events.add_listener(self.modal_id, 'click', handle_overlay_click)
+        self.events.add_listener(self.modal_id, 'click', handle_overlay_click)
 
 
 class FileExplorerModal(Modal):
@@ -154,6 +156,7 @@ class FileExplorerModal(Modal):
         super().__init__(modal_id, title, size="large")
         self.selected_file = None
         self.on_file_select_callback = None
+        self.explorer = None  # The embedded FileExplorer, unmounted by remove()
     
     def set_on_file_select(self, callback: Callable):
         """Set callback for when a file is selected."""
@@ -164,7 +167,7 @@ class FileExplorerModal(Modal):
         from ui.applets.file_explorer import create_file_explorer
         
         # Create file explorer instance for the modal
-        modal_explorer = create_file_explorer(f"{self.modal_id}-fe")
+        self.explorer = create_file_explorer(f"{self.modal_id}-fe")
         
         # Custom footer buttons for file selection
         footer_buttons = [
@@ -172,16 +175,18 @@ class FileExplorerModal(Modal):
             {"text": "Open Selected", "class": "modal-btn-primary", "id": f"{self.modal_id}-confirm", "disabled": True}
         ]
         
-        return self.render(modal_explorer.render(), footer_buttons)
+        return self.render(self.explorer.render(), footer_buttons)
     
     def setup_file_selection_handlers(self):
         """Set up handlers specific to file selection."""
         # Set up basic modal handlers
         self.setup_handlers()
         
-        # Set up file explorer handlers
-        from ui.applets.file_explorer import FileExplorer
-        explorer = FileExplorer(f"{self.modal_id}-fe")
+        # Set up the handlers of the explorer rendered by create_with_file_explorer
+        from ui.applets.file_explorer import create_file_explorer
+        if self.explorer is None:
+            self.explorer = create_file_explorer(f"{self.modal_id}-fe")
+        explorer = self.explorer
         
         # Add file explorer styles
         if not js.document.getElementById('file-explorer-modal-styles'):
@@ -193,27 +198,25 @@ class FileExplorerModal(Modal):
         explorer.setup_event_handlers()
         
         # Override the file double-click to select instead of navigate
-        def handle_file_selection(event):
-            row = event.target.closest('.fe-item-row')
-            if row:
-                item_name = row.getAttribute('data-name')
-                item_type = row.getAttribute('data-type')
+        def handle_file_selection(event, row):
+            item_name = row.getAttribute('data-name')
+            item_type = row.getAttribute('data-type')
+            
+            if item_type == 'file':
+                # Enable the Open button
+                open_btn = js.document.getElementById(f"{self.modal_id}-confirm")
+                if open_btn:
+                    open_btn.disabled = False
                 
-                if item_type == 'file':
-                    # Enable the Open button
-                    open_btn = js.document.getElementById(f"{self.modal_id}-confirm")
-                    if open_btn:
-                        open_btn.disabled = False
-                    
-                    # Store selected file info
-                    current_dir = explorer.fs.get_current_directory()
-                    file_item = current_dir.get_child(item_name)
-                    if file_item:
-                        self.selected_file = {
-                            'name': item_name,
-                            'content': file_item.content,
-                            'path': explorer.fs.get_path_string() + '/' + item_name if explorer.fs.get_path_string() != '/' else '/' + item_name
-                        }
+                # Store selected file info
+                current_dir = explorer.fs.get_current_directory()
+                file_item = current_dir.get_child(item_name)
+                if file_item:
+                    self.selected_file = {
+                        'name': item_name,
+                        'content': file_item.content,
+                        'path': explorer.fs.get_path_string() + '/' + item_name if explorer.fs.get_path_string() != '/' else '/' + item_name
+                    }
         
         # Override confirm handler to return selected file
         def handle_confirm_with_file(event):
@@ -221,14 +224,20 @@ class FileExplorerModal(Modal):
                 self.on_file_select_callback(self.selected_file)
             self.hide()
         
-        # Set up the overridden confirm handler
-        on_click(f"{self.modal_id}-confirm", handle_confirm_with_file)
+        # Set up the overridden confirm handler in place of the default one
+        self.events.remove_listener(f"{self.modal_id}-confirm", 'click')
+        self.events.add_listener(f"{self.modal_id}-confirm", 'click', handle_confirm_with_file)
         
-        # Add selection handler to file rows
-        file_rows = js.document.querySelectorAll(f"#{self.modal_id}-fe .fe-item-row")
-        for row in file_rows:
-            click_proxy = create_proxy(handle_file_selection)
-            row.addEventListener('click', click_proxy)
+        # One delegated handler serves every file row, including rows rendered after navigating
+        delegate('click', f"#{self.modal_id}-fe .fe-item-row", handle_file_selection)
+    
+    def remove(self):
+        """Remove the modal from DOM along with its event listeners, file row handler and explorer."""
+        super().remove()
+        undelegate('click', f"#{self.modal_id}-fe .fe-item-row")
+        if self.explorer is not None:
+            self.explorer.unmount()
+            self.explorer = None
 
 
 def get_modal_styles() -> List[CSS]:
@@ -0,0 +1,18 @@
+#!/usr/bin/env python3
+import argparse
+from py_html.server import serve
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Serve the built Sci-UX application.")
+    parser.add_argument("directory", nargs="?", default="output",
+                        help="folder to serve (default: output)")
+    parser.add_argument("--host", default="127.0.0.1",
+                        help="address to bind (use 0.0.0.0 to serve a classroom network)")
+    parser.add_argument("--port", type=int, default=8000)
+    parser.add_argument("--workers", type=int, default=32,
+                        help="size of the request thread pool")
+    return parser.parse_args()
+
+if __name__ == "__main__":
+    args = parse_args()
+    serve(args.directory, args.host, args.port, args.workers)